@@ -1,12 +1,26 @@
 from typing import Literal, overload
 
 from asgiref.sync import sync_to_async
+from django.http.request import HttpRequest
 from strawberry.types import Info
 
 from strawberry_django.utils.requests import get_request
 from strawberry_django.utils.typing import UserType
 
 
+def get_request_user(request: HttpRequest) -> UserType | None:
+    """Return the user of the request, without forcing it to be loaded."""
+    try:
+        return request.user
+    except AttributeError:
+        try:
+            # queries/mutations in ASGI move the user into consumer scope
+            return request.consumer.scope["user"]  # type: ignore
+        except AttributeError:
+            # websockets / subscriptions move scope inside of the request
+            return request.scope.get("user")  # type: ignore
+
+
 @overload
 def get_current_user(info: Info, *, strict: Literal[True]) -> UserType: ...
 
@@ -17,18 +31,7 @@ def get_current_user(info: Info, *, strict: bool = False) -> UserType: ...
 
 def get_current_user(info: Info, *, strict: bool = False) -> UserType:
     """Get and return the current user based on various scenarios."""
-    request = get_request(info)
-
-    try:
-        user = request.user
-    except AttributeError:
-        try:
-            # queries/mutations in ASGI move the user into consumer scope
-            user = request.consumer.scope["user"]  # type: ignore
-        except AttributeError:
-            # websockets / subscriptions move scope inside of the request
-            user = request.scope.get("user")  # type: ignore
-
+    user = get_request_user(get_request(info))
     if user is None:
         raise ValueError("No user found in the current request")
 
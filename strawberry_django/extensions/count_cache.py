@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from strawberry.extensions import SchemaExtension
+
+from strawberry_django.pagination import count_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from strawberry.types import ExecutionContext
+
+    from strawberry_django.pagination import CountCache
+
+
+class DjangoCountCacheExtension(SchemaExtension):
+    """Cache the total counts of `OffsetPaginated` and `DjangoListConnection`.
+
+    Counting big tables can be expensive. With this extension, the
+    `totalCount` of paginated fields and connections is retrieved from the
+    given `CountCache` (see `LocMemCountCache` and `DjangoCountCache`), and
+    only counted in the database on cache misses.
+
+    The same cache instance needs to be shared between executions.
+
+    Examples
+    --------
+        Add the following to your schema configuration.
+
+        >>> import functools
+        >>> import strawberry
+        >>> from strawberry_django.extensions.count_cache import DjangoCountCacheExtension
+        >>> from strawberry_django.pagination import LocMemCountCache
+        ...
+        >>> count_cache = LocMemCountCache(timeout=300)
+        >>> schema = strawberry.Schema(
+        ...     Query,
+        ...     extensions=[
+        ...         functools.partial(DjangoCountCacheExtension, cache=count_cache),
+        ...     ]
+        ... )
+
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: CountCache,
+        execution_context: ExecutionContext | None = None,
+    ):
+        super().__init__(execution_context=cast("ExecutionContext", execution_context))
+        self.cache = cache
+
+    def on_execute(self) -> Generator[None]:
+        token = count_cache.set(self.cache)
+        try:
+            yield
+        finally:
+            count_cache.reset(token)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from strawberry_django.permissions import (
+    PermissionUserScope,
+    RequestPermissionCache,
+    permission_cache,
+    permission_user_scope,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from strawberry.types import ExecutionContext
+
+    from strawberry_django.permissions import PermissionCache
+
+
+class DjangoPermissionCacheExtension(SchemaExtension):
+    """Cache the permission checks done by `HasPerm` and its subclasses.
+
+    Without this extension, results are cached in an attribute of the user
+    object. With it, they are cached for the duration of the execution and,
+    if a `PermissionCache` is given (see `LocMemPermissionCache` and
+    `DjangoPermissionCache`), shared between executions too.
+
+    The same cache instance needs to be shared between executions.
+    Subscriptions only use the shared cache, if any, as they can be running
+    for a long time.
+
+    With `preload=True`, all the model level permissions of the user get
+    fetched on its first permission check, and all the following checks are
+    answered from them. `preload_object_perms=True` fetches its
+    django-guardian object permissions too.
+
+    The user to check the permissions for in async executions is memoized
+    for the execution too, instead of in the context, which might be shared
+    between executions (e.g. by the operations of a websocket connection).
+
+    Examples
+    --------
+        Add the following to your schema configuration.
+
+        >>> import functools
+        >>> import strawberry
+        >>> from strawberry_django.extensions.permission_cache import (
+        ...     DjangoPermissionCacheExtension,
+        ... )
+        >>> from strawberry_django.permissions import LocMemPermissionCache
+        ...
+        >>> permission_cache = LocMemPermissionCache(timeout=300)
+        >>> schema = strawberry.Schema(
+        ...     Query,
+        ...     extensions=[
+        ...         functools.partial(
+        ...             DjangoPermissionCacheExtension,
+        ...             cache=permission_cache,
+        ...         ),
+        ...     ]
+        ... )
+
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: PermissionCache | None = None,
+        preload: bool = False,
+        preload_object_perms: bool = False,
+        execution_context: ExecutionContext | None = None,
+    ):
+        super().__init__(execution_context=cast("ExecutionContext", execution_context))
+        self.cache = cache
+        self.preload = preload
+        self.preload_object_perms = preload_object_perms
+
+    def on_execute(self) -> Generator[None]:
+        is_subscription = (
+            self.execution_context.operation_type == OperationType.SUBSCRIPTION
+        )
+        token = permission_cache.set(
+            RequestPermissionCache(
+                self.cache,
+                local=not is_subscription,
+                preload=self.preload,
+                preload_object_perms=self.preload_object_perms,
+            ),
+        )
+        user_token = permission_user_scope.set(PermissionUserScope())
+        try:
+            yield
+        finally:
+            permission_user_scope.reset(user_token)
+            permission_cache.reset(token)
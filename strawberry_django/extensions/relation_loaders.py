@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from strawberry.extensions import SchemaExtension
+
+from strawberry_django.loaders import RelationLoaders, relation_loaders
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+class DjangoRelationLoaderExtension(SchemaExtension):
+    """Batch relations which were not prefetched by the optimizer using DataLoaders.
+
+    When the optimizer can't prefetch a relation (e.g. the field has
+    `disable_optimization=True`, it is inside a union or the optimizer is not
+    enabled at all), each source object fetches it from the database by itself,
+    resulting in N+1 queries. With this extension, forward foreign keys,
+    reverse one-to-ones, reverse foreign keys and many-to-many relations
+    resolved in an async context are loaded by request-scoped DataLoaders,
+    which fetch them for all the source objects at once using `__in` queries.
+
+    Examples
+    --------
+        Add the following to your schema configuration.
+
+        >>> import strawberry
+        >>> from strawberry_django.extensions.relation_loaders import (
+        ...     DjangoRelationLoaderExtension,
+        ... )
+        ...
+        >>> schema = strawberry.Schema(
+        ...     Query,
+        ...     extensions=[
+        ...         DjangoOptimizerExtension,
+        ...         DjangoRelationLoaderExtension,
+        ...     ]
+        ... )
+
+    """
+
+    def on_execute(self) -> Generator[None]:
+        token = relation_loaders.set(RelationLoaders())
+        try:
+            yield
+        finally:
+            relation_loaders.reset(token)
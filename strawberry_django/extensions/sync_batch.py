@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from strawberry.extensions import SchemaExtension
+
+from strawberry_django.resolvers import SyncBatcher, sync_batcher
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+class DjangoSyncBatchExtension(SchemaExtension):
+    """Batch the `sync_to_async` calls done by Django resolvers.
+
+    When running in an async context, each resolver decorated with
+    `django_resolver` (which includes all the fields generated by this library)
+    calls `sync_to_async` to run its sync ORM code in a worker thread. With this
+    extension, all of those scheduled in the same event loop tick (e.g. sibling
+    fields in a query) are run together in a single `sync_to_async` call,
+    replacing one thread handoff per field with one per tick.
+
+    Note that the batched resolvers run one after the other, which is what would
+    happen with thread sensitive `sync_to_async` calls anyway.
+
+    Examples
+    --------
+        Add the following to your schema configuration.
+
+        >>> import strawberry
+        >>> from strawberry_django.extensions.sync_batch import DjangoSyncBatchExtension
+        ...
+        >>> schema = strawberry.Schema(
+        ...     Query,
+        ...     extensions=[
+        ...         DjangoSyncBatchExtension,
+        ...     ]
+        ... )
+
+    """
+
+    def on_execute(self) -> Generator[None]:
+        token = sync_batcher.set(SyncBatcher())
+        try:
+            yield
+        finally:
+            sync_batcher.reset(token)
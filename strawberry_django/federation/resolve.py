@@ -6,9 +6,15 @@ class methods for federation entity types backed by Django models.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+import functools
+import operator
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar, cast
 
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from graphql import GraphQLError
+from graphql.execution.values import get_argument_values
 from strawberry.types.info import Info
 from strawberry.utils.await_maybe import AwaitableOrValue
 
@@ -26,6 +32,12 @@ __all__ = [
     "resolve_model_reference",
 ]
 
+# Attribute used to store the `_EntityBatch` of an `_entities` call into its info.
+# Federation passes the same info to all the `resolve_reference` calls it does.
+_ENTITY_BATCH_ATTR = "_strawberry_django_entity_batch"
+
+_ReferenceKey: TypeAlias = tuple[tuple[str, Any], ...]
+
 
 def resolve_model_reference(
     source: type[WithStrawberryDjangoObjectDefinition],
@@ -51,7 +63,11 @@ def resolve_model_reference(
         ext = optimizer.optimizer.get()
         if ext is not None:
             # If optimizer extension is enabled, optimize this queryset
-            qs = ext.optimize(qs, info=info)
+            qs = ext.optimize(
+                qs,
+                info=info,
+                type_name=source.__strawberry_definition__.name,
+            )
 
     def _get_result() -> _M:
         return qs.get()
@@ -59,11 +75,218 @@ def resolve_model_reference(
     return django_resolver(_get_result)()
 
 
+class _EntityBatch:
+    """The references of an `_entities` call, and the instances fetched for them.
+
+    Missing entities are stored as the exception that `QuerySet.get()` would
+    have raised for them.
+    """
+
+    def __init__(self):
+        self.querysets: dict[type, models.QuerySet] = {}
+        self.pending: dict[type, dict[_ReferenceKey, None]] = {}
+        self.results: dict[tuple[type, _ReferenceKey], Any] = {}
+
+    def get_queryset(
+        self,
+        source: type[WithStrawberryDjangoObjectDefinition],
+        model: type[_M],
+        info: Info,
+    ) -> models.QuerySet[_M]:
+        """Return the queryset to fetch the references of the given type.
+
+        It is optimized once for the selections made on the type, and then
+        shared by all the queries fetching its references.
+        """
+        from strawberry_django import optimizer  # avoid circular import
+
+        qs = self.querysets.get(source)
+        if qs is None:
+            qs = model._default_manager.all()
+            qs = run_type_get_queryset(qs, source, info)
+            ext = optimizer.optimizer.get()
+            if ext is not None:
+                # If optimizer extension is enabled, optimize this queryset
+                qs = ext.optimize(
+                    qs,
+                    info=info,
+                    type_name=source.__strawberry_definition__.name,
+                )
+            self.querysets[source] = qs
+
+        return qs
+
+
+def _get_representations(info: Info, type_name: str) -> list[dict[str, Any]]:
+    """Return the representations of the given type in the `_entities` call.
+
+    Federation pops `__typename` from the representations while resolving
+    them, so the ones already resolved are not returned, which is fine since
+    those were for other types.
+    """
+    raw_info = info._raw_info
+    field_def = raw_info.parent_type.fields.get(raw_info.field_name)
+    if field_def is None:
+        return []
+
+    try:
+        arguments = get_argument_values(
+            field_def,
+            raw_info.field_nodes[0],
+            raw_info.variable_values,
+        )
+    except GraphQLError:
+        return []
+
+    return [
+        r
+        for r in arguments.get("representations") or []
+        if isinstance(r, dict) and r.get("__typename") == type_name
+    ]
+
+
+def _get_reference_key(
+    model: type[models.Model],
+    key_fields: dict[str, Any],
+) -> _ReferenceKey | None:
+    """Return the key fields with their values converted to python.
+
+    `None` is returned when the key fields can't be resolved in a batch (e.g.
+    they are lookups instead of fields, or their values are invalid), meaning
+    that the reference needs to be resolved with a query of its own.
+    """
+    key = []
+    for name, value in sorted(key_fields.items()):
+        if LOOKUP_SEP in name:
+            return None
+
+        try:
+            field = model._meta.get_field(name)
+            python_value = cast("models.Field", field).to_python(value)
+            hash(python_value)
+        except (FieldDoesNotExist, ValidationError, AttributeError, TypeError):
+            return None
+
+        key.append((name, python_value))
+
+    return tuple(key)
+
+
+def _fetch_references(
+    qs: models.QuerySet[_M],
+    keys: list[_ReferenceKey],
+) -> dict[_ReferenceKey, Any]:
+    """Fetch the instances for all the keys with a single query."""
+    names = [name for name, _ in keys[0]]
+    opts = qs.model._meta
+    fields = [opts.get_field(name) for name in names]
+
+    # The key fields are needed to map the instances back to their keys, make
+    # sure they are loaded even when the optimizer restricted the columns
+    only, defer = qs.query.deferred_loading
+    if only and not defer:
+        qs = qs.only(*only, *(f.name for f in fields))
+
+    if len(names) == 1:
+        qs = qs.filter(**{f"{names[0]}__in": [key[0][1] for key in keys]})
+    else:
+        qs = qs.filter(
+            functools.reduce(operator.or_, (models.Q(**dict(key)) for key in keys)),
+        )
+
+    attnames = [f.attname for f in fields]  # type: ignore
+    results: dict[_ReferenceKey, Any] = {}
+    for obj in qs:
+        key = tuple(zip(names, (getattr(obj, a) for a in attnames), strict=True))
+        if key in results:
+            results[key] = qs.model.MultipleObjectsReturned(
+                f"get() returned more than one {opts.object_name}",
+            )
+        else:
+            results[key] = obj
+
+    return {
+        key: results.get(key)
+        or qs.model.DoesNotExist(f"{opts.object_name} matching query does not exist.")
+        for key in keys
+    }
+
+
+def _resolve_batched_reference(
+    source: type[WithStrawberryDjangoObjectDefinition],
+    info: Info,
+    key_fields: list[str],
+    reference: dict[str, Any],
+) -> AwaitableOrValue[Any]:
+    """Resolve a reference fetching all the ones of its type at once.
+
+    The first reference of a type in an `_entities` call to be resolved
+    fetches the instances for all the references of that type, grouped by
+    their set of key fields, with a single query per group. The other
+    references then get their instance from those results.
+
+    In sync executions that happens before the next references are passed to
+    `resolve_reference`, so those are taken from the `_entities` arguments.
+    """
+    from strawberry_django.utils.typing import get_django_definition
+
+    django_type = get_django_definition(source, strict=True)
+    model = cast("type[models.Model]", django_type.model)
+
+    batch: _EntityBatch | None = getattr(info, _ENTITY_BATCH_ATTR, None)
+    if batch is None:
+        batch = _EntityBatch()
+        setattr(info, _ENTITY_BATCH_ATTR, batch)
+
+    key = _get_reference_key(model, reference)
+    if key is None:
+        qs = batch.get_queryset(source, model, info).filter(**reference)
+        return django_resolver(qs.get)()
+
+    pending = batch.pending.setdefault(source, {})
+    if (source, key) not in batch.results:
+        pending[key] = None
+
+    def _get_result() -> Any:
+        if (source, key) not in batch.results:
+            type_name = source.__strawberry_definition__.name
+            for representation in _get_representations(info, type_name):
+                other_key = _get_reference_key(
+                    model,
+                    {k: v for k, v in representation.items() if k in key_fields},
+                )
+                if other_key and (source, other_key) not in batch.results:
+                    pending[other_key] = None
+
+            groups: dict[tuple[str, ...], list[_ReferenceKey]] = {}
+            for k in pending:
+                groups.setdefault(tuple(name for name, _ in k), []).append(k)
+            pending.clear()
+
+            qs = batch.get_queryset(source, model, info)
+            for keys in groups.values():
+                batch.results.update(
+                    ((source, k), v) for k, v in _fetch_references(qs, keys).items()
+                )
+
+        result = batch.results[source, key]
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    return django_resolver(_get_result)()
+
+
 def generate_resolve_reference(key_fields: list[str]) -> classmethod:
     """Generate a resolve_reference classmethod for a federation entity type.
 
     Only *key_fields* are forwarded to the ORM query — federation may pass
     extra fields (e.g. from @requires) that are not valid ORM lookups.
+
+    When called by the `_entities` resolver, all the representations of the
+    type are resolved at once (see `_resolve_batched_reference`), instead of
+    doing a query for each one of them.
     """
 
     def resolve_reference(
@@ -80,6 +303,10 @@ def generate_resolve_reference(key_fields: list[str]) -> classmethod:
                 f"Expected one of {key_fields}, got {list(kwargs.keys())}."
             )
             raise ValueError(msg)
+
+        if info is not None:
+            return _resolve_batched_reference(cls, info, key_fields, filtered_kwargs)
+
         return resolve_model_reference(cls, info=info, **filtered_kwargs)
 
     return classmethod(resolve_reference)
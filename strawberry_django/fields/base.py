@@ -176,7 +176,15 @@ class StrawberryDjangoFieldBase(StrawberryField):
         if not resolver.is_async and not getattr(
             resolver.wrapped_func, "is_async_safe", False
         ):
-            resolver = django_resolver(resolver, qs_hook=None)
+            resolver = django_resolver(
+                resolver,
+                qs_hook=None,
+                # Node resolvers delegate to the type's `resolve_node(s)`, which
+                # uses the async queryset API when the async ORM mode is enabled
+                async_orm_safe=any(
+                    isinstance(e, relay.NodeExtension) for e in self.extensions
+                ),
+            )
 
         return resolver
 
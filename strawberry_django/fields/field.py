@@ -49,6 +49,7 @@ from strawberry_django.arguments import argument
 from strawberry_django.descriptors import ModelProperty
 from strawberry_django.fields.base import StrawberryDjangoFieldBase
 from strawberry_django.filters import FILTERS_ARG, StrawberryDjangoFieldFilters
+from strawberry_django.loaders import get_relation_loader
 from strawberry_django.optimizer import OptimizerStore, is_optimized_by_prefetching
 from strawberry_django.ordering import (
     ORDER_ARG,
@@ -65,11 +66,16 @@ from strawberry_django.permissions import filter_with_perms
 from strawberry_django.queryset import run_type_get_queryset
 from strawberry_django.relay import resolve_model_nodes
 from strawberry_django.resolvers import (
+    adefault_qs_hook,
     default_qs_hook,
     django_getattr,
     django_resolver,
     resolve_base_manager,
+    resolving_async,
+    stream_qs_hook,
+    use_async_orm,
 )
+from strawberry_django.utils.gql_compat import IS_GQL_33
 from strawberry_django.utils.inspect import callable_returns_queryset
 
 if TYPE_CHECKING:
@@ -130,9 +136,11 @@ class StrawberryDjangoField(
         prefetch_related: TypeOrSequence[PrefetchType] | None = None,
         annotate: TypeOrMapping[AnnotateType] | None = None,
         disable_optimization: bool = False,
+        stream: bool | int = False,
         **kwargs,
     ):
         self.disable_optimization = disable_optimization
+        self.stream = stream
         self.store = OptimizerStore.with_hints(
             only=only,
             select_related=select_related,
@@ -160,6 +168,7 @@ class StrawberryDjangoField(
     def __copy__(self) -> Self:
         new_field = super().__copy__()
         new_field.disable_optimization = self.disable_optimization
+        new_field.stream = self.stream
         new_field.store = self.store.copy()
         new_field._cached_arguments = None
         return new_field
@@ -235,6 +244,12 @@ class StrawberryDjangoField(
             attname = self.django_name or self.python_name
             attr = getattr(source.__class__, attname, None)
 
+            # Batch relations not prefetched by the optimizer when possible
+            if info is not None and (
+                loader := get_relation_loader(self, source, attname, info, kwargs)
+            ):
+                return loader.load(source)
+
             def get_cached_result():
                 if isinstance(attr, ModelProperty):
                     return source.__dict__[attr.name]
@@ -293,6 +308,10 @@ class StrawberryDjangoField(
                     qs_hook = self.get_queryset_hook(**kwargs)
                     if self._can_run_qs_hook_inline(resolved):
                         resolved = qs_hook(resolved)
+                    elif use_async_orm():
+                        resolved = await self.get_async_queryset_hook(**kwargs)(
+                            resolved
+                        )
                     else:
                         resolved = await sync_to_async(qs_hook)(resolved)
 
@@ -310,6 +329,8 @@ class StrawberryDjangoField(
             qs_hook = self.get_queryset_hook(**kwargs)
             if self._can_run_qs_hook_inline(result):
                 result = qs_hook(result)
+            elif use_async_orm():
+                return self.get_async_queryset_hook(**kwargs)(result)
             else:
                 result = django_resolver(
                     qs_hook,
@@ -325,9 +346,18 @@ class StrawberryDjangoField(
                 return self.get_queryset(qs, info, **kwargs)
 
         elif self.is_list:
+            # The hook itself may run in a thread, but the streamed
+            # results are consumed where the hook is being created
+            is_async = in_async_context() or resolving_async.get()
 
             def qs_hook(qs: models.QuerySet):  # type: ignore
                 qs = self.get_queryset(qs, info, **kwargs)
+                if self.stream:
+                    return stream_qs_hook(
+                        qs,
+                        is_async=is_async,
+                        **self._stream_kwargs,
+                    )
                 if not self.disable_fetch_list_results:
                     qs = default_qs_hook(qs)
                 return qs
@@ -345,27 +375,52 @@ class StrawberryDjangoField(
                 # Don't use qs.get() if the queryset is optimized by prefetching.
                 # Calling get in that case would disregard the prefetched results, because get implicitly
                 # adds a limit to the query
-                if (result_cache := qs._result_cache) is not None:  # type: ignore
-                    model = qs.model
-                    assert model is not None
-                    # mimic behavior of get()
-                    # the queryset is already prefetched, no issue with just using len()
-                    qs_len = len(result_cache)
-                    if qs_len == 0:
-                        raise model.DoesNotExist(
-                            f"{model._meta.object_name} matching query does not exist."
-                        )
-                    if qs_len != 1:
-                        raise model.MultipleObjectsReturned(
-                            f"get() returned more than one {model._meta.object_name} -- it returned "
-                            f"{qs_len if qs_len < MAX_GET_RESULTS else f'more than {qs_len - 1}'}!"
-                        )
-                    return result_cache[0]
+                if qs._result_cache is not None:  # type: ignore
+                    return _get_from_result_cache(qs)
 
                 return qs.get()
 
         return qs_hook
 
+    def get_async_queryset_hook(self, info: Info, **kwargs):
+        """Async version of `get_queryset_hook`, used when `ASYNC_ORM` is enabled.
+
+        The queryset is built in the event loop and evaluated using Django's
+        async queryset API, meaning that `get_queryset` (including the type's
+        one) should not hit the database by itself.
+        """
+
+        async def qs_hook(qs: models.QuerySet):
+            qs = self.get_queryset(qs, info, **kwargs)
+
+            if self.is_connection or self.is_paginated:
+                # We don't want to fetch results yet, those will be done by the connection/pagination
+                return qs
+
+            if self.is_list:
+                if self.stream and IS_GQL_33:
+                    return stream_qs_hook(qs, is_async=True, **self._stream_kwargs)
+                if not self.disable_fetch_list_results:
+                    qs = await adefault_qs_hook(qs)
+                return qs
+
+            if self.is_optional:
+                return await qs.afirst()
+
+            if qs._result_cache is not None:  # type: ignore
+                return _get_from_result_cache(qs)
+
+            return await qs.aget()
+
+        return qs_hook
+
+    @property
+    def _stream_kwargs(self) -> dict[str, int]:
+        # `stream=True` uses the default chunk size, an int overrides it
+        if self.stream is True:
+            return {}
+        return {"chunk_size": self.stream}
+
     def get_queryset(self, queryset, info, **kwargs):
         # If the queryset been optimized at prefetch phase, this function has already been
         # called by the optimizer extension, meaning we don't want to call it again
@@ -419,6 +474,25 @@ class StrawberryDjangoField(
         )
 
 
+def _get_from_result_cache(qs: models.QuerySet) -> models.Model:
+    model = qs.model
+    assert model is not None
+    result_cache = qs._result_cache  # type: ignore
+    # mimic behavior of get()
+    # the queryset is already prefetched, no issue with just using len()
+    qs_len = len(result_cache)
+    if qs_len == 0:
+        raise model.DoesNotExist(
+            f"{model._meta.object_name} matching query does not exist."
+        )
+    if qs_len != 1:
+        raise model.MultipleObjectsReturned(
+            f"get() returned more than one {model._meta.object_name} -- it returned "
+            f"{qs_len if qs_len < MAX_GET_RESULTS else f'more than {qs_len - 1}'}!"
+        )
+    return result_cache[0]
+
+
 def _get_field_arguments_for_extensions(
     field: StrawberryDjangoField,
     *,
@@ -508,8 +582,8 @@ class StrawberryDjangoConnectionExtension(relay.ConnectionExtension):
 
                     # resolve_model_nodes may run user-defined `get_queryset`,
                     # which is allowed to touch the database - keep it out of
-                    # the event loop.
-                    if in_async_context():
+                    # the event loop, unless the async ORM mode is enabled.
+                    if in_async_context() and not use_async_orm():
                         retval = sync_to_async(resolve_model_nodes)(
                             django_type,
                             info=info,
@@ -702,6 +776,7 @@ def field(
     prefetch_related: TypeOrSequence[PrefetchType] | None = None,
     annotate: TypeOrMapping[AnnotateType] | None = None,
     disable_optimization: bool = False,
+    stream: bool | int = False,
 ) -> _T: ...
 
 
@@ -731,6 +806,7 @@ def field(
     prefetch_related: TypeOrSequence[PrefetchType] | None = None,
     annotate: TypeOrMapping[AnnotateType] | None = None,
     disable_optimization: bool = False,
+    stream: bool | int = False,
 ) -> Any: ...
 
 
@@ -760,6 +836,7 @@ def field(
     prefetch_related: TypeOrSequence[PrefetchType] | None = None,
     annotate: TypeOrMapping[AnnotateType] | None = None,
     disable_optimization: bool = False,
+    stream: bool | int = False,
 ) -> StrawberryDjangoField: ...
 
 
@@ -788,6 +865,7 @@ def field(
     prefetch_related: TypeOrSequence[PrefetchType] | None = None,
     annotate: TypeOrMapping[AnnotateType] | None = None,
     disable_optimization: bool = False,
+    stream: bool | int = False,
     # This init parameter is used by pyright to determine whether this field
     # is added in the constructor or not. It is not used to change
     # any behavior at the moment.
@@ -795,6 +873,10 @@ def field(
 ) -> Any:
     """Annotate a method or property as a Django GraphQL field.
 
+    List fields with `stream` return their rows using `QuerySet.iterator`
+    (or `QuerySet.aiterator` in async contexts) instead of fetching them all
+    at once. Pass an int to it to change the number of rows fetched per chunk.
+
     Examples
     --------
         It can be used both as decorator and as a normal function:
@@ -831,6 +913,7 @@ def field(
         prefetch_related=prefetch_related,
         annotate=annotate,
         disable_optimization=disable_optimization,
+        stream=stream,
     )
 
     if order:
@@ -936,6 +1019,7 @@ def connection(
     prefetch_related: TypeOrSequence[PrefetchType] | None = None,
     annotate: TypeOrMapping[AnnotateType] | None = None,
     disable_optimization: bool = False,
+    approximate_count: bool | UnsetType = UNSET,
 ) -> Any: ...
 
 
@@ -966,6 +1050,7 @@ def connection(
     prefetch_related: TypeOrSequence[PrefetchType] | None = None,
     annotate: TypeOrMapping[AnnotateType] | None = None,
     disable_optimization: bool = False,
+    approximate_count: bool | UnsetType = UNSET,
 ) -> Any: ...
 
 
@@ -994,6 +1079,7 @@ def connection(
     prefetch_related: TypeOrSequence[PrefetchType] | None = None,
     annotate: TypeOrMapping[AnnotateType] | None = None,
     disable_optimization: bool = False,
+    approximate_count: bool | UnsetType = UNSET,
     # This init parameter is used by pyright to determine whether this field
     # is added in the constructor or not. It is not used to change
     # any behavior at the moment.
@@ -1084,6 +1170,7 @@ def connection(
         prefetch_related=prefetch_related,
         annotate=annotate,
         disable_optimization=disable_optimization,
+        approximate_count=approximate_count,
     )
 
     if resolver:
@@ -1124,6 +1211,7 @@ def offset_paginated(
     prefetch_related: TypeOrSequence[PrefetchType] | None = None,
     annotate: TypeOrMapping[AnnotateType] | None = None,
     disable_optimization: bool = False,
+    approximate_count: bool | UnsetType = UNSET,
 ) -> Any: ...
 
 
@@ -1153,6 +1241,7 @@ def offset_paginated(
     prefetch_related: TypeOrSequence[PrefetchType] | None = None,
     annotate: TypeOrMapping[AnnotateType] | None = None,
     disable_optimization: bool = False,
+    approximate_count: bool | UnsetType = UNSET,
 ) -> Any: ...
 
 
@@ -1180,6 +1269,7 @@ def offset_paginated(
     prefetch_related: TypeOrSequence[PrefetchType] | None = None,
     annotate: TypeOrMapping[AnnotateType] | None = None,
     disable_optimization: bool = False,
+    approximate_count: bool | UnsetType = UNSET,
     # This init parameter is used by pyright to determine whether this field
     # is added in the constructor or not. It is not used to change
     # any behavior at the moment.
@@ -1267,6 +1357,7 @@ def offset_paginated(
         prefetch_related=prefetch_related,
         annotate=annotate,
         disable_optimization=disable_optimization,
+        approximate_count=approximate_count,
     )
 
     if resolver:
@@ -1,10 +1,18 @@
 import contextlib
 import dataclasses
-from typing import cast
+import functools
+import itertools
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from typing import Any, cast
 
-from django.contrib.auth import get_user_model
+from django.contrib.auth import get_backends, get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from guardian.backends import ObjectPermissionBackend, check_user_support
 from guardian.conf import settings as guardian_settings
+from guardian.core import ObjectPermissionChecker
 from guardian.models.models import GroupObjectPermissionBase, UserObjectPermissionBase
 from guardian.utils import get_anonymous_user as _get_anonymous_user
 from guardian.utils import get_group_obj_perms_model, get_user_obj_perms_model
@@ -34,3 +42,139 @@ def get_user_or_anonymous(user: UserType) -> UserType:
         with contextlib.suppress(get_user_model().DoesNotExist):
             return cast("UserType", _get_anonymous_user())
     return user
+
+
+def uses_default_backends() -> bool:
+    """Check if only django's `ModelBackend` and guardian's backend are enabled.
+
+    Other backends could grant object permissions too, meaning that those
+    can't be fetched from guardian's tables directly. That includes subclasses
+    of those two, since they could override `has_perm`.
+    """
+    backend_types = {type(b) for b in get_backends()}
+    return ObjectPermissionBackend in backend_types and backend_types <= {
+        ModelBackend,
+        ObjectPermissionBackend,
+    }
+
+
+def get_bulk_obj_perm_checker(
+    user: UserType,
+    objs: Iterable[Any],
+) -> Callable[[str, Any], bool] | None:
+    """Get a checker for the object permissions of `user` over all `objs` at once.
+
+    The returned checker behaves like `user.has_perm(perm, obj=obj)`, but the
+    user and group object permissions of all the given objects get fetched
+    together (2 queries per model) the first time it gets called, instead of
+    once for each checked object.
+
+    Returns `None` when that can't be done, i.e. when other authentication
+    backends than django's `ModelBackend` and guardian's
+    `ObjectPermissionBackend` are enabled, since those could grant object
+    permissions too.
+    """
+    if not uses_default_backends():
+        return None
+
+    supported, user = check_user_support(user)
+    if not supported:
+        return lambda perm, obj: False
+
+    checker = ObjectPermissionChecker(user)
+    pending: dict[type[models.Model], list[models.Model]] | None = defaultdict(list)
+    for obj in objs:
+        if isinstance(obj, models.Model):
+            pending[type(obj)].append(obj)
+
+    def has_perm(perm: str, obj: Any) -> bool:
+        nonlocal pending
+
+        # Mimic ObjectPermissionBackend.has_perm
+        if not isinstance(obj, models.Model):
+            return False
+
+        app_label, _, codename = perm.rpartition(".")
+        if app_label and app_label != obj._meta.app_label:
+            # Let the backend raise the proper error
+            return ObjectPermissionBackend().has_perm(user, perm, obj)
+
+        if pending is not None:
+            for model_objs in pending.values():
+                checker.prefetch_perms(model_objs)
+            pending = None
+
+        return checker.has_perm(codename, obj)
+
+    return has_perm
+
+
+@functools.lru_cache
+def _uses_generic_obj_perms(model: type[models.Model]) -> bool:
+    perm_models = get_object_permission_models(model)
+    return (
+        perm_models.user is get_user_obj_perms_model()
+        and perm_models.group is get_group_obj_perms_model()
+    )
+
+
+class UserObjectPermissions:
+    """The generic object permissions of a user and of its groups.
+
+    They are fetched lazily for each content type that gets checked, with one
+    query for the user's permissions and another one for its groups'
+    permissions. Models using direct foreign key object permission models
+    are not included.
+    """
+
+    def __init__(self, user: UserType):
+        supported, user = check_user_support(user)
+        self.user = user
+        self.is_active = supported and user.is_active
+        self.is_superuser = self.is_active and getattr(user, "is_superuser", False)
+        self._perms: dict[int, dict[str, set[str]]] = {}
+
+    def _get_perms(self, ctype: ContentType) -> dict[str, set[str]]:
+        perms = self._perms.get(ctype.pk)
+        if perms is not None:
+            return perms
+
+        perms = self._perms[ctype.pk] = defaultdict(set)
+        user_perms = get_user_obj_perms_model().objects.filter(
+            user=self.user,
+            content_type=ctype,
+        )
+        group_perms = get_group_obj_perms_model().objects.filter(
+            group__in=self.user.groups.all(),  # type: ignore
+            content_type=ctype,
+        )
+        for object_pk, codename in itertools.chain(
+            user_perms.values_list("object_pk", "permission__codename"),
+            group_perms.values_list("object_pk", "permission__codename"),
+        ):
+            perms[object_pk].add(codename)
+
+        return perms
+
+    def has_perm(self, perm: str, obj: Any) -> bool | None:
+        """Check if the user has `perm` for `obj`, like `user.has_perm(perm, obj)`.
+
+        Returns `None` if that can't be answered from the fetched permissions.
+        """
+        if not isinstance(obj, models.Model):
+            return False
+
+        if not self.is_active:
+            return False
+
+        if self.is_superuser:
+            return True
+
+        app_label, _, codename = perm.rpartition(".")
+        if (
+            app_label and app_label != obj._meta.app_label
+        ) or not _uses_generic_obj_perms(type(obj)):
+            return None
+
+        ctype = ContentType.objects.get_for_model(obj)
+        return codename in self._get_perms(ctype).get(str(obj.pk), ())
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import contextvars
+from typing import TYPE_CHECKING, Any
+
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.fields.related import (
+    ForwardManyToOneDescriptor,
+    ManyToManyDescriptor,
+    ReverseManyToOneDescriptor,
+    ReverseOneToOneDescriptor,
+)
+from strawberry.dataloader import DataLoader
+from strawberry.utils.inspect import in_async_context
+
+from . import optimizer
+from .resolvers import django_resolver, resolve_base_manager
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from strawberry.types.info import Info
+
+    from .fields.field import StrawberryDjangoField
+
+# Attribute used to store the values fetched by the loaders into the source objects
+# until they are handed over to the resolvers. It is removed right after that.
+_LOADED_ATTR = "_strawberry_django_loaded"
+
+
+class RelationLoaders:
+    """Request-scoped registry of the DataLoaders used to resolve relations.
+
+    There is one loader for each field in the query (ignoring list indexes in
+    its path), meaning that all source objects resolving the same selection
+    share the same arguments and get batched together.
+    """
+
+    def __init__(self):
+        self._loaders: dict[Hashable, DataLoader[models.Model, Any]] = {}
+
+    def get(
+        self,
+        field: StrawberryDjangoField,
+        descriptor: Any,
+        attname: str,
+        info: Info,
+        kwargs: dict[str, Any],
+    ) -> DataLoader[models.Model, Any]:
+        key = (
+            field,
+            tuple(p for p in info.path.as_list() if not isinstance(p, int)),
+        )
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = self._loaders[key] = _create_loader(
+                field,
+                descriptor,
+                attname,
+                info,
+                kwargs,
+            )
+
+        return loader
+
+
+#: The `RelationLoaders` used by `StrawberryDjangoField` for the current execution, if any.
+relation_loaders: contextvars.ContextVar[RelationLoaders | None] = (
+    contextvars.ContextVar("relation-loaders", default=None)
+)
+
+
+def get_relation_loader(
+    field: StrawberryDjangoField,
+    source: models.Model,
+    attname: str,
+    info: Info,
+    kwargs: dict[str, Any],
+) -> DataLoader[models.Model, Any] | None:
+    """Get a DataLoader to resolve the `attname` relation of `source`, if possible.
+
+    Loaders are only available when running in an async context with the
+    `DjangoRelationLoaderExtension` enabled, and only for forward foreign keys,
+    reverse one-to-ones, reverse foreign keys and many-to-many relations which
+    are not already cached/prefetched in the source object. Connections and
+    paginated fields keep being resolved one source at a time.
+    """
+    loaders = relation_loaders.get()
+    if loaders is None or not in_async_context() or LOOKUP_SEP in attname:
+        return None
+
+    descriptor = getattr(source.__class__, attname, None)
+    if isinstance(descriptor, (ForwardManyToOneDescriptor, ReverseOneToOneDescriptor)):
+        if field.is_list or descriptor.is_cached(source):
+            return None
+    elif isinstance(descriptor, ReverseManyToOneDescriptor):
+        if not field.is_list or field.is_connection or field.is_paginated:
+            return None
+
+        # This does not touch the database, it returns the prefetched
+        # queryset if there's one, or an unevaluated one otherwise
+        qs = resolve_base_manager(getattr(source, attname))
+        if qs._result_cache is not None:  # type: ignore
+            return None
+    else:
+        return None
+
+    return loaders.get(field, descriptor, attname, info, kwargs)
+
+
+def _create_loader(
+    field: StrawberryDjangoField,
+    descriptor: Any,
+    attname: str,
+    info: Info,
+    kwargs: dict[str, Any],
+) -> DataLoader[models.Model, Any]:
+    if isinstance(descriptor, ForwardManyToOneDescriptor):
+        related_model = descriptor.field.remote_field.model
+    elif isinstance(descriptor, ReverseOneToOneDescriptor):
+        related_model = descriptor.related.related_model
+    elif isinstance(descriptor, ManyToManyDescriptor) and not descriptor.reverse:
+        related_model = descriptor.rel.model
+    else:
+        related_model = descriptor.rel.related_model
+
+    is_single = not field.is_list
+    # Reversed OneToOne raises ObjectDoesNotExist when the relation doesn't exist
+    raise_if_missing = (
+        isinstance(descriptor, ReverseOneToOneDescriptor) and not field.is_optional
+    )
+
+    def fetch(sources: list[models.Model]) -> list[Any]:
+        if is_single:
+            # Mimic the related descriptors, which fetch single objects
+            # from the base manager without any extra filtering
+            qs = related_model._base_manager.all()
+            if (
+                not field.disable_optimization
+                and (ext := optimizer.optimizer.get()) is not None
+            ):
+                qs = ext.optimize(qs, info=info)
+        else:
+            qs = field.get_queryset(
+                related_model._default_manager.all(),
+                info,
+                **kwargs,
+            )
+
+        models.prefetch_related_objects(
+            sources,
+            models.Prefetch(attname, queryset=qs, to_attr=_LOADED_ATTR),
+        )
+
+        results = []
+        for source in sources:
+            value = source.__dict__.pop(_LOADED_ATTR)
+            if raise_if_missing and value is None:
+                value = related_model.DoesNotExist(
+                    f"{source.__class__.__name__} has no {attname}."
+                )
+            results.append(value)
+
+        return results
+
+    async def load_fn(sources: list[models.Model]) -> list[Any]:
+        return await django_resolver(fetch, qs_hook=None)(sources)
+
+    return DataLoader(load_fn=load_fn)
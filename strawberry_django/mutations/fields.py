@@ -22,8 +22,16 @@ from strawberry_django.fields.field import (
     StrawberryDjangoFieldFilters,
 )
 from strawberry_django.fields.types import OperationInfo, OperationMessage
-from strawberry_django.optimizer import DjangoOptimizerExtension, optimize
-from strawberry_django.permissions import filter_with_perms, get_with_perms
+from strawberry_django.optimizer import (
+    DjangoOptimizerExtension,
+    optimize,
+    optimize_instances,
+)
+from strawberry_django.permissions import (
+    filter_with_perms,
+    get_list_with_perms,
+    get_with_perms,
+)
 from strawberry_django.resolvers import django_resolver
 from strawberry_django.settings import strawberry_django_settings
 from strawberry_django.utils.inspect import get_possible_types
@@ -192,10 +200,12 @@ class DjangoMutationCUD(DjangoMutationBase):
         full_clean: bool | FullCleanOptions = True,
         argument_name: str | None = None,
         key_attr: str | None = None,
+        bulk: bool = False,
         **kwargs,
     ):
         self.full_clean = full_clean
         self.input_type = input_type
+        self.bulk = bulk
 
         if key_attr is None:
             settings = strawberry_django_settings()
@@ -214,6 +224,7 @@ class DjangoMutationCUD(DjangoMutationBase):
         new_field = super().__copy__()
         new_field.input_type = self.input_type
         new_field.full_clean = self.full_clean
+        new_field.bulk = self.bulk
         return new_field
 
     @property
@@ -239,6 +250,17 @@ class DjangoMutationCUD(DjangoMutationBase):
         if not DjangoOptimizerExtension.enabled.get() or info is None:
             return resolved
 
+        # Skip the refetch when the instances already hold what the selections need
+        if isinstance(resolved, models.Model):
+            if optimize_instances([resolved], info):
+                return resolved
+        elif (
+            isinstance(resolved, list)
+            and all(isinstance(r, models.Model) for r in resolved)
+            and optimize_instances(resolved, info)
+        ):
+            return resolved
+
         if isinstance(resolved, list) and resolved:
             model = type(resolved[0])
             if issubclass(model, models.Model):
@@ -278,7 +300,16 @@ class DjangoCreateMutation(DjangoMutationCUD):
 
         # Do not optimize anything while retrieving the object to create
         with DjangoOptimizerExtension.disabled():
-            if self.is_list:
+            if self.is_list and self.bulk:
+                assert isinstance(data, list)
+                resolved = self.bulk_create(
+                    [
+                        resolvers.parse_input(info, vars(d), key_attr=self.key_attr)
+                        for d in data
+                    ],
+                    info=info,
+                )
+            elif self.is_list:
                 assert isinstance(data, list)
                 resolved = [
                     self.create(
@@ -310,6 +341,18 @@ class DjangoCreateMutation(DjangoMutationCUD):
             full_clean=self.full_clean,
         )
 
+    def bulk_create(self, data: list[dict[str, Any]], *, info: Info):
+        model = self.django_model
+        assert model is not None
+
+        return resolvers.bulk_create(
+            info,
+            model,
+            data,
+            key_attr=self.key_attr,
+            full_clean=self.full_clean,
+        )
+
 
 def get_vdata(data: Any) -> dict[str, Any]:
     return vars(data).copy() if data is not None else {}
@@ -347,47 +390,91 @@ class DjangoUpdateMutation(DjangoMutationCUD, StrawberryDjangoFieldFilters):
 
         # Do not optimize anything while retrieving the object to update
         with DjangoOptimizerExtension.disabled():
-            if isinstance(data, list):
+            if self.bulk:
+                resolved = self.bulk_level_update(info, kwargs, data)
+            elif isinstance(data, list):
                 resolved = [self.instance_level_update(info, kwargs, d) for d in data]
             else:
                 resolved = self.instance_level_update(info, kwargs, data)
 
         return self.refetch(resolved, info=info)
 
-    def instance_level_update(
+    def get_instance(
         self,
         info: Info,
         kwargs: dict[str, Any],
-        data: Any,
-    ) -> Any:
+        vdata: dict[str, Any],
+    ) -> models.Model | Iterable[models.Model]:
         model = self.django_model
         assert model is not None
 
-        vdata = get_vdata(data)
         pk = get_pk(vdata, key_attr=self.key_attr)
-
         if pk not in (None, UNSET):  # ruff: ignore[literal-membership]
-            instance = get_with_perms(
+            return get_with_perms(
                 pk,
                 info,
                 required=True,
                 model=model,
                 key_attr=self.key_attr,
             )
-        else:
-            instance = filter_with_perms(
-                self.get_queryset(
-                    queryset=model._default_manager.all(),
-                    info=info,
-                    **kwargs,
-                ),
-                info,
-            )
+
+        return filter_with_perms(
+            self.get_queryset(
+                queryset=model._default_manager.all(),
+                info=info,
+                **kwargs,
+            ),
+            info,
+        )
+
+    def instance_level_update(
+        self,
+        info: Info,
+        kwargs: dict[str, Any],
+        data: Any,
+    ) -> Any:
+        vdata = get_vdata(data)
+        instance = self.get_instance(info, kwargs, vdata)
 
         return self.update(
             info, instance, resolvers.parse_input(info, vdata, key_attr=self.key_attr)
         )
 
+    def bulk_level_update(
+        self,
+        info: Info,
+        kwargs: dict[str, Any],
+        data: Any,
+    ) -> Any:
+        if not isinstance(data, list):
+            vdata = get_vdata(data)
+            instance = self.get_instance(info, kwargs, vdata)
+            parsed = resolvers.parse_input(info, vdata, key_attr=self.key_attr)
+            if isinstance(instance, models.Model):
+                return self.update(info, instance, parsed)
+
+            return self.bulk_update(info, instance, parsed)
+
+        vdata_list = [get_vdata(d) for d in data]
+        pks = [get_pk(vdata, key_attr=self.key_attr) for vdata in vdata_list]
+        if any(pk in (None, UNSET) for pk in pks):  # ruff: ignore[literal-membership]
+            # Inputs without a pk update all the filtered instances,
+            # they can't be mixed with the others in a single bulk update
+            return [self.instance_level_update(info, kwargs, d) for d in data]
+
+        model = self.django_model
+        assert model is not None
+
+        instances = get_list_with_perms(
+            pks,
+            info,
+            model=model,
+            key_attr=self.key_attr,
+        )
+        data_list = resolvers.parse_input(info, vdata_list, key_attr=self.key_attr)
+
+        return self.bulk_update(info, instances, data_list)
+
     def update(
         self,
         info: Info,
@@ -402,6 +489,20 @@ class DjangoUpdateMutation(DjangoMutationCUD, StrawberryDjangoFieldFilters):
             full_clean=self.full_clean,
         )
 
+    def bulk_update(
+        self,
+        info: Info,
+        instances: Iterable[models.Model],
+        data: dict[str, Any] | list[dict[str, Any]],
+    ):
+        return resolvers.bulk_update(
+            info,
+            instances,
+            data,
+            key_attr=self.key_attr,
+            full_clean=self.full_clean,
+        )
+
 
 class DjangoDeleteMutation(
     DjangoMutationCUD,
@@ -444,7 +545,8 @@ class DjangoDeleteMutation(
                 info,
             )
 
-        return self.delete(
+        delete = self.bulk_delete if self.bulk else self.delete
+        return delete(
             info,
             instance,
             resolvers.parse_input(info, vdata, key_attr=self.key_attr),
@@ -461,3 +563,18 @@ class DjangoDeleteMutation(
             instance,
             data=data,
         )
+
+    def bulk_delete(
+        self,
+        info: Info,
+        instance: models.Model | Iterable[models.Model],
+        data: dict[str, Any] | None = None,
+    ):
+        if isinstance(instance, models.Model):
+            return self.delete(info, instance, data)
+
+        return resolvers.bulk_delete(
+            info,
+            instance,
+            data=data,
+        )
@@ -257,11 +257,15 @@ def create(
     argument_name: str | None = None,
     handle_django_errors: bool | None = None,
     full_clean: bool | FullCleanOptions = True,
+    bulk: bool = False,
 ) -> Any:
     """Create mutation for django input fields.
 
     Automatically create data for django input fields.
 
+    When returning a list, `bulk=True` creates all the instances with
+    `bulk_create` after validating them.
+
     Examples
     --------
         >>> @strawberry.django.input
@@ -294,6 +298,7 @@ def create(
         argument_name=argument_name,
         handle_django_errors=handle_django_errors,
         full_clean=full_clean,
+        bulk=bulk,
     )
 
 
@@ -318,9 +323,13 @@ def update(
     handle_django_errors: bool | None = None,
     key_attr: str | None = None,
     full_clean: bool | FullCleanOptions = True,
+    bulk: bool = False,
 ) -> Any:
     """Update mutation for django input fields.
 
+    When updating many instances, `bulk=True` updates them with `bulk_update`
+    after validating them.
+
     Examples
     --------
         >>> @strawberry.django.input
@@ -355,6 +364,7 @@ def update(
         handle_django_errors=handle_django_errors,
         key_attr=key_attr,
         full_clean=full_clean,
+        bulk=bulk,
     )
 
 
@@ -379,7 +389,13 @@ def delete(
     handle_django_errors: bool | None = None,
     key_attr: str | None = None,
     full_clean: bool | FullCleanOptions = True,
+    bulk: bool = False,
 ) -> Any:
+    """Delete mutation for django input fields.
+
+    When deleting many instances, `bulk=True` deletes them with a single
+    queryset `delete()`.
+    """
     return DjangoDeleteMutation(
         input_type=input_type,
         python_name=None,
@@ -400,4 +416,5 @@ def delete(
         handle_django_errors=handle_django_errors,
         key_attr=key_attr,
         full_clean=full_clean,
+        bulk=bulk,
     )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Callable, Iterable
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
@@ -12,7 +13,13 @@ from typing import (
 )
 
 import strawberry
-from django.db import models, transaction
+from django.core.exceptions import (
+    NON_FIELD_ERRORS,
+    FieldDoesNotExist,
+    ValidationError,
+)
+from django.db import connection, connections, models, router, transaction
+from django.db.models import signals
 from django.db.models.base import Model
 from django.db.models.fields import Field
 from django.db.models.fields.related import ManyToManyField
@@ -35,6 +42,11 @@ from strawberry_django.fields.types import (
 )
 from strawberry_django.settings import strawberry_django_settings
 from strawberry_django.utils.inspect import get_model_fields
+from strawberry_django.utils.signals import (
+    has_blocking_receivers,
+    send_bulk_m2m_add,
+    send_bulk_save,
+)
 
 from .types import (
     FullCleanOptions,
@@ -70,6 +82,710 @@ def _pk_lookup(model: type[Model], key_attr: str | None, value: Any) -> dict[str
     return {key_attr: value}
 
 
+def _supports_bulk_save(model: type[Model]) -> bool:
+    """Check if instances of the model can be saved with bulk queries.
+
+    `bulk_create` and `bulk_update` don't call `save()` nor send the save
+    signals, so models customizing/listening to those need to be saved one by one.
+    Receivers marked with `bulk_aware_receiver` (e.g. the count and permission
+    caches) are notified with `send_bulk_save` instead.
+    """
+    opts = model._meta
+    return (
+        model.save is Model.save
+        and not has_blocking_receivers(signals.pre_save, model)
+        and not has_blocking_receivers(signals.post_save, model)
+        # bulk_create doesn't support multi-table inheritance
+        and all(
+            parent._meta.concrete_model is opts.concrete_model
+            for parent in opts.get_parent_list()
+        )
+    )
+
+
+def _full_clean(
+    instances: Iterable[Model],
+    full_clean: bool | FullCleanOptions = True,
+    *,
+    changed: Iterable[Iterable[str]] | None = None,
+) -> None:
+    """Validate the instances with `full_clean()`, considering its options.
+
+    `changed` are the names of the fields changed in each one of the instances.
+    When it is given and the `only_changed` option is set, only those fields
+    are validated (see `_full_clean_changed`).
+    """
+    if not full_clean:
+        return
+
+    options = full_clean if isinstance(full_clean, dict) else FullCleanOptions()
+    if changed is not None and options.get("only_changed", False):
+        _full_clean_changed(list(instances), [set(c) for c in changed], options)
+        return
+
+    kwargs = {k: v for k, v in options.items() if k != "only_changed"}
+    for instance in instances:
+        instance.full_clean(**kwargs)
+
+
+def _full_clean_changed(
+    instances: list[Model],
+    changed: list[set[str]],
+    options: FullCleanOptions,
+) -> None:
+    """Validate only the changed fields of the instances, plus `Model.clean()`.
+
+    Unique checks and constraints not involving any of the changed fields are
+    skipped, and the unique checks of all the instances are done with a single
+    query per check. Constraints with conditions or expressions are still
+    validated one by one, the same way `full_clean()` does.
+    """
+    exclude = set(options.get("exclude", []))
+    errors_list: list[dict[str, list[ValidationError]]] = []
+    # Maps (model_class, fields) to the lookups of the instances to check for
+    unique_checks: defaultdict[
+        tuple[type[Model], tuple[str, ...]],
+        list[tuple[int, dict[str, Any]]],
+    ] = defaultdict(list)
+    unique_constraints: dict[tuple[type[Model], tuple[str, ...]], Any] = {}
+
+    for index, (instance, names) in enumerate(zip(instances, changed, strict=True)):
+        opts = instance._meta
+        changed_names = {opts.get_field(name).name for name in names}
+        errors: dict[str, list[ValidationError]] = {}
+        try:
+            instance.clean_fields(
+                exclude=exclude
+                | {f.name for f in opts.fields if f.name not in changed_names},
+            )
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+
+        try:
+            instance.clean()
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+
+        # Like full_clean(), only check the fields that passed validation
+        skip = exclude | {name for name in errors if name != NON_FIELD_ERRORS}
+        checks: list[tuple[type[Model], tuple[str, ...]]] = []
+        if options.get("validate_unique", True):
+            field_checks, date_checks = instance._get_unique_checks(exclude=skip)
+            checks.extend((m, tuple(c)) for m, c in field_checks)
+            date_errors = instance._perform_date_checks(
+                [
+                    check
+                    for check in date_checks
+                    if not changed_names.isdisjoint(check[2:])
+                ],
+            )
+            for name, messages in date_errors.items():
+                errors.setdefault(name, []).extend(messages)
+
+        if options.get("validate_constraints", True):
+            using = router.db_for_write(type(instance), instance=instance)
+            for model_class, constraints in instance.get_constraints():
+                for constraint in constraints:
+                    if _is_total_unique_constraint(model_class, constraint):
+                        if skip.isdisjoint(constraint.fields):
+                            check = (model_class, tuple(constraint.fields))
+                            unique_constraints[check] = constraint
+                            checks.append(check)
+                        continue
+
+                    try:
+                        constraint.validate(
+                            model_class,
+                            instance,
+                            exclude=skip,
+                            using=using,
+                        )
+                    except ValidationError as e:
+                        if (
+                            getattr(e, "code", None) == "unique"
+                            and len(constraint.fields) == 1
+                        ):
+                            errors.setdefault(constraint.fields[0], []).append(e)
+                        else:
+                            errors = e.update_error_dict(errors)
+
+        for check in checks:
+            model_class, fields = check
+            if changed_names.isdisjoint(fields):
+                continue
+
+            lookup = _get_unique_lookup(instance, model_class, fields)
+            if lookup is not None:
+                unique_checks[check].append((index, lookup))
+
+        errors_list.append(errors)
+
+    for (model_class, fields), lookups in unique_checks.items():
+        constraint = unique_constraints.get((model_class, fields))
+        for index in _find_unique_conflicts(instances, model_class, lookups):
+            key = fields[0] if len(fields) == 1 else NON_FIELD_ERRORS
+            errors_list[index].setdefault(key, []).append(
+                _unique_error(instances[index], model_class, fields, constraint),
+            )
+
+    for errors in errors_list:
+        if errors:
+            raise ValidationError(errors)
+
+
+def _unique_error(
+    instance: Model,
+    model_class: type[Model],
+    fields: tuple[str, ...],
+    constraint: models.UniqueConstraint | None,
+) -> ValidationError:
+    if (
+        constraint is not None
+        and constraint.violation_error_message
+        != constraint.default_violation_error_message
+    ):
+        return ValidationError(
+            constraint.get_violation_error_message(),
+            code=constraint.violation_error_code,
+        )
+
+    return instance.unique_error_message(model_class, fields)
+
+
+def _validate_unique_in_batch(
+    instances: list[Model],
+    full_clean: bool | FullCleanOptions = True,
+) -> None:
+    """Validate that the instances of a batch don't conflict with each other.
+
+    `full_clean()` only checks the instances against the rows in the database,
+    so two instances of the same batch sharing a unique value would only fail
+    when saving them. Unique fields, `unique_together` and total unique
+    constraints are checked, honoring the same options `full_clean()` does.
+    """
+    if not full_clean or len(instances) <= 1:
+        return
+
+    options = full_clean if isinstance(full_clean, dict) else FullCleanOptions()
+    exclude = set(options.get("exclude", []))
+    checks: dict[tuple[type[Model], tuple[str, ...]], Any] = {}
+    if options.get("validate_unique", True):
+        field_checks, _ = instances[0]._get_unique_checks(exclude=exclude)
+        checks.update(((m, tuple(c)), None) for m, c in field_checks)
+    if options.get("validate_constraints", True):
+        for model_class, constraints in instances[0].get_constraints():
+            for constraint in constraints:
+                if _is_total_unique_constraint(
+                    model_class, constraint
+                ) and exclude.isdisjoint(constraint.fields):
+                    check = (model_class, tuple(constraint.fields))
+                    checks.setdefault(check, constraint)
+
+    for (model_class, fields), constraint in checks.items():
+        seen: dict[tuple, Model] = {}
+        for instance in instances:
+            lookup = _get_unique_lookup(instance, model_class, fields)
+            if lookup is None:
+                continue
+
+            other = seen.setdefault(tuple(lookup.values()), instance)
+            if other is instance or (
+                not other._state.adding
+                and _is_same_row(
+                    instance, model_class, other._get_pk_val(model_class._meta)
+                )
+            ):
+                continue
+
+            key = fields[0] if len(fields) == 1 else NON_FIELD_ERRORS
+            raise ValidationError(
+                {key: [_unique_error(instance, model_class, fields, constraint)]},
+            )
+
+
+def _is_total_unique_constraint(
+    model: type[Model],
+    constraint: models.BaseConstraint,
+) -> bool:
+    """Check if the constraint can be validated as a plain unique check."""
+    return (
+        constraint in model._meta.total_unique_constraints
+        and cast("models.UniqueConstraint", constraint).nulls_distinct is not False
+        and not any(
+            model._meta.get_field(name).generated
+            for name in cast("models.UniqueConstraint", constraint).fields
+        )
+    )
+
+
+def _get_unique_lookup(
+    instance: Model,
+    model_class: type[Model],
+    fields: tuple[str, ...],
+) -> dict[str, Any] | None:
+    """Return the lookup for the rows that would conflict with the instance.
+
+    `None` is returned when there's nothing to check, in the same cases
+    `Model.validate_unique()` would skip the check.
+    """
+    lookup = {}
+    for name in fields:
+        field = instance._meta.get_field(name)
+        value = getattr(instance, field.attname)
+        empty = value == ""  # ruff: ignore[compare-to-empty-string]
+        if value is None or (
+            empty and connection.features.interprets_empty_strings_as_nulls
+        ):
+            return None
+        if field in model_class._meta.pk_fields and not instance._state.adding:
+            return None
+        lookup[name] = value
+
+    return lookup
+
+
+def _is_same_row(instance: Model, model_class: type[Model], pk: Any) -> bool:
+    return (
+        not instance._state.adding
+        and instance._is_pk_set(model_class._meta)
+        and instance._get_pk_val(model_class._meta) == pk
+    )
+
+
+def _find_unique_conflicts(
+    instances: list[Model],
+    model_class: type[Model],
+    lookups: list[tuple[int, dict[str, Any]]],
+) -> set[int]:
+    """Return the indexes of the instances conflicting with existing rows.
+
+    All the lookups are checked with a single query. When a returned row can't
+    be mapped back to the instances (e.g. because of case insensitive
+    collations), each lookup gets checked with a query of its own instead.
+    """
+    manager = model_class._default_manager
+    if len(lookups) > 1:
+        names = list(lookups[0][1])
+        by_values: defaultdict[tuple, list[int]] = defaultdict(list)
+        q = models.Q()
+        for index, lookup in lookups:
+            by_values[tuple(lookup.values())].append(index)
+            q |= models.Q(**lookup)
+
+        conflicts = set()
+        for pk, *values in manager.filter(q).values_list("pk", *names):
+            indexes = by_values.get(tuple(values))
+            if indexes is None:
+                break
+            conflicts.update(
+                index
+                for index in indexes
+                if not _is_same_row(instances[index], model_class, pk)
+            )
+        else:
+            return conflicts
+
+    conflicts = set()
+    for index, lookup in lookups:
+        instance = instances[index]
+        qs = manager.filter(**lookup)
+        if not instance._state.adding and instance._is_pk_set(model_class._meta):
+            qs = qs.exclude(pk=instance._get_pk_val(model_class._meta))
+        if qs.exists():
+            conflicts.add(index)
+
+    return conflicts
+
+
+def _get_bulk_m2m_pks(
+    field: ManyToManyField | ForeignObjectRel,
+    value: Any,
+    key_attr: str | None = None,
+) -> list[Any] | None:
+    """Return the pks to relate a newly created instance to, through `field`.
+
+    `None` is returned when the value can't be written directly to the through
+    table (e.g. it contains nested data or the through model is a custom one),
+    meaning that `update_m2m` needs to handle it instead.
+    """
+    if not isinstance(field, ManyToManyField):
+        return None
+
+    through = cast("type[Model]", field.remote_field.through)
+    if not through._meta.auto_created or has_blocking_receivers(
+        signals.m2m_changed,
+        through,
+    ):
+        return None
+
+    if isinstance(value, ParsedObjectList):
+        if value.remove or (isinstance(value.set, list) and value.add):
+            return None
+        values = value.set if isinstance(value.set, list) else value.add
+    else:
+        values = value
+
+    if not isinstance(values, list):
+        return None
+
+    related_model = cast("type[Model]", field.related_model)
+    pk_field = related_model._meta.pk
+    assert pk_field is not None
+
+    pks = []
+    for v in values:
+        if isinstance(v, ParsedObject):
+            if v.data:
+                return None
+            v = v.pk  # ruff: ignore[redefined-loop-name]
+
+        if isinstance(v, related_model):
+            pks.append(v.pk)
+        elif isinstance(v, (str, int)) and "pk" in _pk_lookup(
+            related_model, key_attr, v
+        ):
+            pks.append(pk_field.to_python(v))
+        else:
+            return None
+
+    return list(dict.fromkeys(pks))
+
+
+def _bulk_create_m2m(
+    info: Info,
+    instances: list[Model],
+    m2m_values: list[list[tuple[ManyToManyField | ForeignObjectRel, Any]]],
+    key_attr: str | None = None,
+    full_clean: bool | FullCleanOptions = True,
+):
+    """Set the m2m values of newly created instances.
+
+    Plain relations to existing objects are inserted in the through tables
+    with a single query per field, the rest are handled by `update_m2m`.
+    """
+    rows: dict[ManyToManyField, list[tuple[Any, Any]]] = {}
+    for instance, m2m in zip(instances, m2m_values, strict=True):
+        for field, value in m2m:
+            if value in (None, UNSET):  # ruff: ignore[literal-membership]
+                continue
+
+            pks = _get_bulk_m2m_pks(field, value, key_attr)
+            if pks is None:
+                update_m2m(info, instance, field, value, key_attr, full_clean)
+            else:
+                rows.setdefault(cast("ManyToManyField", field), []).extend(
+                    (instance.pk, pk) for pk in pks
+                )
+
+    for field, pairs in rows.items():
+        related_model = cast("type[Model]", field.related_model)
+        related_pks = {pk for _, pk in pairs}
+        found = set(
+            related_model._default_manager.filter(pk__in=related_pks).values_list(
+                "pk",
+                flat=True,
+            ),
+        )
+        if found != related_pks:
+            raise related_model.DoesNotExist(
+                f"{related_model._meta.object_name} matching query does not exist."
+            )
+
+        through = cast("type[Model]", field.remote_field.through)
+        source_attname = through._meta.get_field(field.m2m_field_name()).attname
+        target_attname = through._meta.get_field(field.m2m_reverse_field_name()).attname
+        through._default_manager.bulk_create(
+            [
+                through(**{source_attname: source_pk, target_attname: target_pk})
+                for source_pk, target_pk in pairs
+            ],
+        )
+        send_bulk_m2m_add(
+            through,
+            related_model,
+            related_pks,
+            using=router.db_for_write(through),
+        )
+
+
+def _get_reference_key(
+    model: type[Model],
+    key_attr: str | None,
+    value: Any,
+) -> tuple[str, Any] | None:
+    """Return the lookup and key `value` references an existing instance of `model` by.
+
+    `ParsedObject` references are looked up by `pk`, the same way
+    `ParsedObject.parse` does, and the rest by `key_attr`. `None` is returned
+    when `value` is not a reference by key, or when it can't be fetched with
+    `in_bulk` (i.e. the key field is not unique).
+    """
+    if isinstance(value, ParsedObject):
+        lookup = "pk"
+        value = value.pk
+    else:
+        if key_attr is None:
+            settings = strawberry_django_settings()
+            key_attr = settings["DEFAULT_PK_FIELD_NAME"]
+
+        if isinstance(value, dict):
+            value = value.get(key_attr)
+        (lookup,) = _pk_lookup(model, key_attr, value)
+
+    if not isinstance(value, (str, int)) or isinstance(value, bool):
+        return None
+
+    try:
+        field = model._meta.pk if lookup == "pk" else model._meta.get_field(lookup)
+    except FieldDoesNotExist:
+        return None
+
+    if not isinstance(field, Field) or not field.unique:
+        return None
+
+    try:
+        return lookup, field.to_python(value)
+    except ValidationError:
+        return None
+
+
+def _replace_reference(value: Any, obj: Model, key_attr: str | None) -> Any:
+    """Replace the key in the `value` reference by the `obj` instance itself."""
+    if isinstance(value, ParsedObject):
+        return dataclasses.replace(value, pk=obj)
+
+    if isinstance(value, dict):
+        if key_attr is None:
+            settings = strawberry_django_settings()
+            key_attr = settings["DEFAULT_PK_FIELD_NAME"]
+
+        return ParsedObject(
+            pk=obj,
+            data={k: v for k, v in value.items() if k != key_attr},
+        )
+
+    return obj
+
+
+def _fetch_references(
+    references: dict[tuple[type[Model], str], set[Any]],
+) -> dict[tuple[type[Model], str], dict[Any, Model]]:
+    """Fetch the referenced instances of each model and lookup with a single query."""
+    fetched = {}
+    for (model, lookup), keys in references.items():
+        fetched[model, lookup] = model._default_manager.in_bulk(
+            keys,
+            field_name=lookup,
+        )
+
+    return fetched
+
+
+def _bulk_parse_pks(
+    model: type[Model],
+    values: list[Any],
+    *,
+    key_attr: str | None = None,
+) -> list[Any]:
+    """Resolve the references to existing objects in `values` with a single query.
+
+    References by key (plain keys, `ParsedObject` and dicts containing the key)
+    are replaced by their instance, so that `_parse_pk` doesn't need to fetch
+    them one by one. References that can't be resolved are returned untouched,
+    meaning `_parse_pk` will handle them (and raise its usual errors).
+    """
+    keys = [_get_reference_key(model, key_attr, v) for v in values]
+    if all(k is None for k in keys):
+        return values
+
+    references: dict[tuple[type[Model], str], set[Any]] = {}
+    for k in keys:
+        if k is not None:
+            references.setdefault((model, k[0]), set()).add(k[1])
+    instances = _fetch_references(references)
+
+    parsed = []
+    for v, k in zip(values, keys, strict=True):
+        obj = instances[model, k[0]].get(k[1]) if k is not None else None
+        parsed.append(v if obj is None else _replace_reference(v, obj, key_attr))
+
+    return parsed
+
+
+def _is_new_object(value: Any, key_attr: str | None) -> bool:
+    """Check if `value` is the data of an object to be created by `_parse_pk`."""
+    if isinstance(value, ParsedObject):
+        return value.pk in (None, UNSET)  # ruff: ignore[literal-membership]
+
+    if isinstance(value, dict):
+        if key_attr is None:
+            settings = strawberry_django_settings()
+            key_attr = settings["DEFAULT_PK_FIELD_NAME"]
+
+        return value.get(key_attr, UNSET) is UNSET
+
+    return False
+
+
+def _map_references(
+    model: type[Model],
+    data: dict[str, Any],
+    key_attr: str | None,
+    func: Callable[[type[Model], str | None, Any], Any],
+) -> dict[str, Any]:
+    """Call `func` for each reference to an existing object in `data`.
+
+    The references are replaced by the return value of `func`. This follows
+    the same paths, and the same `key_attr` for each one of them, that
+    `prepare_create_update` and `update_m2m` will use to parse them.
+    """
+    fields = get_model_fields(model)
+
+    def map_value(
+        related_model: type[Model],
+        ref_key_attr: str | None,
+        value: Any,
+        *,
+        nested: bool = True,
+    ):
+        if nested and isinstance(value, ParsedObject) and value.data:
+            value = dataclasses.replace(
+                value,
+                data=_map_references(related_model, value.data, ref_key_attr, func),
+            )
+        elif nested and isinstance(value, dict):
+            value = _map_references(related_model, value, ref_key_attr, func)
+
+        return func(related_model, ref_key_attr, value)
+
+    def map_list(related_model: type[Model], values: Any):
+        if not isinstance(values, list):
+            return values
+
+        # update_m2m sets the data of existing objects as is,
+        # only the data of the objects it creates gets parsed
+        return [
+            map_value(
+                related_model,
+                key_attr,
+                v,
+                nested=_is_new_object(v, key_attr),
+            )
+            for v in values
+        ]
+
+    mapped = {}
+    for name, value in data.items():
+        field = fields.get(name)
+        related_model = cast(
+            "type[Model] | None",
+            getattr(field, "related_model", None),
+        )
+        if (
+            field is None
+            or related_model is None
+            or not isinstance(related_model, type)
+            or value in (None, UNSET)  # ruff: ignore[literal-membership]
+        ):
+            pass
+        elif isinstance(field, (models.ForeignKey, OneToOneRel)):
+            # Foreign keys given as ParsedObject/str are parsed with key_attr
+            # by prepare_create_update, other values use the default one.
+            ref_key_attr = (
+                key_attr
+                if isinstance(value, (ParsedObject, str))
+                or isinstance(field, OneToOneRel)
+                else None
+            )
+            value = map_value(  # ruff: ignore[redefined-loop-name]
+                related_model,
+                ref_key_attr,
+                value,
+            )
+        elif isinstance(field, (ManyToManyField, ForeignObjectRel)):
+            if isinstance(value, ParsedObjectList):
+                value = dataclasses.replace(  # ruff: ignore[redefined-loop-name]
+                    value,
+                    add=map_list(related_model, value.add),
+                    remove=map_list(related_model, value.remove),
+                    set=map_list(related_model, value.set),
+                )
+            else:
+                value = map_list(related_model, value)  # ruff: ignore[redefined-loop-name]
+
+        mapped[name] = value
+
+    return mapped
+
+
+@overload
+def resolve_references(
+    model: type[Model],
+    data: dict[str, Any],
+    *,
+    key_attr: str | None = None,
+) -> dict[str, Any]: ...
+
+
+@overload
+def resolve_references(
+    model: type[Model],
+    data: list[dict[str, Any]],
+    *,
+    key_attr: str | None = None,
+) -> list[dict[str, Any]]: ...
+
+
+def resolve_references(
+    model: type[Model],
+    data: dict[str, Any] | list[dict[str, Any]],
+    *,
+    key_attr: str | None = None,
+) -> dict[str, Any] | list[dict[str, Any]]:
+    """Fetch all the objects referenced by key in the parsed input `data`.
+
+    The whole input tree is traversed first to gather the referenced keys of
+    each model, which are then fetched with a single `in_bulk` query per model.
+    The references get replaced by their instances, so that they don't need
+    to be fetched one by one while creating/updating the objects.
+    """
+    data_list = data if isinstance(data, list) else [data]
+    if not all(isinstance(d, dict) for d in data_list):
+        return data
+
+    references: dict[tuple[type[Model], str], set[Any]] = {}
+
+    def collect(related_model: type[Model], ref_key_attr: str | None, value: Any):
+        key = _get_reference_key(related_model, ref_key_attr, value)
+        if key is not None:
+            lookup, ref_key = key
+            references.setdefault((related_model, lookup), set()).add(ref_key)
+        return value
+
+    for d in data_list:
+        _map_references(model, d, key_attr, collect)
+
+    if not references:
+        return data
+
+    fetched = _fetch_references(references)
+
+    def replace(related_model: type[Model], ref_key_attr: str | None, value: Any):
+        key = _get_reference_key(related_model, ref_key_attr, value)
+        if key is None:
+            return value
+
+        lookup, ref_key = key
+        obj = fetched[related_model, lookup].get(ref_key)
+        if obj is None:
+            return value
+
+        return _replace_reference(value, obj, ref_key_attr)
+
+    resolved = [_map_references(model, d, key_attr, replace) for d in data_list]
+    return resolved if isinstance(data, list) else resolved[0]
+
+
 def _parse_pk(
     value: ParsedObject | strawberry.ID | _M | None,
     model: type[_M],
@@ -183,29 +899,99 @@ def parse_input(
     data: Any,
     *,
     key_attr: str | None = None,
+):
+    return _parse_input(
+        info,
+        data,
+        key_attr=key_attr,
+        nodes=_resolve_global_ids(info, data),
+    )
+
+
+def _iter_global_ids(data: Any) -> Iterator[relay.GlobalID]:
+    if isinstance(data, Some):
+        yield from _iter_global_ids(data.value)
+    elif isinstance(data, relay.GlobalID):
+        yield data
+    elif isinstance(data, dict):
+        for v in data.values():
+            yield from _iter_global_ids(v)
+    elif isinstance(data, list):
+        for v in data:
+            yield from _iter_global_ids(v)
+    elif dataclasses.is_dataclass(data) and not isinstance(data, type):
+        for f in dataclasses.fields(data):
+            yield from _iter_global_ids(getattr(data, f.name))
+
+
+def _resolve_global_ids(info: Info, data: Any) -> dict[relay.GlobalID, Any]:
+    """Resolve the `GlobalID`s in the input `data` with one query per type.
+
+    Types with a single `GlobalID` in the input are left for `_parse_input`
+    to resolve, as are the ids that were not found (so that it raises its
+    usual errors for them).
+    """
+    by_type: dict[str, list[relay.GlobalID]] = {}
+    for global_id in _iter_global_ids(data):
+        by_type.setdefault(global_id.type_name, []).append(global_id)
+
+    nodes = {}
+    for global_ids in by_type.values():
+        unique_ids = list(dict.fromkeys(global_ids))
+        if len(unique_ids) == 1:
+            continue
+
+        node_type = unique_ids[0].resolve_type(info)
+        resolved = node_type.resolve_nodes(
+            info=info,
+            node_ids=[global_id.node_id for global_id in unique_ids],
+            required=False,
+        )
+        nodes.update(
+            (global_id, node)
+            for global_id, node in zip(unique_ids, resolved, strict=True)
+            if node is not None
+        )
+
+    return nodes
+
+
+def _parse_input(
+    info: Info,
+    data: Any,
+    *,
+    key_attr: str | None,
+    nodes: dict[relay.GlobalID, Any],
 ):
     if isinstance(data, Some):
-        return parse_input(info, data.value, key_attr=key_attr)
+        return _parse_input(info, data.value, key_attr=key_attr, nodes=nodes)
 
     if isinstance(data, dict):
-        return {k: parse_input(info, v, key_attr=key_attr) for k, v in data.items()}
+        return {
+            k: _parse_input(info, v, key_attr=key_attr, nodes=nodes)
+            for k, v in data.items()
+        }
 
     if isinstance(data, list):
-        return [parse_input(info, v, key_attr=key_attr) for v in data]
+        return [_parse_input(info, v, key_attr=key_attr, nodes=nodes) for v in data]
 
     if isinstance(data, relay.GlobalID):
-        return data.resolve_node_sync(info, required=True)
+        node = nodes.get(data)
+        return node if node is not None else data.resolve_node_sync(info, required=True)
 
     if isinstance(data, NodeInput):
         pk = cast(
-            "Any", parse_input(info, getattr(data, "id", UNSET), key_attr=key_attr)
+            "Any",
+            _parse_input(
+                info, getattr(data, "id", UNSET), key_attr=key_attr, nodes=nodes
+            ),
         )
         parsed = {}
         for field in dataclasses.fields(data):
             if field.name == "id":
                 continue
-            parsed[field.name] = parse_input(
-                info, getattr(data, field.name), key_attr=key_attr
+            parsed[field.name] = _parse_input(
+                info, getattr(data, field.name), key_attr=key_attr, nodes=nodes
             )
 
         return ParsedObject(
@@ -215,27 +1001,31 @@ def parse_input(
 
     if isinstance(data, (OneToOneInput, OneToManyInput)):
         return ParsedObject(
-            pk=parse_input(info, data.set, key_attr=key_attr),
+            pk=_parse_input(info, data.set, key_attr=key_attr, nodes=nodes),
         )
 
     if isinstance(data, (ManyToOneInput, ManyToManyInput, ListInput)):
         d = getattr(data, "data", None)
         if dataclasses.is_dataclass(d):
             d = {
-                f.name: parse_input(info, getattr(data, f.name), key_attr=key_attr)
+                f.name: _parse_input(
+                    info, getattr(data, f.name), key_attr=key_attr, nodes=nodes
+                )
                 for f in dataclasses.fields(d)
             }
 
         return ParsedObjectList(
             add=cast(
-                "list[InputListTypes]", parse_input(info, data.add, key_attr=key_attr)
+                "list[InputListTypes]",
+                _parse_input(info, data.add, key_attr=key_attr, nodes=nodes),
             ),
             remove=cast(
                 "list[InputListTypes]",
-                parse_input(info, data.remove, key_attr=key_attr),
+                _parse_input(info, data.remove, key_attr=key_attr, nodes=nodes),
             ),
             set=cast(
-                "list[InputListTypes]", parse_input(info, data.set, key_attr=key_attr)
+                "list[InputListTypes]",
+                _parse_input(info, data.set, key_attr=key_attr, nodes=nodes),
             ),
         )
 
@@ -244,7 +1034,9 @@ def parse_input(
 
     if dataclasses.is_dataclass(data):
         return {
-            f.name: parse_input(info, getattr(data, f.name), key_attr=key_attr)
+            f.name: _parse_input(
+                info, getattr(data, f.name), key_attr=key_attr, nodes=nodes
+            )
             for f in dataclasses.fields(data)
         }
 
@@ -423,6 +1215,8 @@ def _create(
     exclude_m2m: list[str] | None = None,
 ) -> list[_M] | _M:
     model = manager.model
+    data = resolve_references(model, data, key_attr=key_attr)
+
     # Before creating your instance, verify this is not a bulk create
     # if so, add them one by one. Otherwise, get to work.
     if isinstance(data, list):
@@ -467,9 +1261,7 @@ def _create(
     # Creating the instance directly via create() without full-clean will
     # raise ugly error messages. To generate user-friendly ones, we want
     # full-clean() to trigger form-validation style error messages.
-    full_clean_options = full_clean if isinstance(full_clean, dict) else {}
-    if full_clean:
-        dummy_instance.full_clean(**full_clean_options)
+    _full_clean([dummy_instance], full_clean)
 
     # Create the instance using the manager create method to respect
     # manager create overrides. This also ensures support for proxy-models.
@@ -481,6 +1273,52 @@ def _create(
     return instance
 
 
+@transaction.atomic
+def bulk_create(
+    info: Info,
+    model: type[_M],
+    data: list[dict[str, Any]],
+    *,
+    key_attr: str | None = None,
+    full_clean: bool | FullCleanOptions = True,
+) -> list[_M]:
+    """Create a list of instances using `bulk_create`.
+
+    All the inputs are validated before inserting any of them. Models
+    customizing `save()` or with save signals receivers are created one by
+    one with `create` instead.
+    """
+    db = router.db_for_write(model)
+    if (
+        not _supports_bulk_save(model)
+        or not connections[db].features.can_return_rows_from_bulk_insert
+    ):
+        return create(info, model, data, key_attr=key_attr, full_clean=full_clean)
+
+    data = resolve_references(model, data, key_attr=key_attr)
+    instances = []
+    m2m_values = []
+    for d in data:
+        dummy_instance = model()
+        _, create_kwargs, m2m = prepare_create_update(
+            info=info,
+            instance=dummy_instance,
+            data=d,
+            key_attr=key_attr,
+            full_clean=full_clean,
+        )
+        _full_clean([dummy_instance], full_clean)
+        instances.append(model(**create_kwargs))
+        m2m_values.append(m2m)
+
+    _validate_unique_in_batch(instances, full_clean)
+    instances = model._default_manager.bulk_create(instances)
+    send_bulk_save(model, instances, created=True, using=db)
+    _bulk_create_m2m(info, instances, m2m_values, key_attr, full_clean)
+
+    return instances
+
+
 @overload
 def update(
     info: Info,
@@ -525,6 +1363,9 @@ def update(
 
     if isinstance(instance, Iterable):
         instances = list(instance)
+        if instances:
+            data = resolve_references(type(instances[0]), data, key_attr=key_attr)
+
         return [
             update(
                 info,
@@ -538,7 +1379,8 @@ def update(
             for instance in instances
         ]
 
-    instance, _, m2m = prepare_create_update(
+    data = resolve_references(type(instance), data, key_attr=key_attr)
+    instance, direct_field_values, m2m = prepare_create_update(
         info=info,
         instance=instance,
         data=data,
@@ -550,9 +1392,7 @@ def update(
     if pre_save_hook is not None:
         pre_save_hook(instance)
 
-    full_clean_options = full_clean if isinstance(full_clean, dict) else {}
-    if full_clean:
-        instance.full_clean(**full_clean_options)  # type: ignore
+    _full_clean([instance], full_clean, changed=[direct_field_values])
 
     instance.save()
 
@@ -564,6 +1404,92 @@ def update(
     return instance
 
 
+@transaction.atomic
+def bulk_update(
+    info: Info,
+    instance: Iterable[_M],
+    data: dict[str, Any] | list[dict[str, Any]],
+    *,
+    key_attr: str | None = None,
+    full_clean: bool | FullCleanOptions = True,
+) -> list[_M]:
+    """Update a list of instances using `bulk_update`.
+
+    `data` is either applied to all the instances, or is a list with the data
+    for each one of them. All the instances are validated before updating any
+    of them. Models customizing `save()` or with save signals receivers are
+    updated one by one with `update` instead.
+    """
+    if isinstance(instance, LazyObject):
+        instance = cast("Iterable[_M]", instance.__reduce__()[1][0])
+
+    instances = list(instance)
+    data_list = data if isinstance(data, list) else [data] * len(instances)
+    if not instances:
+        return instances
+
+    model = type(instances[0])
+    data_list = resolve_references(model, data_list, key_attr=key_attr)
+    if not _supports_bulk_save(model):
+        return [
+            update(info, i, d, key_attr=key_attr, full_clean=full_clean)
+            for i, d in zip(instances, data_list, strict=True)
+        ]
+
+    opts = model._meta
+    fields: dict[str, Field] = {}
+    changed = []
+    m2m_values = []
+    for i, d in zip(instances, data_list, strict=True):
+        _, direct_field_values, m2m = prepare_create_update(
+            info=info,
+            instance=i,
+            data=d,
+            key_attr=key_attr,
+            full_clean=full_clean,
+        )
+        for name in direct_field_values:
+            field = opts.get_field(name)
+            if field.concrete and not field.many_to_many and not field.primary_key:
+                fields[field.name] = cast("Field", field)
+
+        changed.append(direct_field_values)
+        m2m_values.append(m2m)
+
+    _full_clean(instances, full_clean, changed=changed)
+    _validate_unique_in_batch(instances, full_clean)
+
+    # Fields like auto_now ones get updated on save(), even when not in the input
+    fields.update(
+        (f.name, f)
+        for f in opts.concrete_fields
+        if getattr(f, "auto_now", False) and not f.primary_key
+    )
+    if fields:
+        for i in instances:
+            # Give the fields a chance to prepare their values, the same way
+            # save() does (e.g. to commit files or to set auto_now values)
+            for field in fields.values():
+                setattr(i, field.attname, field.pre_save(i, False))
+
+        model._default_manager.bulk_update(instances, list(fields))
+        send_bulk_save(
+            model,
+            instances,
+            created=False,
+            update_fields=fields,
+            using=router.db_for_write(model),
+        )
+
+    for i, m2m in zip(instances, m2m_values, strict=True):
+        if m2m:
+            for field, value in m2m:
+                update_m2m(info, i, field, value, key_attr, full_clean)
+            i.refresh_from_db()
+
+    return instances
+
+
 @overload
 def delete(
     info: Info,
@@ -606,6 +1532,34 @@ def delete(info: Info, instance: _M | Iterable[_M], *, data=None) -> _M | list[_
     return instances if many else instances[0]
 
 
+@transaction.atomic
+def bulk_delete(
+    info: Info,
+    instance: Iterable[_M],
+    *,
+    data: dict[str, Any] | None = None,
+) -> list[_M]:
+    """Delete a list of instances with a single queryset `delete()`.
+
+    Signals are still sent by the queryset deletion, but models customizing
+    `delete()` are deleted one by one with `delete` instead.
+    """
+    if isinstance(instance, LazyObject):
+        instance = cast("Iterable[_M]", instance.__reduce__()[1][0])
+
+    instances = list(instance)
+    if not instances:
+        return instances
+
+    model = type(instances[0])
+    if model.delete is not Model.delete:
+        return delete(info, instances, data=data)
+
+    model._base_manager.filter(pk__in=[i.pk for i in instances]).delete()
+
+    return instances
+
+
 def update_field(info: Info, instance: Model, field: models.Field, value: Any):
     if value is UNSET:
         return
@@ -677,7 +1631,7 @@ def update_m2m(
     to_delete = []
     need_remove_cache = False
 
-    full_clean_options = full_clean if isinstance(full_clean, dict) else {}
+    related_model = cast("type[Model]", manager.model)
 
     values = value.set if isinstance(value, ParsedObjectList) else value
     if isinstance(values, list):
@@ -686,12 +1640,15 @@ def update_m2m(
         if isinstance(value, ParsedObjectList) and getattr(value, "remove", None):
             raise ValueError("'remove' cannot be used together with 'set'")
 
-        existing = set(manager.all())
+        # Diff on pks only, there's no need to load the related instances
+        existing = set(manager.values_list("pk", flat=True))
+        remaining = set(existing)
+        through_values: list[tuple[Model, dict[str, Any]]] = []
         need_remove_cache = need_remove_cache or bool(values)
-        for v in values:
+        for v in _bulk_parse_pks(related_model, values, key_attr=key_attr):
             obj, data = _parse_data(
                 info,
-                cast("type[Model]", manager.model),
+                related_model,
                 v,
                 key_attr=key_attr,
                 full_clean=full_clean,
@@ -702,37 +1659,15 @@ def update_m2m(
                 if data:
                     for k, inner_value in data.items():
                         setattr(obj, k, inner_value)
-                    if full_clean:
-                        obj.full_clean(**full_clean_options)
+                    _full_clean([obj], full_clean, changed=[data])
                     obj.save()
 
                 if hasattr(manager, "through"):
-                    manager = cast("ManyToManyRelatedManager", manager)
-                    intermediate_model = manager.through
-                    try:
-                        im = intermediate_model._default_manager.get(
-                            **{
-                                manager.source_field_name: instance,  # type: ignore
-                                manager.target_field_name: obj,  # type: ignore
-                            },
-                        )
-                    except intermediate_model.DoesNotExist:
-                        im = intermediate_model(
-                            **{
-                                manager.source_field_name: instance,  # type: ignore
-                                manager.target_field_name: obj,  # type: ignore
-                            },
-                        )
-
-                    for k, inner_value in through_defaults.items():
-                        setattr(im, k, inner_value)
-                    if full_clean:
-                        im.full_clean(**full_clean_options)
-                    im.save()
-                elif obj not in existing:
+                    through_values.append((obj, through_defaults))
+                elif obj.pk not in existing:
                     to_add.append(obj)
 
-                existing.discard(obj)
+                remaining.discard(obj.pk)
             else:
                 # If we've reached here, the key_attr should be UNSET or missing. So
                 # let's remove it if it is there.
@@ -745,28 +1680,38 @@ def update_m2m(
                     full_clean=full_clean,
                     exclude_m2m=exclude_m2m,
                 )
-                existing.discard(obj)
+                remaining.discard(obj.pk)
 
-        for remaining in existing:
-            if use_remove:
-                to_remove.append(remaining)
-            else:
-                to_delete.append(remaining)
+        if through_values:
+            _set_m2m_through(
+                cast("ManyToManyRelatedManager", manager),
+                instance,
+                through_values,
+                existing,
+                full_clean=full_clean,
+            )
+
+        if remaining and not use_remove:
+            to_delete.extend(remaining)
+        elif remaining and hasattr(manager, "through"):
+            to_remove.extend(remaining)
+        elif remaining:
+            # Reverse foreign key managers can only remove instances
+            to_remove.extend(manager.filter(pk__in=remaining))
 
     else:
         need_remove_cache = need_remove_cache or bool(value.add)
-        for v in value.add or []:
+        for v in _bulk_parse_pks(related_model, value.add or [], key_attr=key_attr):
             obj, data = _parse_data(
                 info,
-                cast("type[Model]", manager.model),
+                related_model,
                 v,
                 key_attr=key_attr,
                 full_clean=full_clean,
             )
             if obj and data:
                 data.pop(key_attr, None)
-                if full_clean:
-                    obj.full_clean(**full_clean_options)
+                _full_clean([obj], full_clean)
                 manager.add(obj, **data)
             elif obj:
                 # Do this later in a bulk
@@ -788,10 +1733,14 @@ def update_m2m(
                 raise AssertionError
 
         need_remove_cache = need_remove_cache or bool(value.remove)
-        for v in value.remove or []:
+        for v in _bulk_parse_pks(
+            related_model,
+            value.remove or [],
+            key_attr=key_attr,
+        ):
             obj, data = _parse_data(
                 info,
-                cast("type[Model]", manager.model),
+                related_model,
                 v,
                 key_attr=key_attr,
                 full_clean=full_clean,
@@ -805,7 +1754,82 @@ def update_m2m(
     if to_remove:
         manager.remove(*to_remove)
     if to_delete:
-        manager.filter(pk__in=[item.pk for item in to_delete]).delete()
+        manager.filter(pk__in=to_delete).delete()
 
     if need_remove_cache:
         manager._remove_prefetched_objects()  # type: ignore
+
+
+def _set_m2m_through(
+    manager: ManyToManyRelatedManager,
+    instance: Model,
+    values: list[tuple[Model, dict[str, Any]]],
+    existing: set[Any],
+    *,
+    full_clean: bool | FullCleanOptions = True,
+):
+    """Make sure there's a through model row relating `instance` to each value.
+
+    Missing rows are inserted with a single `bulk_create`. Existing rows are
+    fetched in a single query and only saved when they have `through_defaults`
+    to apply. Auto created through models have nothing to update, so their
+    existing rows are not even fetched.
+    """
+    through = cast("type[Model]", manager.through)
+    source_field_name = cast("str", manager.source_field_name)  # type: ignore
+    target_field_name = cast("str", manager.target_field_name)  # type: ignore
+    target_field = cast("models.ForeignKey", through._meta.get_field(target_field_name))
+    target_attname = target_field.target_field.attname
+
+    if through._meta.auto_created:
+        existing_rows = dict.fromkeys(existing)
+    else:
+        existing_rows = {
+            getattr(im, target_field.attname): im
+            for im in through._default_manager.filter(
+                **{
+                    source_field_name: instance,
+                    f"{target_field_name}__in": [obj for obj, _ in values],
+                },
+            )
+        }
+
+    to_create = {}
+    for obj, through_defaults in values:
+        key = getattr(obj, target_attname)
+        if key not in existing_rows:
+            im = to_create.get(key)
+            if im is None:
+                im = to_create[key] = through(
+                    **{source_field_name: instance, target_field_name: obj},
+                )
+            for k, inner_value in through_defaults.items():
+                setattr(im, k, inner_value)
+            continue
+
+        im = existing_rows[key]
+        if im is None or not through_defaults:
+            continue
+
+        for k, inner_value in through_defaults.items():
+            setattr(im, k, inner_value)
+        _full_clean([im], full_clean, changed=[through_defaults])
+        im.save()
+
+    if not to_create:
+        return
+
+    if not through._meta.auto_created:
+        _full_clean(to_create.values(), full_clean)
+
+    if _supports_bulk_save(through):
+        through._default_manager.bulk_create(to_create.values())
+        send_bulk_save(
+            through,
+            to_create.values(),
+            created=True,
+            using=router.db_for_write(through),
+        )
+    else:
+        for im in to_create.values():
+            im.save()
@@ -18,6 +18,7 @@ class FullCleanOptions(TypedDict, total=False):
     exclude: list[str]
     validate_unique: bool
     validate_constraints: bool
+    only_changed: bool
 
 
 @dataclasses.dataclass
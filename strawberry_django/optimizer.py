@@ -5,7 +5,9 @@ import contextvars
 import copy
 import dataclasses
 import itertools
-from collections.abc import Callable
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -31,7 +33,9 @@ from graphql import (
     GraphQLObjectType,
     GraphQLOutputType,
     GraphQLWrappingType,
+    Visitor,
     get_argument_values,
+    visit,
 )
 from graphql.language.ast import OperationType
 from graphql.type.definition import GraphQLResolveInfo, get_named_type
@@ -90,8 +94,10 @@ if TYPE_CHECKING:
 
 
 __all__ = [
+    "CompiledOptimizerStore",
     "DjangoOptimizerExtension",
     "OptimizerConfig",
+    "OptimizerPlanCache",
     "OptimizerStore",
     "PrefetchType",
     "optimize",
@@ -103,6 +109,25 @@ _sentinel = object()
 _annotate_placeholder = "__annotated_placeholder__"
 
 
+@dataclasses.dataclass
+class _PlanState:
+    depends_on_request: bool = False
+
+
+# Set while computing an optimizer plan, to know if it can be replayed for
+# other requests (see `OptimizerPlanCache`)
+_plan_state: contextvars.ContextVar[_PlanState | None] = contextvars.ContextVar(
+    "optimizer-plan-state",
+    default=None,
+)
+
+
+def _mark_plan_depends_on_request():
+    state = _plan_state.get()
+    if state is not None:
+        state.depends_on_request = True
+
+
 @dataclasses.dataclass
 class OptimizerConfig:
     """Django optimization configuration.
@@ -280,42 +305,124 @@ class OptimizerStore:
         config: OptimizerConfig | None = None,
     ) -> QuerySet[_M]:
         """Apply this store optimizations to the given queryset."""
-        config = config or OptimizerConfig()
+        return self.compile(info=info, config=config).apply(qs)
 
-        qs = self._apply_prefetch_related(
-            qs,
-            info=info,
-            config=config,
-        )
-        qs, extra_only_set = self._apply_select_related(
-            qs,
-            info=info,
+    def compile(
+        self,
+        *,
+        info: GraphQLResolveInfo,
+        config: OptimizerConfig | None = None,
+    ) -> CompiledOptimizerStore:
+        """Flatten this store into the operations to apply to a queryset.
+
+        Any prefetch/annotate callables are resolved and duplicated lookups
+        are removed, so that the returned `CompiledOptimizerStore` can apply
+        all of them at once.
+        """
+        config = config or OptimizerConfig()
+        strawberry_info: Info | None = None
+
+        prefetch_related: list[str | Prefetch] = []
+        if config.enable_prefetch_related:
+            for p in self.prefetch_related:
+                if isinstance(p, Callable):
+                    assert_type(p, PrefetchCallable)
+                    strawberry_info = strawberry_info or _create_strawberry_info(info)
+                    p = p(strawberry_info)  # ruff: ignore[redefined-loop-name]
+                prefetch_related.append(p)
+
+        annotate: dict[str, BaseExpression | Combinable] = {}
+        if config.enable_annotate:
+            for k, v in self.annotate.items():
+                if isinstance(v, Callable):
+                    assert_type(v, AnnotateCallable)
+                    strawberry_info = strawberry_info or _create_strawberry_info(info)
+                    v = v(strawberry_info)  # ruff: ignore[redefined-loop-name]
+                annotate[k] = v
+
+        return CompiledOptimizerStore(
+            only=tuple(dict.fromkeys(self.only)),
+            select_related=tuple(dict.fromkeys(self.select_related)),
+            prefetch_related=tuple(prefetch_related),
+            annotate=annotate,
             config=config,
         )
-        qs = self._apply_only(
-            qs,
-            info=info,
-            config=config,
-            extra_only_set=extra_only_set,
+
+
+@dataclasses.dataclass
+class CompiledOptimizerStore:
+    """An `OptimizerStore` flattened into the operations to apply to a queryset.
+
+    Instead of calling `prefetch_related`, `select_related`, `only` and
+    `annotate` one after another, which would clone the queryset for each one
+    of them, all of the lookups are applied to a single clone.
+
+    Attributes
+    ----------
+        only:
+            Deduplicated values to optimize using `QuerySet.only`
+        select_related:
+            Deduplicated values to optimize using `QuerySet.select_related`
+        prefetch_related:
+            Values to optimize using `QuerySet.prefetch_related`, with callables
+            already resolved
+        annotate:
+            Dict of resolved values to use in `QuerySet.annotate`
+        config:
+            The config used to compile the store
+
+    """
+
+    only: tuple[str, ...]
+    select_related: tuple[str, ...]
+    prefetch_related: tuple[str | Prefetch, ...]
+    annotate: dict[str, BaseExpression | Combinable]
+    config: OptimizerConfig
+
+    def apply(self, qs: QuerySet[_M]) -> QuerySet[_M]:
+        """Apply the compiled optimizations to the given queryset."""
+        config = self.config
+
+        prefetch_related = (
+            self._get_prefetch_related(qs) if self.prefetch_related else None
         )
-        qs = self._apply_annotate(
-            qs,
-            info=info,
-            config=config,
+        select_related, extra_only = self._get_select_related(qs)
+        only = (
+            (*self.only, *extra_only)
+            if config.enable_only and (self.only or extra_only)
+            else ()
         )
 
-        return qs  # ruff: ignore[unnecessary-assign]
-
-    def _apply_prefetch_related(
-        self,
-        qs: QuerySet[_M],
-        *,
-        info: GraphQLResolveInfo,
-        config: OptimizerConfig,
-    ) -> QuerySet[_M]:
-        if not config.enable_prefetch_related or not self.prefetch_related:
+        if not _can_chain_in_place(qs):
+            # Either the queryset customizes how those are handled (e.g.
+            # django-polymorphic's `only`) or django needs to raise an error for it
+            if prefetch_related is not None:
+                qs = qs.prefetch_related(None).prefetch_related(*prefetch_related)
+            if select_related:
+                qs = qs.select_related(*select_related)
+            if only:
+                qs = qs.only(*only)
+            if self.annotate:
+                qs = qs.annotate(**self.annotate)
             return qs
 
+        if prefetch_related is None and not select_related and not only:
+            return qs.annotate(**self.annotate) if self.annotate else qs
+
+        # annotate already returns a new clone, which we can modify in place
+        qs = qs.annotate(**self.annotate) if self.annotate else qs._chain()  # type: ignore
+        if prefetch_related is not None:
+            # Replace all existing prefetches, as ours also contains them. This is
+            # to avoid the "lookup was already seen with a different queryset" error
+            qs._prefetch_related_lookups = prefetch_related  # type: ignore
+        if select_related:
+            qs.query.add_select_related(select_related)
+        if only:
+            qs.query.add_immediate_loading(only)
+
+        return qs
+
+    def _get_prefetch_related(self, qs: QuerySet) -> tuple[str | Prefetch, ...]:
         abort_only = set()
         prefetch_lists = [
             qs._prefetch_related_lookups,  # type: ignore
@@ -326,17 +433,12 @@ class OptimizerStore:
             p: p for p in itertools.chain(*prefetch_lists) if isinstance(p, str)
         }
 
-        strawberry_info = _create_strawberry_info(info)
         # Merge already existing prefetches together
         for p in itertools.chain(*prefetch_lists):
             # Already added above
             if isinstance(p, str):
                 continue
 
-            if isinstance(p, Callable):
-                assert_type(p, PrefetchCallable)
-                p = p(strawberry_info)  # ruff: ignore[redefined-loop-name]
-
             path = p.prefetch_to
             existing = to_prefetch.get(path)
             # The simplest case. The prefetch doesn't exist or is a string.
@@ -369,7 +471,7 @@ class OptimizerStore:
                     True,
                 )
 
-        if config.enable_only:
+        if self.config.enable_only:
             try:
                 from django.contrib.contenttypes.fields import GenericRelation
             except (ImportError, RuntimeError):
@@ -424,21 +526,15 @@ class OptimizerStore:
                 if missing:
                     inspector.only |= missing
 
-        # First prefetch_related(None) to clear all existing prefetches, and then
-        # add ours, which also contains them. This is to avoid the
-        # "lookup was already seen with a different queryset" error
-        return qs.prefetch_related(None).prefetch_related(*to_prefetch.values())
+        return tuple(to_prefetch.values())
+
+    def _get_select_related(self, qs: QuerySet) -> tuple[tuple[str, ...], set[str]]:
+        if not self.config.enable_select_related:
+            return (), set()
 
-    def _apply_select_related(
-        self,
-        qs: QuerySet[_M],
-        *,
-        info: GraphQLResolveInfo,
-        config: OptimizerConfig,
-    ) -> tuple[QuerySet[_M], set[str]]:
         only_set = set(self.only)
         extra_only_set = set()
-        select_related_set = set(self.select_related)
+        select_related_set = dict.fromkeys(self.select_related)
 
         # inspect the queryset to find any existing select_related fields
         def get_related_fields_with_prefix(
@@ -457,58 +553,281 @@ class OptimizerStore:
 
         if isinstance(qs.query.select_related, dict):
             select_related_set.update(
-                get_related_fields_with_prefix(qs.query.select_related)
+                dict.fromkeys(get_related_fields_with_prefix(qs.query.select_related))
             )
 
-        if config.enable_select_related and select_related_set:
-            qs = qs.select_related(*select_related_set)
+        # Update our extra_select_related_only_set with the fields that were
+        # selected by select_related to make sure they actually get selected
+        for select_related in select_related_set:
+            if select_related in only_set:
+                continue
+
+            if not any(only.startswith(select_related) for only in only_set):
+                extra_only_set.add(select_related)
+
+        return tuple(select_related_set), extra_only_set
+
+
+def _can_chain_in_place(qs: QuerySet) -> bool:
+    qs_type = type(qs)
+    return (
+        qs_type.prefetch_related is QuerySet.prefetch_related
+        and qs_type.select_related is QuerySet.select_related
+        and qs_type.only is QuerySet.only
+        and qs._fields is None  # type: ignore
+        and not qs.query.combinator
+        and not qs.query._filtered_relations
+    )
 
-            # Update our extra_select_related_only_set with the fields that were
-            # selected by select_related to make sure they actually get selected
-            for select_related in select_related_set:
-                if select_related in only_set:
-                    continue
 
-                if not any(only.startswith(select_related) for only in only_set):
-                    extra_only_set.add(select_related)
+class OptimizerPlanCache:
+    """LRU cache of optimization plans computed by the optimizer.
 
-        return qs, extra_only_set
+    Computing the hints for a selection requires walking through every field
+    selected in the operation. For documents that repeat a lot (e.g. persisted
+    queries), that walk produces the exact same `OptimizerStore` every time.
+
+    This cache stores the result of that walk, keyed by the operation's document,
+    its name, the path of the field being optimized and the variables used in
+    its selections, and replays it on subsequent executions, skipping the
+    selection walk entirely.
+
+    Plans which could depend on the request are not cached, unless `vary_on` is
+    given. That is the case when computing them called a callable
+    `prefetch_related`/`annotate` hint, a type's `get_queryset`, a field
+    overriding `get_queryset` or filtered a nested prefetch by the user's
+    permissions. `vary_on` must then return all the request data those depend
+    on (e.g. the current user), as their results are replayed for every
+    request with the same key. The callables of a `store` given to `optimize()`
+    are not part of the plan, they are resolved again on every execution.
+
+    Attributes
+    ----------
+        maxsize:
+            The maximum number of plans to keep in the cache. The least recently
+            used plans are evicted when this is exceeded.
+        vary_on:
+            Optional callable receiving the resolve info and returning a hashable
+            value to be added to the cache key. Plans depending on the request
+            are only cached when it is given.
+
+    Examples
+    --------
+        The same cache instance needs to be shared between executions:
+
+        >>> plan_cache = OptimizerPlanCache(maxsize=512)
+        >>> schema = strawberry.Schema(
+        ...     Query,
+        ...     extensions=[
+        ...         functools.partial(DjangoOptimizerExtension, plan_cache=plan_cache),
+        ...     ]
+        ... )
 
-    def _apply_only(
+    """
+
+    def __init__(
         self,
-        qs: QuerySet[_M],
+        maxsize: int = 256,
         *,
+        vary_on: Callable[[GraphQLResolveInfo], Hashable] | None = None,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.vary_on = vary_on
+        self.hits = 0
+        self.misses = 0
+        self._plans: OrderedDict[Hashable, _OptimizerPlan] = OrderedDict()
+        self._variable_names: OrderedDict[Hashable, tuple[str, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._plans)
+
+    def get_key(
+        self,
+        qs: QuerySet,
         info: GraphQLResolveInfo,
         config: OptimizerConfig,
-        extra_only_set: set[str],
-    ) -> QuerySet[_M]:
-        only_set = set(self.only) | extra_only_set
+        *,
+        type_name: str | None = None,
+    ) -> Hashable | None:
+        """Return the cache key for optimizing `qs`, or `None` if it can't be cached.
 
-        if config.enable_only and only_set:
-            qs = qs.only(*only_set)
+        `type_name` is the name of the type the plan is for, when it is not the
+        field's return type.
+        """
+        loc = info.operation.loc
+        if loc is None:
+            return None
 
-        return qs
+        path = info.path
+        field_path = []
+        while path:
+            if not isinstance(path.key, int):
+                field_path.append((path.key, path.typename))
+            path = path.prev
+
+        selection_key = (
+            loc.source.body,
+            info.operation.name and info.operation.name.value,
+            tuple(field_path),
+        )
+        # Only the variables used in the selections can change the plan, not
+        # the ones of the field's own arguments (e.g. its pagination)
+        variables = tuple(
+            (name, _freeze_value(info.variable_values.get(name)))
+            for name in self._get_variable_names(selection_key, info)
+        )
+        return (
+            *selection_key,
+            type_name or get_named_type(info.return_type).name,
+            qs.model,
+            is_inheritance_qs(qs),
+            dataclasses.astuple(config),
+            variables,
+            self.vary_on(info) if self.vary_on is not None else None,
+        )
 
-    def _apply_annotate(
+    def _get_variable_names(
         self,
-        qs: QuerySet[_M],
-        *,
+        selection_key: Hashable,
         info: GraphQLResolveInfo,
-        config: OptimizerConfig,
-    ) -> QuerySet[_M]:
-        if not config.enable_annotate or not self.annotate:
-            return qs
+    ) -> tuple[str, ...]:
+        with self._lock:
+            names = self._variable_names.get(selection_key)
+            if names is not None:
+                self._variable_names.move_to_end(selection_key)
+                return names
+
+        names = _get_selections_variable_names(info)
+        with self._lock:
+            self._variable_names[selection_key] = names
+            while len(self._variable_names) > self.maxsize:
+                self._variable_names.popitem(last=False)
+
+        return names
+
+    def get(self, key: Hashable) -> _OptimizerPlan | None:
+        """Return a copy of the plan stored for `key`, if any."""
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                self.misses += 1
+                return None
 
-        strawberry_info = _create_strawberry_info(info)
+            self._plans.move_to_end(key)
+            self.hits += 1
 
-        to_annotate = {}
-        for k, v in self.annotate.items():
-            if isinstance(v, Callable):
-                assert_type(v, AnnotateCallable)
-                v = v(strawberry_info)  # ruff: ignore[redefined-loop-name]
-            to_annotate[k] = v
+        return plan.copy()
+
+    def set(self, key: Hashable, plan: _OptimizerPlan):
+        """Store a copy of `plan` for `key`, evicting old plans if needed.
+
+        Plans depending on the request are skipped when there's no `vary_on`.
+        """
+        if plan.depends_on_request and self.vary_on is None:
+            return
+
+        plan = plan.copy()
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+
+    def clear(self):
+        """Remove all plans from the cache."""
+        with self._lock:
+            self._plans.clear()
+            self._variable_names.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+@dataclasses.dataclass
+class _OptimizerPlan:
+    store: OptimizerStore | None
+    subclasses: set[type[models.Model]] | None
+    depends_on_request: bool = False
+
+    def copy(self):
+        # Applying a store mutates its Prefetch querysets in place, so each
+        # replay needs its own copy of them.
+        store = None
+        if self.store is not None:
+            store = self.store.copy()
+            store.prefetch_related = [
+                _clone_prefetch(p) if isinstance(p, Prefetch) else p
+                for p in store.prefetch_related
+            ]
+
+        return self.__class__(
+            store=store,
+            subclasses=set(self.subclasses) if self.subclasses is not None else None,
+            depends_on_request=self.depends_on_request,
+        )
+
+
+def _clone_prefetch(prefetch: Prefetch) -> Prefetch:
+    prefetch = copy.copy(prefetch)
+    qs = prefetch.queryset
+    if qs is not None:  # type: ignore[reportUnnecessaryComparison]
+        qs = qs._chain()
+        qs._prefetch_related_lookups = tuple(  # type: ignore
+            _clone_prefetch(p) if isinstance(p, Prefetch) else p
+            for p in qs._prefetch_related_lookups  # type: ignore
+        )
+        prefetch.queryset = qs
+
+    return prefetch
+
+
+def _freeze_value(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple((k, _freeze_value(v)) for k, v in sorted(value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze_value(v) for v in value)
+
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+
+    return value
+
+
+class _VariablesCollector(Visitor):
+    def __init__(self):
+        super().__init__()
+        self.variables: set[str] = set()
+        self.fragments: set[str] = set()
+
+    def enter_variable(self, node, *args):
+        self.variables.add(node.name.value)
 
-        return qs.annotate(**to_annotate)
+    def enter_fragment_spread(self, node, *args):
+        self.fragments.add(node.name.value)
+
+
+def _get_selections_variable_names(info: GraphQLResolveInfo) -> tuple[str, ...]:
+    """Return the names of the variables used in the selections of the field."""
+    collector = _VariablesCollector()
+    for field_node in info.field_nodes:
+        if field_node.selection_set is not None:
+            visit(field_node.selection_set, collector)
+
+    visited: set[str] = set()
+    while pending := collector.fragments - visited:
+        for name in pending:
+            visited.add(name)
+            if (fragment := info.fragments.get(name)) is not None:
+                visit(fragment, collector)
+
+    return tuple(sorted(collector.variables))
 
 
 def _create_strawberry_info(raw_info: GraphQLResolveInfo) -> Info:
@@ -547,6 +866,8 @@ def _get_prefetch_queryset(
         qs = remote_model._base_manager.all()  # type: ignore
 
     if f_type := _get_django_type(field):
+        if hasattr(f_type, "get_queryset"):
+            _mark_plan_depends_on_request()
         qs = run_type_get_queryset(
             qs,
             f_type,
@@ -619,6 +940,15 @@ def _optimize_prefetch_queryset(
     )
     field_kwargs.pop("info", None)
 
+    from strawberry_django.permissions import perm_context
+
+    context = perm_context.get()
+    if type(field).get_queryset is not StrawberryDjangoField.get_queryset or (
+        context.checkers and not context.is_safe
+    ):
+        # A custom get_queryset or the user's permissions could filter it
+        _mark_plan_depends_on_request()
+
     # Disable the optimizer to avoid doing double optimization while running get_queryset
     with DjangoOptimizerExtension.disabled():
         qs = field.get_queryset(
@@ -797,6 +1127,9 @@ def _get_hints_from_field(
             field.name: field_store.annotate[_annotate_placeholder],
         }
 
+    if _has_callables(field_store):
+        _mark_plan_depends_on_request()
+
     # with_prefix also resolves callables, so we only need one or the other
     return (
         field_store.with_prefix(prefix, info=f_info)
@@ -805,6 +1138,12 @@ def _get_hints_from_field(
     )
 
 
+def _has_callables(store: OptimizerStore) -> bool:
+    return any(callable(p) for p in store.prefetch_related) or any(
+        callable(a) for a in store.annotate.values()
+    )
+
+
 def _get_hints_from_model_property(
     model: type[models.Model],
     *,
@@ -818,6 +1157,9 @@ def _get_hints_from_model_property(
         and model_attr.store
     ):
         attr_store = model_attr.store
+        if _has_callables(attr_store):
+            _mark_plan_depends_on_request()
+
         # with_prefix also resolves callables, so we only need one or the other
         store = (
             attr_store.with_prefix(prefix, info=f_info)
@@ -1616,12 +1958,53 @@ def _get_model_hints_from_paginated(
     return store
 
 
+def _get_optimizer_plan(
+    qs: QuerySet,
+    info: GraphQLResolveInfo,
+    schema: Schema,
+    strawberry_type: Any,
+    *,
+    config: OptimizerConfig,
+) -> _OptimizerPlan:
+    store = None
+    subclasses = set() if is_inheritance_qs(qs) else None
+
+    state = _PlanState()
+    token = _plan_state.set(state)
+    try:
+        for inner_object_definition in get_possible_concrete_types(
+            qs.model, schema, strawberry_type
+        ):
+            parent_type = _get_gql_definition(schema, inner_object_definition)
+            new_store = _get_model_hints(
+                qs.model,
+                schema,
+                inner_object_definition,
+                parent_type=parent_type,
+                info=info,
+                config=config,
+                subclass_collection=subclasses,
+            )
+            if new_store is not None:
+                store = new_store if store is None else store | new_store
+    finally:
+        _plan_state.reset(token)
+
+    return _OptimizerPlan(
+        store=store,
+        subclasses=subclasses,
+        depends_on_request=state.depends_on_request,
+    )
+
+
 def optimize(
     qs: QuerySet[_M] | BaseManager[_M],
     info: GraphQLResolveInfo | Info,
     *,
     config: OptimizerConfig | None = None,
     store: OptimizerStore | None = None,
+    plan_cache: OptimizerPlanCache | None = None,
+    type_name: str | None = None,
 ) -> QuerySet[_M]:
     """Optimize the given queryset considering the gql info.
 
@@ -1647,6 +2030,14 @@ def optimize(
             Optional config to use when doing the optimization
         store:
             Optional initial store to use for the optimization
+        plan_cache:
+            Optional cache used to store and replay the optimization plan
+            computed from the selections
+        type_name:
+            Optional name of the type to optimize the queryset for, instead of
+            the field's return type. Useful for fields returning abstract types
+            (e.g. federation's `_entities`), to only consider the selections
+            made on that type
 
     Returns:
     -------
@@ -1674,32 +2065,30 @@ def optimize(
     store = store or OptimizerStore()
     schema = cast("Schema", info.schema._strawberry_schema)  # type: ignore
 
-    gql_type = get_named_type(info.return_type)
-    strawberry_type = schema.get_type_by_name(gql_type.name)
+    strawberry_type = schema.get_type_by_name(
+        type_name or get_named_type(info.return_type).name,
+    )
     if strawberry_type is None:
         return qs
 
-    inheritance_qs = is_inheritance_qs(qs)
-    subclasses = set() if inheritance_qs else None
+    plan = None
+    plan_key = None
+    if plan_cache is not None:
+        plan_key = plan_cache.get_key(qs, info, config, type_name=type_name)
+        if plan_key is not None:
+            plan = plan_cache.get(plan_key)
 
-    for inner_object_definition in get_possible_concrete_types(
-        qs.model, schema, strawberry_type
-    ):
-        parent_type = _get_gql_definition(schema, inner_object_definition)
-        new_store = _get_model_hints(
-            qs.model,
-            schema,
-            inner_object_definition,
-            parent_type=parent_type,
-            info=info,
-            config=config,
-            subclass_collection=subclasses,
-        )
-        if new_store is not None:
-            store |= new_store
+    if plan is None:
+        plan = _get_optimizer_plan(qs, info, schema, strawberry_type, config=config)
+        if plan_cache is not None and plan_key is not None:
+            plan_cache.set(plan_key, plan)
 
+    if plan.store is not None:
+        store |= plan.store
+
+    subclasses = plan.subclasses
     if store:
-        if inheritance_qs and subclasses:
+        if is_inheritance_qs(qs) and subclasses:
             qs = qs.select_subclasses(*subclasses)
         qs = store.apply(qs, info=info, config=config)
         qs_config = get_queryset_config(qs)
@@ -1708,6 +2097,121 @@ def optimize(
     return qs
 
 
+def _collect_missing_relations(
+    instance: models.Model,
+    only: set[str] | None,
+    select_related: dict[str, Any],
+    missing: dict[str, None],
+    *,
+    prefix: str = "",
+) -> bool:
+    """Collect in `missing` the `select_related` relations not cached in `instance`.
+
+    `only` are the names of the columns to check that are loaded in `instance`
+    (`None` meaning all of them), and `False` is returned if any of them is not.
+    """
+    opts = instance._meta
+    if only is None:
+        fields = list(opts.concrete_fields)
+    else:
+        try:
+            fields = [opts.get_field(name) for name in only if LOOKUP_SEP not in name]
+        except FieldDoesNotExist:
+            return False
+
+    for field in fields:
+        value = instance.__dict__.get(field.attname, _sentinel)
+        # Expressions (e.g. F() or db_default values) need to be read from the db
+        if value is _sentinel or hasattr(value, "resolve_expression"):
+            return False
+
+    for name, nested in select_related.items():
+        field = opts.get_field(name)
+        if not field.is_cached(instance):  # type: ignore
+            missing[f"{prefix}{name}"] = None
+            continue
+
+        related = field.get_cached_value(instance)  # type: ignore
+        if related is None:
+            continue
+
+        nested_prefix = f"{name}{LOOKUP_SEP}"
+        nested_only = (
+            None
+            if only is None
+            else {
+                n.removeprefix(nested_prefix)
+                for n in only
+                if n.startswith(nested_prefix)
+            }
+        )
+        if not _collect_missing_relations(
+            related,
+            nested_only,
+            nested,
+            missing,
+            prefix=f"{prefix}{nested_prefix}",
+        ):
+            return False
+
+    return True
+
+
+def optimize_instances(
+    instances: list[_M],
+    info: GraphQLResolveInfo | Info,
+    *,
+    config: OptimizerConfig | None = None,
+) -> bool:
+    """Optimize already fetched instances considering the gql info.
+
+    Instead of refetching the instances with an optimized queryset, check if
+    the columns and relations the optimizer would fetch for the selections
+    are already loaded in them. Relations which are not get prefetched into the
+    instances with `prefetch_related_objects`.
+
+    Returns `False` when the instances can't be used as they are (e.g. the
+    selections need annotations or columns that are not loaded), meaning that
+    they need to be refetched.
+    """
+    if not instances:
+        return True
+
+    model = type(instances[0])
+    if any(type(instance) is not model for instance in instances):
+        return False
+
+    qs = optimize(
+        model._default_manager.filter(pk__in=[i.pk for i in instances]),
+        info,
+        config=config,
+    )
+    if (
+        not _can_chain_in_place(qs)
+        or is_inheritance_qs(qs)
+        or qs.query.annotations
+        or qs.query.select_related is True
+    ):
+        return False
+
+    names, defer = qs.query.deferred_loading
+    if defer and names:
+        return False
+
+    only = None if defer else set(names)
+    select_related = cast("dict[str, Any]", qs.query.select_related or {})
+    missing: dict[str, None] = {}
+    for instance in instances:
+        if not _collect_missing_relations(instance, only, select_related, missing):
+            return False
+
+    lookups = [*missing, *qs._prefetch_related_lookups]  # type: ignore
+    if lookups:
+        models.prefetch_related_objects(instances, *lookups)
+
+    return True
+
+
 def is_optimized(qs: QuerySet) -> bool:
     config = get_queryset_config(qs)
     return config.optimized or config.optimized_by_prefetching
@@ -1749,6 +2253,10 @@ class DjangoOptimizerExtension(SchemaExtension):
             is not safe to be applied automatically for custom connections.
         enable_annotate_optimization:
             Enable `QuerySet.annotate` optimizations
+        plan_cache:
+            Optional `OptimizerPlanCache` used to store and replay the optimization
+            plans computed for each operation. Needs to be shared between
+            executions to be effective.
 
     Examples
     --------
@@ -1781,6 +2289,7 @@ class DjangoOptimizerExtension(SchemaExtension):
         enable_nested_relations_prefetch: bool = True,
         execution_context: ExecutionContext | None = None,
         prefetch_custom_queryset: bool = False,
+        plan_cache: OptimizerPlanCache | None = None,
     ):
         super().__init__(execution_context=execution_context)
         self.enable_only = enable_only_optimization
@@ -1789,6 +2298,7 @@ class DjangoOptimizerExtension(SchemaExtension):
         self.enable_annotate_optimization = enable_annotate_optimization
         self.enable_nested_relations_prefetch = enable_nested_relations_prefetch
         self.prefetch_custom_queryset = prefetch_custom_queryset
+        self.plan_cache = plan_cache
 
     def on_execute(self) -> Generator[None]:
         token = optimizer.set(self)
@@ -1823,7 +2333,14 @@ class DjangoOptimizerExtension(SchemaExtension):
                 prefetch_custom_queryset=self.prefetch_custom_queryset,
                 enable_nested_relations_prefetch=self.enable_nested_relations_prefetch,
             )
-            ret = django_fetch(optimize(qs=ret, info=info, config=config))
+            ret = django_fetch(
+                optimize(
+                    qs=ret,
+                    info=info,
+                    config=config,
+                    plan_cache=self.plan_cache,
+                )
+            )
 
         return ret
 
@@ -1842,6 +2359,7 @@ class DjangoOptimizerExtension(SchemaExtension):
         info: GraphQLResolveInfo | Info,
         *,
         store: OptimizerStore | None = None,
+        type_name: str | None = None,
     ) -> QuerySet[_M]:
         if not self.enabled.get():
             return qs
@@ -1854,4 +2372,11 @@ class DjangoOptimizerExtension(SchemaExtension):
             enable_annotate=self.enable_annotate_optimization,
             prefetch_custom_queryset=self.prefetch_custom_queryset,
         )
-        return optimize(qs, info, config=config, store=store)
+        return optimize(
+            qs,
+            info,
+            config=config,
+            store=store,
+            plan_cache=self.plan_cache,
+            type_name=type_name,
+        )
@@ -1,22 +1,40 @@
+import abc
+import contextvars
+import hashlib
+import json
 import sys
+import threading
+import time
 import warnings
+from collections import OrderedDict
 from typing import Generic, TypeVar, cast
 
 import strawberry
-from django.db import DEFAULT_DB_ALIAS
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
 from django.db.models import Count, QuerySet, Window
 from django.db.models.functions import RowNumber
 from django.db.models.query import MAX_GET_RESULTS  # type: ignore
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from strawberry.types import Info
 from strawberry.types.arguments import StrawberryArgument
+from strawberry.types.base import StrawberryOptional
 from strawberry.types.unset import UNSET, UnsetType
 from typing_extensions import Self
 
 from strawberry_django.fields.base import StrawberryDjangoFieldBase
-from strawberry_django.resolvers import django_resolver
+from strawberry_django.resolvers import (
+    adefault_qs_hook,
+    django_resolver,
+    use_async_orm,
+)
 
 from .arguments import argument
+from .queryset import get_queryset_config
 from .settings import strawberry_django_settings
+from .utils.signals import bulk_aware_receiver
 
 NodeType = TypeVar("NodeType")
 _QS = TypeVar("_QS", bound=QuerySet)
@@ -91,13 +109,24 @@ class OffsetPaginated(Generic[NodeType]):
         )
 
     @strawberry.field(description="Total count of existing results.")
-    @django_resolver
     def total_count(self) -> int:
-        return self.get_total_count()
+        if use_async_orm():
+            return cast("int", self.aget_total_count())
+
+        return cast("int", django_resolver(self.get_total_count)())
 
     @strawberry.field(description="List of paginated results.")
-    @django_resolver
     def results(self) -> list[NodeType]:
+        if use_async_orm():
+            paginated_queryset = self.get_paginated_queryset()
+            if paginated_queryset is None:
+                return []
+
+            return cast("list[NodeType]", adefault_qs_hook(paginated_queryset))
+
+        return cast("list[NodeType]", django_resolver(self._get_results)())
+
+    def _get_results(self) -> list[NodeType]:
         paginated_queryset = self.get_paginated_queryset()
 
         return cast(
@@ -135,6 +164,14 @@ class OffsetPaginated(Generic[NodeType]):
         """Retrieve tht total count of the queryset without pagination."""
         return get_total_count(self.queryset) if self.queryset is not None else 0
 
+    async def aget_total_count(self) -> int:
+        """Async version of `get_total_count`, used when `ASYNC_ORM` is enabled."""
+        if type(self).get_total_count is not OffsetPaginated.get_total_count:
+            # Respect custom implementations of the sync version
+            return await sync_to_async(self.get_total_count)()
+
+        return await aget_total_count(self.queryset) if self.queryset is not None else 0
+
     def get_paginated_queryset(self) -> QuerySet | None:
         """Retrieve the queryset with pagination applied.
 
@@ -153,6 +190,114 @@ class OffsetPaginated(Generic[NodeType]):
         )
 
 
+@strawberry.input
+class KeysetPaginationInput(OffsetPaginationInput):
+    page_token: str | None = None
+
+
+@strawberry.type
+class KeysetPaginated(OffsetPaginated[NodeType]):
+    """An `OffsetPaginated` which supports keyset (seek) pagination.
+
+    When a `pageToken` returned by `nextPageToken` is given, the page starts
+    right after the last result of the page that returned it, which the
+    database can find with an index seek instead of having to skip all the
+    rows before it (as it does for `OFFSET`). The `offset` is then applied
+    relative to that position.
+
+    The queryset's ordering is made deterministic by adding the primary key
+    to it. Note that querysets optimized by prefetching (i.e. nested fields)
+    ignore page tokens and use the regular offset pagination.
+    """
+
+    @strawberry.field(
+        description=(
+            "Token to be given as `pageToken` to fetch the next page, "
+            "if there might be one."
+        )
+    )
+    def next_page_token(self) -> str | None:
+        if use_async_orm():
+
+            async def resolver():
+                paginated_queryset = self.get_paginated_queryset()
+                if paginated_queryset is not None:
+                    await adefault_qs_hook(paginated_queryset)
+                return self.get_next_page_token()
+
+            return cast("str | None", resolver())
+
+        return cast("str | None", django_resolver(self.get_next_page_token)())
+
+    def get_next_page_token(self) -> str | None:
+        """Retrieve the token of the page after the current one, if there might be one."""
+        from strawberry_django.relay.cursor_connection import (
+            DjangoCursorEdge,
+            OrderedCollectionCursor,
+        )
+
+        paginated_queryset = self.get_paginated_queryset()
+        ordering_descriptors = self.__dict__.get("_ordering_descriptors")
+        if paginated_queryset is None or ordering_descriptors is None:
+            return None
+
+        limit = _resolve_limit(self.pagination.limit)
+        if limit is None or limit < 0:
+            # Without a limit, all the remaining results are in this page
+            return None
+
+        results = list(paginated_queryset)
+        if not results or len(results) < limit:
+            return None
+
+        cursor = OrderedCollectionCursor.from_model(results[-1], ordering_descriptors)
+        return strawberry.relay.to_base64(DjangoCursorEdge.CURSOR_PREFIX, cursor)
+
+    def get_paginated_queryset(self) -> QuerySet | None:
+        """Retrieve the queryset with keyset pagination applied.
+
+        The paginated queryset is cached, so that the results and the next page
+        token are retrieved from the same query.
+        """
+        from strawberry_django.optimizer import is_optimized_by_prefetching
+        from strawberry_django.relay.cursor_connection import (
+            OrderedCollectionCursor,
+            annotate_ordering_fields,
+            build_tuple_compare,
+        )
+
+        if "_paginated_queryset" in self.__dict__:
+            return self.__dict__["_paginated_queryset"]
+
+        if self.queryset is None or is_optimized_by_prefetching(self.queryset):
+            paginated_queryset = super().get_paginated_queryset()
+        else:
+            queryset, ordering_descriptors, _ = annotate_ordering_fields(self.queryset)
+            page_token = getattr(self.pagination, "page_token", None)
+            if page_token:
+                try:
+                    cursor = OrderedCollectionCursor.from_cursor(
+                        page_token,
+                        ordering_descriptors,
+                    )
+                except ValueError as e:
+                    raise ValueError("Invalid page token") from e
+
+                queryset = queryset.filter(
+                    build_tuple_compare(
+                        ordering_descriptors,
+                        cursor.field_values,
+                        False,
+                    )
+                )
+
+            self.__dict__["_ordering_descriptors"] = ordering_descriptors
+            paginated_queryset = apply(self.pagination, queryset)
+
+        self.__dict__["_paginated_queryset"] = paginated_queryset
+        return paginated_queryset
+
+
 def apply(
     pagination: object | None,
     queryset: _QS,
@@ -307,17 +452,364 @@ def remove_window_pagination(queryset: _QS) -> _QS:
     return queryset
 
 
+class CountCache(abc.ABC):
+    """Base class for caches of the total counts returned by `get_total_count`.
+
+    Counts are keyed by the SQL and params of the queryset being counted, and
+    are kept for `timeout` seconds at most. When `invalidate_on_change` is
+    True, saving or deleting an instance of a model (or changing a many-to-many
+    relation) invalidates the counts of all querysets involving its table, both
+    right away and once the transaction doing it gets committed.
+
+    Note that changes which do not send signals (e.g. `QuerySet.update()` or
+    `bulk_create()`) and tables only referenced inside subqueries are not
+    tracked, those counts will be stale until they expire.
+
+    Subclasses need to implement `get`, `set`, `get_generations` and
+    `invalidate`.
+
+    Attributes
+    ----------
+        timeout:
+            How long, in seconds, a count is kept in the cache.
+        invalidate_on_change:
+            If the counts involving a model's table should be invalidated when
+            one of its instances is saved or deleted.
+
+    """
+
+    def __init__(self, timeout: float = 60, *, invalidate_on_change: bool = True):
+        self.timeout = timeout
+        self.invalidate_on_change = invalidate_on_change
+
+        if invalidate_on_change:
+            post_save.connect(self._on_model_change)
+            post_delete.connect(self._on_model_change)
+            m2m_changed.connect(self._on_m2m_change)
+
+    def get_key(self, queryset: QuerySet) -> tuple[str, list[str]] | None:
+        """Return the cache key for counting `queryset` and the tables it involves.
+
+        Returns `None` if the count can't be cached.
+        """
+        query = queryset.query.clone()
+        try:
+            sql, params = query.get_compiler(using=queryset.db).as_sql()
+        except EmptyResultSet:
+            return None
+
+        tables = sorted({t.table_name for t in query.alias_map.values()})
+        digest = hashlib.sha256(repr((queryset.db, sql, params)).encode()).hexdigest()
+        return digest, tables
+
+    @abc.abstractmethod
+    def get(self, key: str) -> int | None: ...
+
+    @abc.abstractmethod
+    def set(self, key: str, count: int): ...
+
+    @abc.abstractmethod
+    def get_generations(self, tables: list[str]) -> list[int]:
+        """Return the current generation of each one of the given tables."""
+
+    @abc.abstractmethod
+    def invalidate(self, table: str):
+        """Invalidate all counts involving the given table."""
+
+    def get_count(self, queryset: QuerySet) -> int:
+        """Get the count of `queryset` from the cache, counting it on misses."""
+        key = self._get_versioned_key(queryset)
+        if key is None:
+            return queryset.count()
+
+        count = self.get(key)
+        if count is None:
+            count = queryset.count()
+            self.set(key, count)
+
+        return count
+
+    async def aget_count(self, queryset: QuerySet) -> int:
+        """Async version of `get_count`."""
+        # Compiling the key might need to access the database connection, and
+        # the cache backend might not be async, so do everything in one go
+        return await sync_to_async(self.get_count)(queryset)
+
+    def _get_versioned_key(self, queryset: QuerySet) -> str | None:
+        key = self.get_key(queryset)
+        if key is None:
+            return None
+
+        digest, tables = key
+        generations = self.get_generations(tables)
+        return ":".join([digest, *(str(g) for g in generations)])
+
+    def _invalidate_on_commit(self, table: str, using: str | None):
+        # Invalidate right away, so that counts done inside the transaction
+        # don't get mixed with the previous ones, and again once committed,
+        # so that counts done by other connections before that get discarded
+        self.invalidate(table)
+        connection = connections[using or DEFAULT_DB_ALIAS]
+        if connection.in_atomic_block:
+            transaction.on_commit(lambda: self.invalidate(table), using=using)
+
+    @bulk_aware_receiver
+    def _on_model_change(self, sender, using: str | None = None, **kwargs):
+        self._invalidate_on_commit(sender._meta.db_table, using)
+
+    @bulk_aware_receiver
+    def _on_m2m_change(self, sender, action: str, using: str | None = None, **kwargs):
+        if action.startswith("post_"):
+            self._invalidate_on_commit(sender._meta.db_table, using)
+
+
+class LocMemCountCache(CountCache):
+    """In-process LRU cache of total counts.
+
+    Attributes
+    ----------
+        maxsize:
+            The maximum number of counts to keep in the cache. The least
+            recently used counts are evicted when this is exceeded.
+        timeout:
+            How long, in seconds, a count is kept in the cache.
+        invalidate_on_change:
+            If the counts involving a model's table should be invalidated when
+            one of its instances is saved or deleted.
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        timeout: float = 60,
+        *,
+        invalidate_on_change: bool = True,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        super().__init__(timeout, invalidate_on_change=invalidate_on_change)
+        self.maxsize = maxsize
+        self._counts: OrderedDict[str, tuple[float, int]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._counts)
+
+    def get(self, key: str) -> int | None:
+        with self._lock:
+            value = self._counts.get(key)
+            if value is None:
+                return None
+
+            expires_at, count = value
+            if expires_at <= time.monotonic():
+                del self._counts[key]
+                return None
+
+            self._counts.move_to_end(key)
+            return count
+
+    def set(self, key: str, count: int):
+        with self._lock:
+            self._counts[key] = (time.monotonic() + self.timeout, count)
+            self._counts.move_to_end(key)
+            while len(self._counts) > self.maxsize:
+                self._counts.popitem(last=False)
+
+    def get_generations(self, tables: list[str]) -> list[int]:
+        return [self._generations.get(table, 0) for table in tables]
+
+    def invalidate(self, table: str):
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+
+    def clear(self):
+        """Remove all counts from the cache."""
+        with self._lock:
+            self._counts.clear()
+
+
+class DjangoCountCache(CountCache):
+    """Cache of total counts stored in one of Django's cache backends.
+
+    Table generations are stored in the same backend, meaning that when using a
+    shared backend (e.g. Redis or Memcached), invalidations are seen by all
+    processes.
+
+    Attributes
+    ----------
+        cache_name:
+            Name of the Django cache to use, defaults to 'default'
+        timeout:
+            How long, in seconds, a count is kept in the cache.
+        invalidate_on_change:
+            If the counts involving a model's table should be invalidated when
+            one of its instances is saved or deleted.
+        key_prefix:
+            Prefix added to the keys stored in the cache.
+
+    """
+
+    def __init__(
+        self,
+        cache_name: str = "default",
+        timeout: float = 60,
+        *,
+        invalidate_on_change: bool = True,
+        key_prefix: str = "strawberry-django-count",
+    ):
+        super().__init__(timeout, invalidate_on_change=invalidate_on_change)
+        self.cache = caches[cache_name]
+        self.key_prefix = key_prefix
+
+    def get(self, key: str) -> int | None:
+        return self.cache.get(f"{self.key_prefix}:{key}")
+
+    def set(self, key: str, count: int):
+        self.cache.set(f"{self.key_prefix}:{key}", count, timeout=self.timeout)
+
+    def get_generations(self, tables: list[str]) -> list[int]:
+        keys = [self._get_generation_key(table) for table in tables]
+        generations = self.cache.get_many(keys)
+        return [generations.get(key, 0) for key in keys]
+
+    def invalidate(self, table: str):
+        key = self._get_generation_key(table)
+        # Generations never expire, otherwise a stale count could be returned
+        # once its generation goes back to its initial value
+        if not self.cache.add(key, 1, timeout=None):
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                # The key got evicted in the meantime
+                self.cache.set(key, 1, timeout=None)
+
+    def _get_generation_key(self, table: str) -> str:
+        return f"{self.key_prefix}-generation:{table}"
+
+
+#: The `CountCache` used by `get_total_count` for the current execution, if any.
+count_cache: contextvars.ContextVar[CountCache | None] = contextvars.ContextVar(
+    "count-cache",
+    default=None,
+)
+
+
 def get_total_count(queryset: QuerySet) -> int:
     """Get the total count of a queryset.
 
     Try to get the total count from the queryset cache, if it's optimized by
-    prefetching. Otherwise, fallback to the `QuerySet.count()` method.
+    prefetching. Otherwise, use an estimate if approximate counts are enabled
+    for it, or fallback to the `QuerySet.count()` method, going through the
+    current `CountCache` if there's one.
     """
+    total_count, queryset = _get_total_count_or_queryset(queryset)
+    if total_count is not None:
+        return total_count
+
+    if use_approximate_count(queryset):
+        total_count = get_approximate_total_count(queryset)
+        if total_count is not None:
+            return total_count
+
+    if (cache := count_cache.get()) is not None:
+        return cache.get_count(queryset)
+
+    return queryset.count()
+
+
+async def aget_total_count(queryset: QuerySet) -> int:
+    """Async version of `get_total_count`, using `QuerySet.acount()`."""
+    total_count, queryset = _get_total_count_or_queryset(queryset)
+    if total_count is not None:
+        return total_count
+
+    if use_approximate_count(queryset):
+        total_count = await sync_to_async(get_approximate_total_count)(queryset)
+        if total_count is not None:
+            return total_count
+
+    if (cache := count_cache.get()) is not None:
+        return await cache.aget_count(queryset)
+
+    return await queryset.acount()
+
+
+def use_approximate_count(queryset: QuerySet) -> bool:
+    """Check if the total count of the queryset can be approximated.
+
+    That is the case when it was enabled for the field returning it, or by the
+    `PAGINATION_APPROXIMATE_COUNT` setting otherwise.
+    """
+    approximate_count = get_queryset_config(queryset).approximate_count
+    if approximate_count is not None:
+        return approximate_count
+
+    return strawberry_django_settings()["PAGINATION_APPROXIMATE_COUNT"]
+
+
+def get_approximate_total_count(queryset: QuerySet) -> int | None:
+    """Estimate the total count of a queryset from the database statistics.
+
+    Unfiltered querysets use the planner's estimate for their table
+    (`pg_class.reltuples`), other ones the row estimate from `EXPLAIN`.
+
+    Returns None if the estimate is below `PAGINATION_APPROXIMATE_COUNT_THRESHOLD`,
+    when it is not available (e.g. the table was never analyzed) or when the
+    database is not PostgreSQL; callers should then count the queryset exactly.
+    """
+    if queryset.query.is_sliced:
+        return None
+
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+
+    query = queryset.query
+    if (
+        not query.where
+        and not query.distinct
+        and not query.combinator
+        and query.group_by is None
+    ):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        estimate = row[0] if row is not None else None
+    else:
+        try:
+            sql, params = query.get_compiler(using=queryset.db).as_sql()
+        except EmptyResultSet:
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = plan[0]["Plan"]["Plan Rows"]
+
+    # reltuples is -1 for tables which were never vacuumed/analyzed
+    if estimate is None or estimate < 0:
+        return None
+
+    threshold = strawberry_django_settings()["PAGINATION_APPROXIMATE_COUNT_THRESHOLD"]
+    return int(estimate) if estimate >= threshold else None
+
+
+def _get_total_count_or_queryset(queryset: QuerySet) -> tuple[int | None, QuerySet]:
+    """Get the total count without hitting the database, or the queryset to count."""
     from strawberry_django.optimizer import is_optimized_by_prefetching
 
     total_count = get_cached_total_count(queryset)
     if total_count is not None:
-        return total_count
+        return total_count, queryset
 
     if is_optimized_by_prefetching(queryset):
         if queryset._result_cache == [] and _is_non_empty_first_page_window(  # type: ignore
@@ -326,14 +818,14 @@ def get_total_count(queryset: QuerySet) -> int:
             # An empty first page (no offset, limit >= 1) can only come from an
             # empty partition, so there is nothing to count. This avoids one
             # COUNT query per parent without results in nested connections.
-            return 0
+            return 0, queryset
 
         # If we have no results, we can't get the total count from the cache.
         # In this case we will remove the pagination filter to be able to `.count()`
         # the whole queryset with its original filters.
         queryset = remove_window_pagination(queryset)
 
-    return queryset.count()
+    return None, queryset
 
 
 def get_cached_total_count(queryset: QuerySet) -> int | None:
@@ -423,13 +915,20 @@ def _is_non_empty_first_page_window(queryset: QuerySet) -> bool:
 
 
 class StrawberryDjangoPagination(StrawberryDjangoFieldBase):
-    def __init__(self, pagination: bool | UnsetType = UNSET, **kwargs):
+    def __init__(
+        self,
+        pagination: bool | UnsetType = UNSET,
+        approximate_count: bool | UnsetType = UNSET,
+        **kwargs,
+    ):
         self.pagination = pagination
+        self.approximate_count = approximate_count
         super().__init__(**kwargs)
 
     def __copy__(self) -> Self:
         new_field = super().__copy__()
         new_field.pagination = self.pagination
+        new_field.approximate_count = self.approximate_count
         return new_field
 
     def _has_pagination(self) -> bool:
@@ -458,7 +957,7 @@ class StrawberryDjangoPagination(StrawberryDjangoFieldBase):
             pagination = self.get_pagination()
             if pagination is not None:
                 arguments.append(
-                    argument("pagination", OffsetPaginationInput, is_optional=True),
+                    argument("pagination", pagination, is_optional=True),
                 )
         return super().arguments + arguments
 
@@ -468,7 +967,17 @@ class StrawberryDjangoPagination(StrawberryDjangoFieldBase):
         return args_prop.fset(self, value)  # type: ignore
 
     def get_pagination(self) -> type | None:
-        return OffsetPaginationInput if self._has_pagination() else None
+        if not self._has_pagination():
+            return None
+
+        type_ = self.type
+        if isinstance(type_, StrawberryOptional):
+            type_ = type_.of_type
+
+        if isinstance(type_, type) and issubclass(type_, KeysetPaginated):
+            return KeysetPaginationInput
+
+        return OffsetPaginationInput
 
     def apply_pagination(
         self,
@@ -498,6 +1007,11 @@ class StrawberryDjangoPagination(StrawberryDjangoFieldBase):
         ):
             queryset = queryset.order_by("pk")
 
+        if self.approximate_count is not UNSET:
+            get_queryset_config(queryset).approximate_count = cast(
+                "bool", self.approximate_count
+            )
+
         # This is counter intuitive, but in case we are returning a `Paginated`
         # result, we want to set the original queryset _as is_ as it will apply
         # the pagination later on when resolving its `.results` field.
@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import contextlib
 import contextvars
 import copy
@@ -6,7 +7,10 @@ import dataclasses
 import enum
 import functools
 import inspect
-from collections.abc import Callable, Hashable, Iterable
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -19,8 +23,10 @@ from typing import (
 
 import strawberry
 from asgiref.sync import sync_to_async
-from django.core.exceptions import PermissionDenied
-from django.db.models import Model, QuerySet
+from django.core.cache import caches
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.db.models import Field, Model, QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from graphql.pyutils import AwaitableOrValue
 from strawberry import relay, schema_directive
 from strawberry.extensions.field_extension import (
@@ -33,14 +39,17 @@ from strawberry.types.base import StrawberryList, StrawberryOptional
 from strawberry.types.field import StrawberryField
 from strawberry.types.info import Info
 from strawberry.types.union import StrawberryUnion
+from strawberry.utils.inspect import in_async_context
 from typing_extensions import assert_never
 
-from strawberry_django.auth.utils import aget_current_user, get_current_user
+from strawberry_django.auth.utils import get_current_user, get_request_user
 from strawberry_django.fields.types import OperationInfo, OperationMessage
 from strawberry_django.pagination import OffsetPaginated
 from strawberry_django.resolvers import django_resolver
 
 from .utils.query import filter_for_user
+from .utils.requests import get_request
+from .utils.signals import bulk_aware_receiver
 from .utils.typing import UserType
 
 if TYPE_CHECKING:
@@ -62,6 +71,89 @@ def _get_user_or_anonymous_getter() -> Callable[[UserType], UserType] | None:
     return get_user_or_anonymous
 
 
+def _get_permission_user(info: Info) -> UserType:
+    """Return the user to check permissions for, making sure it is loaded."""
+    user = get_current_user(info)
+
+    if user and (get_user_or_anonymous := _get_user_or_anonymous_getter()) is not None:
+        user = get_user_or_anonymous(user)
+
+    # make sure the user is loaded
+    user.is_authenticated  # ruff: ignore[useless-expression]
+
+    return user
+
+
+@dataclasses.dataclass
+class PermissionUserScope:
+    """The permission user being resolved for the current execution."""
+
+    request_user: Any = None
+    future: "asyncio.Future[UserType] | None" = None
+
+
+permission_user_scope: contextvars.ContextVar[PermissionUserScope | None] = (
+    contextvars.ContextVar("permission-user-scope", default=None)
+)
+
+_PERMISSION_USER_SCOPE_KEY = "_strawberry_django_permission_user"
+
+
+def _get_permission_user_scope(info: Info) -> PermissionUserScope | None:
+    """Return the scope to memoize the permission user in.
+
+    That is the one set by `DjangoPermissionCacheExtension` for the execution,
+    or one stored in the execution's context otherwise. `None` is returned
+    when the context can't hold it.
+    """
+    if (scope := permission_user_scope.get()) is not None:
+        return scope
+
+    context = info.context
+    if isinstance(context, dict):
+        return context.setdefault(_PERMISSION_USER_SCOPE_KEY, PermissionUserScope())
+
+    scope = getattr(context, _PERMISSION_USER_SCOPE_KEY, None)
+    if scope is None:
+        scope = PermissionUserScope()
+        try:
+            setattr(context, _PERMISSION_USER_SCOPE_KEY, scope)
+        except (AttributeError, TypeError):
+            return None
+
+    return scope
+
+
+async def _aget_permission_user(info: Info) -> UserType:
+    """Async version of `_get_permission_user`.
+
+    The user is resolved only once per execution and shared by all the
+    permission extensions, instead of needing thread hops for each field.
+    """
+    request = get_request(info)
+    scope = _get_permission_user_scope(info) if request is not None else None
+    if scope is None:
+        return await sync_to_async(_get_permission_user)(info)
+
+    request_user = get_request_user(request)
+    # The user of the request changes when logging in/out, resolve it again then
+    if scope.future is None or scope.request_user is not request_user:
+        scope.request_user = request_user
+        scope.future = asyncio.ensure_future(
+            sync_to_async(_get_permission_user)(info),
+        )
+
+    future = scope.future
+    try:
+        return await future
+    except Exception:
+        # Don't keep failures around, the context might outlive the execution
+        # (e.g. the one of a websocket connection)
+        if scope.future is future:
+            scope.future = None
+        raise
+
+
 @dataclasses.dataclass
 class PermContext:
     is_safe_list: list[bool] = dataclasses.field(default_factory=list)
@@ -119,6 +211,11 @@ def filter_with_perms(qs: QuerySet[_M], info: Info) -> QuerySet[_M]:
         set_perm_safe(False)
         return qs.none()
 
+    if not in_async_context():
+        # Preloading the user's permissions, if enabled, also caches them in
+        # the user object, allowing filter_for_user to skip checking them in SQL
+        _get_preloaded_perms(user)
+
     for check in context.checkers:
         if check.target != PermTarget.RETVAL:
             continue
@@ -216,9 +313,19 @@ def get_with_perms(
     if instance is None:
         return None
 
+    _check_obj_perms(info, [instance])
+    return instance
+
+
+def _check_obj_perms(info: Info, instances: list[Any]):
+    """Check the current perm context's object permissions for `instances`.
+
+    Raises `PermissionDenied` if any of them is not allowed. The object
+    permissions of multiple instances are fetched together when possible.
+    """
     context = perm_context.get()
     if not context.checkers or context.is_safe:
-        return instance
+        return
 
     user = cast("StrawberryDjangoContext", info.context).request.user
     if user and (get_user_or_anonymous := _get_user_or_anonymous_getter()) is not None:
@@ -226,11 +333,81 @@ def get_with_perms(
 
     for check in context.checkers:
         f = any if check.any_perm else all
-        checker = check.obj_perm_checker(info, user)
-        if not f(checker(p, instance) for p in check.perms):
-            raise PermissionDenied(check.message)
+        if check.obj_perm_checker is _default_obj_perm_checker and len(instances) > 1:
+            checker = _default_bulk_obj_perm_checker(info, user, instances)
+        else:
+            checker = check.obj_perm_checker(info, user)
+        for instance in instances:
+            if not f(checker(p, instance) for p in check.perms):
+                raise PermissionDenied(check.message)
 
-    return instance
+
+def get_list_with_perms(
+    pks: list[strawberry.ID] | list[relay.GlobalID],
+    info: Info,
+    *,
+    model: type[_M],
+    key_attr: str = "pk",
+) -> list[_M]:
+    """Retrieve the instances of the given pks, like `get_with_perms` does.
+
+    All of them are retrieved with a single query, and their object permissions
+    are checked together, instead of one query per instance. Like
+    `get_with_perms(..., required=True)`, all the pks must exist.
+    """
+    if not pks:
+        return []
+
+    if all(isinstance(pk, relay.GlobalID) for pk in pks):
+        global_ids = cast("list[relay.GlobalID]", pks)
+        node_types = {global_id.resolve_type(info) for global_id in global_ids}
+        if len(node_types) != 1:
+            return [
+                get_with_perms(pk, info, required=True, model=model, key_attr=key_attr)
+                for pk in global_ids
+            ]
+
+        instances = list(
+            node_types.pop().resolve_nodes(
+                info=info,
+                node_ids=[global_id.node_id for global_id in global_ids],
+                required=True,
+            )
+        )
+        for instance in instances:
+            if not isinstance(instance, model):
+                raise TypeError(f"{instance} is not of the type {model}")
+    elif any(isinstance(pk, relay.GlobalID) for pk in pks):
+        return [
+            get_with_perms(pk, info, required=True, model=model, key_attr=key_attr)
+            for pk in pks
+        ]
+    else:
+        field = (
+            model._meta.pk
+            if key_attr == "pk"
+            else cast("Field", model._meta.get_field(key_attr))
+        )
+        assert field is not None
+        values = [field.to_python(pk) for pk in pks]
+        by_key: dict[Any, _M] = {}
+        for instance in model._default_manager.filter(**{f"{key_attr}__in": values}):
+            key = getattr(instance, field.attname)
+            if key in by_key:
+                raise model.MultipleObjectsReturned(
+                    f"get() returned more than one {model._meta.object_name}"
+                )
+            by_key[key] = instance
+
+        try:
+            instances = [by_key[value] for value in values]
+        except KeyError:
+            raise model.DoesNotExist(
+                f"{model._meta.object_name} matching query does not exist."
+            ) from None
+
+    _check_obj_perms(info, instances)
+    return instances
 
 
 _return_condition = """\
@@ -304,16 +481,7 @@ class DjangoPermissionExtension(FieldExtension, abc.ABC):
         info: Info,
         **kwargs: dict[str, Any],
     ) -> Any:
-        user = get_current_user(info)
-
-        if (
-            user
-            and (get_user_or_anonymous := _get_user_or_anonymous_getter()) is not None
-        ):
-            user = get_user_or_anonymous(user)
-
-        # make sure the user is loaded
-        user.is_authenticated  # ruff: ignore[useless-expression]
+        user = _get_permission_user(info)
 
         try:
             retval = self.resolve_for_user(
@@ -334,17 +502,7 @@ class DjangoPermissionExtension(FieldExtension, abc.ABC):
         info: Info,
         **kwargs: dict[str, Any],
     ) -> Any:
-        user = await aget_current_user(info)
-
-        try:
-            from .integrations.guardian import get_user_or_anonymous
-        except (ImportError, RuntimeError):  # pragma: no cover
-            pass
-        else:
-            user = user and await sync_to_async(get_user_or_anonymous)(user)
-
-        # make sure the user is loaded
-        await sync_to_async(getattr)(user, "is_anonymous")
+        user = await _aget_permission_user(info)
 
         try:
             retval = self.resolve_for_user(
@@ -572,7 +730,467 @@ class PermTarget(enum.IntEnum):
     RETVAL = enum.auto()
 
 
+#: Key of a cached permission check: the user's pk, the perm and, for object
+#: permissions, the object's model label and pk.
+PermCacheKey = tuple[Any, str, str | None, Any]
+
+
+def get_perm_cache_key(
+    user: UserType,
+    perm: PermDefinition,
+    *obj: Any,
+) -> PermCacheKey | None:
+    """Return the key used to cache the result of checking `perm` for `user`.
+
+    `obj`, when given, is the object the perm is being checked for. Returns
+    `None` if the result can't be cached, i.e. for objects which are not
+    saved model instances.
+    """
+    if not obj:
+        return (user.pk, perm.perm, None, None)
+
+    (obj,) = obj
+    if not isinstance(obj, Model) or obj.pk is None:
+        return None
+
+    return (user.pk, perm.perm, obj._meta.label_lower, obj.pk)
+
+
+class PermissionCache(abc.ABC):
+    """Base class for caches of permission checks shared between requests.
+
+    Results are kept for `timeout` seconds at most. When `invalidate_on_change`
+    is True, saving or deleting groups, permissions or guardian's object
+    permissions, changing the many-to-many relations between them and users,
+    or changing a user's `is_active`/`is_superuser` invalidates all cached
+    results.
+
+    Note that changes which do not send signals (e.g. `QuerySet.update()` or
+    `bulk_create()`) are not tracked, those results will be stale until they
+    expire. Custom `perm_checker`/`obj_perm_checker` results are cached as well,
+    so they should only depend on the user, the perm and the object.
+
+    Subclasses need to implement `get`, `set` and `invalidate`.
+
+    Attributes
+    ----------
+        timeout:
+            How long, in seconds, a result is kept in the cache.
+        invalidate_on_change:
+            If all results should be invalidated when users, groups or
+            permissions change.
+
+    """
+
+    def __init__(self, timeout: float = 60, *, invalidate_on_change: bool = True):
+        self.timeout = timeout
+        self.invalidate_on_change = invalidate_on_change
+
+        if invalidate_on_change:
+            pre_save.connect(self._on_model_pre_save)
+            post_save.connect(self._on_model_change)
+            post_delete.connect(self._on_model_change)
+            m2m_changed.connect(self._on_m2m_change)
+
+    @abc.abstractmethod
+    def get(self, key: PermCacheKey) -> bool | None: ...
+
+    @abc.abstractmethod
+    def set(self, key: PermCacheKey, value: bool): ...
+
+    @abc.abstractmethod
+    def invalidate(self):
+        """Invalidate all cached results."""
+
+    @bulk_aware_receiver
+    def _on_model_pre_save(self, sender, instance, **kwargs):
+        if _get_user_perm_fields(sender):
+            # Other caches' receivers read this too, so it is set on every save
+            instance.__dict__[_USER_PERMS_CHANGED_ATTR] = _user_perm_fields_changed(
+                sender,
+                instance,
+                kwargs.get("update_fields"),
+                kwargs.get("using"),
+            )
+
+    @bulk_aware_receiver
+    def _on_model_change(self, sender, instance=None, **kwargs):
+        if _is_perm_model(sender):
+            self.invalidate()
+        elif instance is not None:
+            if instance.__dict__.get(_USER_PERMS_CHANGED_ATTR, False):
+                self.invalidate()
+        elif (update_fields := kwargs.get("update_fields")) is not None and any(
+            f in update_fields for f in _get_user_perm_fields(sender)
+        ):
+            # Bulk updates of users' fields the checks depend on
+            self.invalidate()
+
+    @bulk_aware_receiver
+    def _on_m2m_change(self, sender, action: str, **kwargs):
+        if action.startswith("post_") and _is_perm_model(sender):
+            self.invalidate()
+
+
+#: Set on users being saved with changes to the fields in `_USER_PERM_FIELDS`
+_USER_PERMS_CHANGED_ATTR = "_strawberry_django_perms_changed"
+
+#: Fields of the user model which change the result of permission checks
+_USER_PERM_FIELDS = ("is_active", "is_superuser")
+
+
+@functools.lru_cache
+def _get_user_perm_fields(model: type[Model]) -> tuple[str, ...]:
+    from django.contrib.auth import get_user_model
+
+    if not issubclass(model, get_user_model()):
+        return ()
+
+    field_names = {f.attname for f in model._meta.concrete_fields}
+    return tuple(f for f in _USER_PERM_FIELDS if f in field_names)
+
+
+def _user_perm_fields_changed(
+    model: type[Model],
+    instance: Model,
+    update_fields: Iterable[str] | None,
+    using: str | None,
+) -> bool:
+    fields = _get_user_perm_fields(model)
+    if update_fields is not None:
+        fields = tuple(f for f in fields if f in update_fields)
+
+    if not fields or instance.pk is None:
+        return False
+
+    old_values = (
+        model._base_manager
+        .using(using)
+        .filter(pk=instance.pk)
+        .values_list(*fields)
+        .first()
+    )
+    return old_values is not None and old_values != tuple(
+        getattr(instance, f) for f in fields
+    )
+
+
+@functools.lru_cache
+def _is_perm_model(model: type[Model]) -> bool:
+    """Check if changes to the model's instances change permission checks.
+
+    Those are groups, permissions, the many-to-many through tables between
+    them and users, and guardian's object permissions.
+    """
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group, Permission
+
+    if issubclass(model, (Group, Permission)):
+        return True
+
+    for m2m_model, field_name in [
+        (get_user_model(), "groups"),
+        (get_user_model(), "user_permissions"),
+        (Group, "permissions"),
+    ]:
+        try:
+            field = m2m_model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            continue
+
+        through = getattr(field.remote_field, "through", None)
+        if through is model and through._meta.auto_created:
+            return True
+
+    return issubclass(model, _get_object_permission_bases())
+
+
+@functools.lru_cache
+def _get_object_permission_bases() -> tuple[type[Model], ...]:
+    try:
+        from guardian.models.models import (
+            GroupObjectPermissionBase,
+            UserObjectPermissionBase,
+        )
+    except (ImportError, RuntimeError):  # pragma: no cover
+        return ()
+
+    return (UserObjectPermissionBase, GroupObjectPermissionBase)
+
+
+class LocMemPermissionCache(PermissionCache):
+    """In-process LRU cache of permission checks.
+
+    Attributes
+    ----------
+        maxsize:
+            The maximum number of results to keep in the cache. The least
+            recently used results are evicted when this is exceeded.
+        timeout:
+            How long, in seconds, a result is kept in the cache.
+        invalidate_on_change:
+            If all results should be invalidated when users, groups or
+            permissions change.
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        timeout: float = 60,
+        *,
+        invalidate_on_change: bool = True,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        super().__init__(timeout, invalidate_on_change=invalidate_on_change)
+        self.maxsize = maxsize
+        self._results: OrderedDict[PermCacheKey, tuple[float, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key: PermCacheKey) -> bool | None:
+        with self._lock:
+            value = self._results.get(key)
+            if value is None:
+                return None
+
+            expires_at, result = value
+            if expires_at <= time.monotonic():
+                del self._results[key]
+                return None
+
+            self._results.move_to_end(key)
+            return result
+
+    def set(self, key: PermCacheKey, value: bool):
+        with self._lock:
+            self._results[key] = (time.monotonic() + self.timeout, value)
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def invalidate(self):
+        self.clear()
+
+    def clear(self):
+        """Remove all results from the cache."""
+        with self._lock:
+            self._results.clear()
+
+
+class DjangoPermissionCache(PermissionCache):
+    """Cache of permission checks stored in one of Django's cache backends.
+
+    A generation counter is stored in the same backend and added to all keys,
+    meaning that when using a shared backend (e.g. Redis or Memcached),
+    invalidations are seen by all processes.
+
+    Attributes
+    ----------
+        cache_name:
+            Name of the Django cache to use, defaults to 'default'
+        timeout:
+            How long, in seconds, a result is kept in the cache.
+        invalidate_on_change:
+            If all results should be invalidated when users, groups or
+            permissions change.
+        key_prefix:
+            Prefix added to the keys stored in the cache.
+
+    """
+
+    def __init__(
+        self,
+        cache_name: str = "default",
+        timeout: float = 60,
+        *,
+        invalidate_on_change: bool = True,
+        key_prefix: str = "strawberry-django-perms",
+    ):
+        super().__init__(timeout, invalidate_on_change=invalidate_on_change)
+        self.cache = caches[cache_name]
+        self.key_prefix = key_prefix
+
+    def get(self, key: PermCacheKey) -> bool | None:
+        return self.cache.get(self._get_key(key))
+
+    def set(self, key: PermCacheKey, value: bool):
+        self.cache.set(self._get_key(key), value, timeout=self.timeout)
+
+    def invalidate(self):
+        key = f"{self.key_prefix}-generation"
+        # The generation never expires, otherwise a stale result could be
+        # returned once it goes back to its initial value
+        if not self.cache.add(key, 1, timeout=None):
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                # The key got evicted in the meantime
+                self.cache.set(key, 1, timeout=None)
+
+    def _get_key(self, key: PermCacheKey) -> str:
+        generation = self.cache.get(f"{self.key_prefix}-generation", 0)
+        return ":".join([self.key_prefix, str(generation), *(str(k) for k in key)])
+
+
+@functools.lru_cache
+def _get_user_obj_perms_getter() -> Callable[[UserType], Any] | None:
+    try:
+        from .integrations.guardian import (
+            UserObjectPermissions,
+            uses_default_backends,
+        )
+    except (ImportError, RuntimeError):  # pragma: no cover
+        return None
+
+    return UserObjectPermissions if uses_default_backends() else None
+
+
+class UserPermissions:
+    """All the model level permissions of a user, fetched at once.
+
+    They come from `user.get_all_permissions()`, meaning that the enabled
+    authentication backends need to implement it consistently with `has_perm`.
+    When `object_perms` is True and django-guardian is being used, the user's
+    generic object permissions get fetched too.
+    """
+
+    def __init__(self, user: UserType, *, object_perms: bool = False):
+        self.is_active = user.is_active
+        self.is_superuser = self.is_active and getattr(user, "is_superuser", False)
+        self.perms: frozenset[str] = (
+            frozenset(user.get_all_permissions())  # type: ignore
+            if self.is_active and not self.is_superuser
+            else frozenset()
+        )
+        self.app_labels = frozenset(p.partition(".")[0] for p in self.perms)
+
+        self.object_perms = None
+        if (
+            object_perms
+            and self.is_active
+            and not self.is_superuser
+            and (getter := _get_user_obj_perms_getter()) is not None
+        ):
+            self.object_perms = getter(user)
+
+    def has_perm(self, perm: str) -> bool:
+        return self.is_superuser or perm in self.perms
+
+    def has_module_perms(self, app_label: str) -> bool:
+        return self.is_superuser or app_label in self.app_labels
+
+    def has_obj_perm(self, perm: str, obj: Any) -> bool | None:
+        """Check if the user has `perm` for `obj`, without checking global perms.
+
+        Returns `None` if object permissions were not fetched, or if they
+        can't tell.
+        """
+        if self.is_superuser:
+            return True
+
+        if not self.is_active:
+            return False
+
+        if self.object_perms is None:
+            return None
+
+        return self.object_perms.has_perm(perm, obj)
+
+
+class RequestPermissionCache:
+    """Cache of the permission checks done during a single execution.
+
+    Results missing from it are looked up in the shared `PermissionCache`, if
+    one is given, and stored in both. When `local` is False, results are only
+    stored in the shared cache (e.g. for long-lived subscriptions, which would
+    otherwise never see permission changes).
+
+    When `preload` is True, all the permissions of each user are fetched
+    on their first check (see `UserPermissions`), and every other check is
+    answered from them. `preload_object_perms` fetches their object
+    permissions too.
+    """
+
+    def __init__(
+        self,
+        shared: PermissionCache | None = None,
+        *,
+        local: bool = True,
+        preload: bool = False,
+        preload_object_perms: bool = False,
+    ):
+        self.shared = shared
+        self.local = local
+        self.preload = preload or preload_object_perms
+        self.preload_object_perms = preload_object_perms
+        self._results: dict[PermCacheKey, bool] = {}
+        self._user_perms: dict[Any, UserPermissions] = {}
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key: PermCacheKey) -> bool | None:
+        result = self._results.get(key)
+        if result is None and self.shared is not None:
+            result = self.shared.get(key)
+            if result is not None and self.local:
+                self._results[key] = result
+
+        return result
+
+    def __setitem__(self, key: PermCacheKey, value: bool):
+        if self.local:
+            self._results[key] = value
+        if self.shared is not None:
+            self.shared.set(key, value)
+
+    def get_user_permissions(self, user: UserType) -> UserPermissions | None:
+        """Return the preloaded permissions of `user`, fetching them if needed.
+
+        Returns `None` if preloading is disabled or if the user is anonymous.
+        """
+        if not self.preload or user.is_anonymous:
+            return None
+
+        user_perms = self._user_perms.get(user.pk)
+        if user_perms is None:
+            user_perms = UserPermissions(
+                user,
+                object_perms=self.preload_object_perms,
+            )
+            self._user_perms[user.pk] = user_perms
+
+        return user_perms
+
+
+#: The `RequestPermissionCache` used by `HasPerm` for the current execution, if any.
+permission_cache: contextvars.ContextVar[RequestPermissionCache | None] = (
+    contextvars.ContextVar("permission-cache", default=None)
+)
+
+
+def _get_preloaded_perms(user: UserType) -> UserPermissions | None:
+    cache = permission_cache.get()
+    return cache.get_user_permissions(user) if cache is not None else None
+
+
 def _default_perm_checker(info: Info, user: UserType):
+    if (user_perms := _get_preloaded_perms(user)) is not None:
+
+        def preloaded_perm_checker(perm: PermDefinition) -> bool:
+            return (
+                user_perms.has_perm(perm.perm)
+                if perm.permission
+                else user_perms.has_module_perms(cast("str", perm.app))
+            )
+
+        return preloaded_perm_checker
+
     def perm_checker(perm: PermDefinition) -> bool:
         return (
             user.has_perm(perm.perm)  # type: ignore
@@ -584,6 +1202,20 @@ def _default_perm_checker(info: Info, user: UserType):
 
 
 def _default_obj_perm_checker(info: Info, user: UserType):
+    if (user_perms := _get_preloaded_perms(user)) is not None:
+
+        def preloaded_perm_checker(perm: PermDefinition, obj: Any) -> bool:
+            if user_perms.has_perm(perm.perm):
+                return True
+
+            has_obj_perm = user_perms.has_obj_perm(perm.perm, obj)
+            if has_obj_perm is None:
+                return user.has_perm(perm.perm, obj=obj)  # type: ignore
+
+            return has_obj_perm
+
+        return preloaded_perm_checker
+
     def perm_checker(perm: PermDefinition, obj: Any) -> bool:
         # Check global perms first, then object specific
         return user.has_perm(perm.perm) or user.has_perm(  # type: ignore
@@ -594,6 +1226,46 @@ def _default_obj_perm_checker(info: Info, user: UserType):
     return perm_checker
 
 
+@functools.lru_cache
+def _get_bulk_obj_perm_checker_getter() -> (
+    Callable[[UserType, Iterable[Any]], Callable[[str, Any], bool] | None] | None
+):
+    try:
+        from .integrations.guardian import get_bulk_obj_perm_checker
+    except (ImportError, RuntimeError):  # pragma: no cover
+        return None
+
+    return get_bulk_obj_perm_checker
+
+
+def _default_bulk_obj_perm_checker(info: Info, user: UserType, objs: list[Any]):
+    """Version of `_default_obj_perm_checker` for checking lots of objects.
+
+    When possible, the object permissions of all `objs` are fetched together,
+    avoiding one query per object.
+    """
+    user_perms = _get_preloaded_perms(user)
+    if user_perms is not None and user_perms.object_perms is not None:
+        # The object permissions are already there, no need to prefetch them
+        return _default_obj_perm_checker(info, user)
+
+    if (getter := _get_bulk_obj_perm_checker_getter()) is None or (
+        has_obj_perm := getter(user, objs)
+    ) is None:
+        return _default_obj_perm_checker(info, user)
+
+    def perm_checker(perm: PermDefinition, obj: Any) -> bool:
+        # Check global perms first, then object specific
+        has_global_perm = (
+            user_perms.has_perm(perm.perm)
+            if user_perms is not None
+            else user.has_perm(perm.perm)  # type: ignore
+        )
+        return has_global_perm or has_obj_perm(perm.perm, obj)
+
+    return perm_checker
+
+
 class HasPerm(DjangoPermissionExtension):
     """Defines permissions required to access the given object/field.
 
@@ -779,7 +1451,10 @@ class HasPerm(DjangoPermissionExtension):
         self,
         info: Info,
         user: UserType,
-    ) -> dict[tuple[Hashable, ...], bool]:
+    ) -> dict[PermCacheKey, bool] | RequestPermissionCache:
+        if (cache := permission_cache.get()) is not None:
+            return cache
+
         cache_key = "_strawberry_django_permissions_cache"
 
         cache = getattr(user, cache_key, None)
@@ -789,6 +1464,31 @@ class HasPerm(DjangoPermissionExtension):
 
         return cache
 
+    def _check_perms(
+        self,
+        cache: dict[PermCacheKey, bool] | RequestPermissionCache,
+        user: UserType,
+        checker: Callable[..., bool],
+        *obj: Any,
+    ) -> bool:
+        """Check `self.perms` using `checker`, caching the result of each perm.
+
+        `obj`, when given, is the object to check the permissions for.
+        """
+
+        def check(perm: PermDefinition) -> bool:
+            key = get_perm_cache_key(user, perm, *obj)
+            has_perm = cache.get(key) if key is not None else None
+            if has_perm is None:
+                has_perm = checker(perm, *obj)
+                if key is not None:
+                    cache[key] = has_perm
+
+            return has_perm
+
+        f = any if self.any_perm else all
+        return f(check(p) for p in self.perms)
+
     def _has_perm(
         self,
         source: Any,
@@ -797,18 +1497,7 @@ class HasPerm(DjangoPermissionExtension):
         info: Info,
     ) -> bool:
         cache = self._get_cache(info, user)
-
-        # Maybe the result ended up in the cache in the meantime
-        cache_key = (self.perms, self.any_perm)
-        if cache_key in cache:
-            return cache[cache_key]
-
-        f = any if self.any_perm else all
-        checker = self.perm_checker(info, user)
-        has_perm = f(checker(p) for p in self.perms)
-        cache[cache_key] = has_perm
-
-        return has_perm
+        return self._check_perms(cache, user, self.perm_checker(info, user))
 
     def _resolve_obj(
         self,
@@ -825,21 +1514,12 @@ class HasPerm(DjangoPermissionExtension):
         if isinstance(obj, Iterable):
             return list(self._resolve_iterable_obj(source, user, obj, info=info))
 
-        cache = self._get_cache(info, user)
-        cache_key = (self.perms, self.any_perm, obj)
-        has_perm = cache.get(cache_key)
-
-        if has_perm is None:
-            if isinstance(obj, OperationInfo):
-                has_perm = True
-            else:
-                f = any if self.any_perm else all
-                checker = self.obj_perm_checker(info, user)
-                has_perm = f(checker(p, obj) for p in self.perms)
-
-            cache[cache_key] = has_perm
+        if isinstance(obj, OperationInfo):
+            return obj
 
-        if not has_perm:
+        cache = self._get_cache(info, user)
+        checker = self.obj_perm_checker(info, user)
+        if not self._check_perms(cache, user, checker, obj):
             raise DjangoNoPermission
 
         return obj
@@ -853,22 +1533,29 @@ class HasPerm(DjangoPermissionExtension):
         info: Info,
     ) -> Any:
         cache = self._get_cache(info, user)
-        f = any if self.any_perm else all
-        checker = self.obj_perm_checker(info, user)
-
-        for obj in objs:
-            cache_key = (self.perms, self.any_perm, obj)
-            has_perm = cache.get(cache_key)
 
-            if has_perm is None:
-                if isinstance(obj, OperationInfo):
-                    has_perm = True
-                else:
-                    has_perm = f(checker(p, obj) for p in self.perms)
-
-                cache[cache_key] = has_perm
+        if self.obj_perm_checker is _default_obj_perm_checker:
+            objs = list(objs)
+            checker = _default_bulk_obj_perm_checker(
+                info,
+                user,
+                [
+                    obj
+                    for obj in objs
+                    if any(
+                        (key := get_perm_cache_key(user, p, obj)) is None
+                        or cache.get(key) is None
+                        for p in self.perms
+                    )
+                ],
+            )
+        else:
+            checker = self.obj_perm_checker(info, user)
 
-            if has_perm:
+        for obj in objs:
+            if isinstance(obj, OperationInfo) or self._check_perms(
+                cache, user, checker, obj
+            ):
                 yield obj
 
 
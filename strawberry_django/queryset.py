@@ -22,6 +22,7 @@ class StrawberryDjangoQuerySetConfig:
     optimized_by_prefetching: bool = False
     type_get_queryset_did_run: bool = False
     ordering_descriptors: list[OrderingDescriptor] | None = None
+    approximate_count: bool | None = None
 
 
 def get_queryset_config(queryset: QuerySet) -> StrawberryDjangoQuerySetConfig:
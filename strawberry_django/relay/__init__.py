@@ -2,11 +2,13 @@ import warnings
 from typing import TYPE_CHECKING, Any
 
 from .cursor_connection import (
+    CursorPaginationExplanation,
     DjangoCursorConnection,
     DjangoCursorEdge,
     OrderedCollectionCursor,
     OrderingDescriptor,
     apply_cursor_pagination,
+    explain_cursor_pagination,
 )
 from .list_connection import DjangoListConnection
 from .utils import (
@@ -22,12 +24,14 @@ if TYPE_CHECKING:
     )
 
 __all__ = [
+    "CursorPaginationExplanation",
     "DjangoCursorConnection",
     "DjangoCursorEdge",
     "DjangoListConnection",
     "OrderedCollectionCursor",
     "OrderingDescriptor",
     "apply_cursor_pagination",
+    "explain_cursor_pagination",
     "resolve_model_id",
     "resolve_model_id_attr",
     "resolve_model_node",
@@ -1,4 +1,5 @@
 import json
+import re
 from dataclasses import dataclass
 from json import JSONDecodeError
 from typing import Any, ClassVar, cast
@@ -10,7 +11,13 @@ from django.db import DEFAULT_DB_ALIAS, models
 from django.db.models import Expression, F, OrderBy, Q, QuerySet, Value, Window
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.expressions import Col
+from django.db.models.fields.tuple_lookups import (
+    Tuple,
+    TupleGreaterThan,
+    TupleLessThan,
+)
 from django.db.models.functions import RowNumber
+from django.db.models.lookups import Lookup
 from django.db.models.sql.datastructures import BaseTable
 from strawberry import Info, relay
 from strawberry.relay import NodeType, PageInfo, from_base64
@@ -23,12 +30,17 @@ from strawberry.utils.inspect import in_async_context
 from typing_extensions import Self
 
 from strawberry_django.pagination import (
+    aget_total_count,
     apply_window_pagination,
     get_cached_total_count,
     get_total_count,
 )
 from strawberry_django.queryset import get_queryset_config
-from strawberry_django.resolvers import django_resolver
+from strawberry_django.resolvers import (
+    adefault_qs_hook,
+    django_resolver,
+    use_async_orm,
+)
 
 
 def _get_order_by(qs: QuerySet) -> list[OrderBy]:
@@ -46,6 +58,8 @@ class OrderingDescriptor:
     order_by: OrderBy
     # we have to assume everything is nullable by default
     maybe_null: bool = True
+    # whether this is a plain column of the queryset's base table
+    is_column: bool = False
 
     def get_comparator(self, value: Any, before: bool) -> Q | None:
         if value is None:
@@ -108,6 +122,7 @@ def annotate_ordering_fields(
                     order_by.expression.field.attname,
                     order_by,
                     maybe_null=order_by.expression.field.null,
+                    is_column=True,
                 )
             )
             if order_by.expression.field.primary_key:
@@ -135,7 +150,9 @@ def annotate_ordering_fields(
         # So this is safe.
         pk_order = F("pk").resolve_expression(qs.query).asc()
         order_bys.append(pk_order)
-        descriptors.append(OrderingDescriptor("pk", pk_order, maybe_null=False))
+        descriptors.append(
+            OrderingDescriptor("pk", pk_order, maybe_null=False, is_column=True)
+        )
         qs = qs._chain()  # type: ignore
         qs.query.order_by += (pk_order,)
     return qs.annotate(**annotations), descriptors, order_bys
@@ -146,6 +163,10 @@ def build_tuple_compare(
     cursor_values: list[str | None],
     before: bool,
 ) -> Q:
+    row_compare = build_row_value_compare(descriptors, cursor_values, before)
+    if row_compare is not None:
+        return Q(row_compare)
+
     current = None
     for descriptor, field_value in zip(
         reversed(descriptors), reversed(cursor_values), strict=False
@@ -164,6 +185,34 @@ def build_tuple_compare(
     return current if current is not None else Q()
 
 
+def build_row_value_compare(
+    descriptors: list[OrderingDescriptor],
+    cursor_values: list[Any],
+    before: bool,
+) -> Lookup | None:
+    """Build a row value comparison, e.g. `(a, b) > (x, y)`, for the cursor values.
+
+    Unlike the equivalent `a > x OR (a = x AND b > y)`, the database can satisfy
+    it with an index range scan. This is only possible when ordering by more than
+    one non-nullable column of the base table, all of them in the same direction,
+    otherwise `None` is returned.
+
+    On backends without support for row values (e.g. SQLite) Django expands the
+    comparison to the equivalent `OR` conditions.
+    """
+    if len(descriptors) <= 1 or any(
+        not d.is_column or d.maybe_null for d in descriptors
+    ):
+        return None
+
+    descending = {d.order_by.descending for d in descriptors}
+    if len(descending) != 1 or any(v is None for v in cursor_values):
+        return None
+
+    lookup = TupleLessThan if before ^ descending.pop() else TupleGreaterThan
+    return lookup(Tuple(*(F(d.attname) for d in descriptors)), cursor_values)
+
+
 class AttrHelper:
     pass
 
@@ -199,16 +248,16 @@ def apply_cursor_pagination(
     qs: QuerySet,
     *,
     related_field_id: str | None = None,
-    info: Info,
+    info: Info | None,
     before: str | None,
     after: str | None,
     first: int | None,
     last: int | None,
     max_results: int | None,
 ) -> tuple[QuerySet, list[OrderingDescriptor]]:
-    max_results = (
-        max_results if max_results is not None else info.schema.config.relay_max_results
-    )
+    if max_results is None:
+        assert info is not None, "info is required when max_results is not given"
+        max_results = info.schema.config.relay_max_results
 
     qs, ordering_descriptors, original_order_by = annotate_ordering_fields(qs)
     if after:
@@ -285,6 +334,77 @@ def apply_cursor_pagination(
     return qs, ordering_descriptors
 
 
+# Plan lines telling that the database sorts the rows itself, instead of
+# reading them in order: SQLite's temp b-trees, PostgreSQL's (incremental)
+# sort nodes, but not their "Sort Key" details, and MySQL's filesorts
+_SORT_PLAN_MARKERS = re.compile(
+    r"USE TEMP B-TREE FOR (RIGHT PART OF )?ORDER BY"
+    r"|(^|->)\s*(Incremental )?Sort(?=\s*(\(|:|$))"
+    r"|Using filesort",
+    re.MULTILINE,
+)
+
+
+@dataclass
+class CursorPaginationExplanation:
+    sql: str
+    plan: str
+    uses_index: bool
+    needs_sort: bool
+
+
+def explain_cursor_pagination(
+    qs: QuerySet,
+    *,
+    before: str | None = None,
+    after: str | None = None,
+    first: int | None = None,
+    last: int | None = None,
+    **options: Any,
+) -> CursorPaginationExplanation:
+    """Explain the query used to paginate the queryset with the given arguments.
+
+    This is a debugging helper, e.g. to check in a shell whether deep cursors of
+    a connection are satisfied by an index or require the database to sort the
+    whole table.
+
+    Args:
+    ----
+        qs:
+            The queryset of the connection, already ordered
+        before, after, first, last:
+            The pagination arguments, as received by the connection
+        options:
+            Extra options passed to `QuerySet.explain`
+
+    Returns:
+    -------
+        The paginated query's SQL, the plan returned by the database, whether
+        that plan uses an index and whether it sorts the rows. An index only
+        satisfies the cursors when the rows don't need to be sorted, as the
+        index could be used just for filtering them. Both flags are a best
+        effort guess based on the plan's text, as its format depends on the
+        database.
+
+    """
+    qs, _ = apply_cursor_pagination(
+        qs,
+        info=None,
+        before=before,
+        after=after,
+        first=first,
+        last=last,
+        max_results=max(first or 0, last or 0),
+    )
+    plan = qs.explain(**options)
+    return CursorPaginationExplanation(
+        sql=str(qs.query),
+        plan=plan,
+        uses_index=any(marker in plan.lower() for marker in ("index", "primary key")),
+        needs_sort=_SORT_PLAN_MARKERS.search(plan) is not None,
+    )
+
+
 @dataclass
 class OrderedCollectionCursor:
     field_values: list[Any]
@@ -350,6 +470,8 @@ class DjangoCursorConnection(relay.Connection[relay.NodeType]):
         assert self.total_count_qs is not None
 
         total_count = get_cached_total_count(self.total_count_qs)
+        if total_count is None and use_async_orm():
+            return cast("int", aget_total_count(self.total_count_qs))
         if total_count is None:
             # Getting the count requires a query; django_resolver defers it
             # to a thread when running in an async context.
@@ -459,6 +581,14 @@ class DjangoCursorConnection(relay.Connection[relay.NodeType]):
                 ),
             )
 
+        if qs._result_cache is None and use_async_orm():  # type: ignore
+
+            async def async_resolver():
+                await adefault_qs_hook(qs)
+                return finish_resolving()
+
+            return async_resolver()
+
         if in_async_context() and qs._result_cache is None:  # type: ignore
             return sync_to_async(finish_resolving)()
         return finish_resolving()
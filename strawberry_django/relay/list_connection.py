@@ -14,9 +14,15 @@ from strawberry.utils.await_maybe import AwaitableOrValue
 from strawberry.utils.inspect import in_async_context
 from typing_extensions import Self, deprecated
 
-from strawberry_django.pagination import get_cached_total_count, get_total_count
+from strawberry_django.pagination import (
+    aget_total_count,
+    count_cache,
+    get_cached_total_count,
+    get_total_count,
+    use_approximate_count,
+)
 from strawberry_django.queryset import get_queryset_config
-from strawberry_django.resolvers import django_resolver
+from strawberry_django.resolvers import django_resolver, use_async_orm
 from strawberry_django.utils.typing import unwrap_type
 
 
@@ -70,6 +76,8 @@ class DjangoListConnection(relay.ListConnection[relay.NodeType]):
 
         if isinstance(self.nodes, models.QuerySet):
             total_count = get_cached_total_count(self.nodes)
+            if total_count is None and use_async_orm():
+                return cast("int", aget_total_count(self.nodes))
             if total_count is None:
                 # Getting the count requires a query; django_resolver defers
                 # it to a thread when running in an async context.
@@ -130,7 +138,14 @@ class DjangoListConnection(relay.ListConnection[relay.NodeType]):
                         **kwargs,
                     )
 
-                if _should_optimize_total_count(info):
+                # When there's a count cache, prefer it over counting every row
+                # again in the window function. The same goes for approximate
+                # counts, which the window function would make exact.
+                if (
+                    _should_optimize_total_count(info)
+                    and count_cache.get() is None
+                    and not use_approximate_count(nodes)
+                ):
                     nodes = nodes.annotate(
                         _strawberry_total_count=models.Window(
                             expression=models.Count(1), partition_by=None
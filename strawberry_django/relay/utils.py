@@ -2,6 +2,7 @@ import functools
 import inspect
 from collections.abc import Callable, Iterable
 from typing import (
+    Any,
     Literal,
     TypeVar,
     cast,
@@ -10,14 +11,21 @@ from typing import (
 
 import strawberry
 from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import models
+from graphql import get_named_type, is_abstract_type
 from strawberry import relay
 from strawberry.relay.exceptions import NodeIDAnnotationError
 from strawberry.types.info import Info
 from strawberry.utils.await_maybe import AwaitableOrValue
 
 from strawberry_django.queryset import run_type_get_queryset
-from strawberry_django.resolvers import django_getattr, django_resolver
+from strawberry_django.resolvers import (
+    adefault_qs_hook,
+    django_getattr,
+    django_resolver,
+    use_async_orm,
+)
 from strawberry_django.utils.typing import (
     WithStrawberryDjangoObjectDefinition,
     get_django_definition,
@@ -26,6 +34,8 @@ from strawberry_django.utils.typing import (
 _T = TypeVar("_T")
 _M = TypeVar("_M", bound=models.Model)
 
+_INVALID_ID = object()
+
 
 __all__ = [
     "resolve_model_id",
@@ -144,11 +154,14 @@ def resolve_model_nodes(
     qs = run_type_get_queryset(qs, origin, info)
 
     id_attr = cast("relay.Node", origin).resolve_id_attr()
+    id_field = _get_id_field(source, id_attr)
     if node_ids is not None:
+        node_ids = _normalize_node_ids(id_field, node_ids)
         qs = qs.filter(
             **{
+                # Repeated ids don't need to be sent to the database more than once
                 f"{id_attr}__in": [
-                    i.node_id if isinstance(i, relay.GlobalID) else i for i in node_ids
+                    i for i in dict.fromkeys(node_ids) if i is not _INVALID_ID
                 ],
             },
         )
@@ -166,32 +179,73 @@ def resolve_model_nodes(
 
         ext = optimizer.optimizer.get()
         if ext is not None:
-            # If optimizer extension is enabled, optimize this queryset
-            qs = ext.optimize(qs, info=info)
-
-    retval = cast(
-        "AwaitableOrValue[models.QuerySet[_M]]",
-        django_resolver(lambda _qs: _qs, **extra_args)(qs),
-    )
+            # If optimizer extension is enabled, optimize this queryset.
+            # When resolving the nodes of an abstract type (e.g. `nodes(ids: ...)`
+            # returning `[Node]`), only the selections made for this type are
+            # considered, instead of the ones of every type sharing its model
+            type_name = None
+            if origin is not None and is_abstract_type(
+                get_named_type(info._raw_info.return_type)
+            ):
+                type_name = origin.__strawberry_definition__.name
+            qs = ext.optimize(qs, info=info, type_name=type_name)
+
+    if node_ids:
+        # The id attr is needed to map the results back to the requested ids,
+        # make sure it doesn't get deferred by the optimizer
+        only, defer = qs.query.deferred_loading
+        if only and not defer:
+            qs = qs.only(*only, id_attr)
+
+    if use_async_orm():
+        retval = cast(
+            "AwaitableOrValue[models.QuerySet[_M]]",
+            _aresolve_queryset(qs, fetch="qs_hook" not in extra_args),
+        )
+    else:
+        retval = cast(
+            "AwaitableOrValue[models.QuerySet[_M]]",
+            django_resolver(lambda _qs: _qs, **extra_args)(qs),
+        )
     if not node_ids:
         return retval
 
+    id_key = id_field.attname if id_field is not None else id_attr
+
     def map_results(results: models.QuerySet[_M]) -> list[_M]:
         node_caster = get_node_caster(origin)
-        results_map = {str(getattr(obj, id_attr)): node_caster(obj) for obj in results}
-        retval: list[_M | None] = []
-        for node_id in node_ids:
-            if required:
-                retval.append(results_map[str(node_id)])
-            else:
-                retval.append(results_map.get(str(node_id)))
-
-        return retval  # type: ignore
+        if id_field is not None:
+            results_map = {getattr(obj, id_key): node_caster(obj) for obj in results}
+        else:
+            results_map = {
+                str(getattr(obj, id_key)): node_caster(obj) for obj in results
+            }
+
+        if not required:
+            return [results_map.get(node_id) for node_id in node_ids]  # type: ignore
+
+        try:
+            return [results_map[node_id] for node_id in node_ids]  # type: ignore
+        except KeyError:
+            raise source.DoesNotExist(
+                f"{source._meta.object_name} matching query does not exist."
+            ) from None
 
     if inspect.isawaitable(retval):
 
         async def async_resolver():
-            return await sync_to_async(map_results)(await retval)
+            results = await retval
+            result_cache = getattr(results, "_result_cache", None)
+            if result_cache is not None and not any(
+                id_key in obj.get_deferred_fields() for obj in result_cache[:1]
+            ):
+                # The rows were already fetched and their ids are loaded,
+                # so mapping them is pure in-memory work
+                return map_results(results)
+
+            # Iterating an unfetched queryset (e.g. when a qs_hook doesn't
+            # fetch it) or reading deferred ids would hit the database
+            return await sync_to_async(map_results)(results)
 
         return async_resolver()
 
@@ -279,9 +333,61 @@ def resolve_model_node(
             qs = ext.optimize(qs, info=info)
 
     node_caster = get_node_caster(origin)
+    if use_async_orm():
+
+        async def async_resolver():
+            return node_caster(await (qs.aget() if required else qs.afirst()))
+
+        return async_resolver()
+
     return django_resolver(lambda: node_caster(qs.get() if required else qs.first()))()
 
 
+def _get_id_field(model: type[models.Model], id_attr: str) -> models.Field | None:
+    if id_attr == "pk":
+        return model._meta.pk
+
+    try:
+        field = model._meta.get_field(id_attr)
+    except FieldDoesNotExist:
+        return None
+
+    return field if field.concrete else None
+
+
+def _normalize_node_ids(
+    id_field: models.Field | None,
+    node_ids: Iterable[str | relay.GlobalID],
+) -> list[Any]:
+    """Convert the node ids to the python type of the model's id field.
+
+    That is the type of the values fetched from the database, so the results can
+    be mapped back to the requested ids without converting them to strings.
+    Ids that are not valid for the field, and thus can't match any row, are
+    returned as `_INVALID_ID`.
+    """
+    node_ids = [i.node_id if isinstance(i, relay.GlobalID) else i for i in node_ids]
+    if id_field is None:
+        return [str(i) for i in node_ids]
+
+    return [_id_to_python(id_field, node_id) for node_id in node_ids]
+
+
+def _id_to_python(id_field: models.Field, node_id: str) -> Any:
+    try:
+        return id_field.to_python(node_id)
+    except ValidationError:
+        return _INVALID_ID
+
+
+async def _aresolve_queryset(
+    qs: models.QuerySet[_M],
+    *,
+    fetch: bool,
+) -> models.QuerySet[_M]:
+    return await adefault_qs_hook(qs) if fetch else qs
+
+
 def resolve_model_id_attr(source: type) -> str:
     """Resolve the name of the model attribute holding the node id.
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import contextvars
 import functools
 import inspect
@@ -14,8 +15,11 @@ from django.db.models.manager import BaseManager
 from strawberry.utils.inspect import in_async_context
 from typing_extensions import ParamSpec
 
+from .settings import strawberry_django_settings
+from .utils.gql_compat import IS_GQL_33
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable, Iterable
 
     from graphql.pyutils import AwaitableOrValue
 
@@ -24,6 +28,9 @@ _R = TypeVar("_R")
 _P = ParamSpec("_P")
 _M = TypeVar("_M", bound=models.Model)
 
+#: How many rows `adefault_qs_hook` fetches per thread hop.
+ASYNC_ORM_CHUNK_SIZE = 2000
+
 resolving_async: contextvars.ContextVar[bool] = contextvars.ContextVar(
     "resolving-async",
     default=False,
@@ -45,12 +52,158 @@ def default_qs_hook(qs: models.QuerySet[_M]) -> models.QuerySet[_M]:
     return qs
 
 
+async def adefault_qs_hook(qs: models.QuerySet[_M]) -> models.QuerySet[_M]:
+    """Async version of `default_qs_hook`, using Django's async queryset API.
+
+    The rows are fetched with `QuerySet.aiterator` (which also takes care of
+    `prefetch_related` lookups) and stored in the queryset's result cache, so
+    that iterating over it afterwards is async safe.
+    """
+    if isinstance(qs, list):
+        # return sliced queryset as-is
+        return qs
+
+    if qs._result_cache is None:  # type: ignore
+        qs._result_cache = [  # type: ignore
+            obj async for obj in qs.aiterator(chunk_size=ASYNC_ORM_CHUNK_SIZE)
+        ]
+        qs._prefetch_done = True  # type: ignore
+    elif qs._prefetch_related_lookups and not qs._prefetch_done:  # type: ignore
+        await models.aprefetch_related_objects(
+            qs._result_cache,  # type: ignore
+            *qs._prefetch_related_lookups,  # type: ignore
+        )
+        qs._prefetch_done = True  # type: ignore
+
+    return qs
+
+
+def stream_qs_hook(
+    qs: models.QuerySet[_M],
+    chunk_size: int = ASYNC_ORM_CHUNK_SIZE,
+    *,
+    is_async: bool | None = None,
+) -> Iterable[_M] | AsyncIterator[_M]:
+    """Iterate over the queryset in chunks instead of fetching all rows at once.
+
+    Returns `QuerySet.aiterator` when the results are going to be consumed in
+    an async context (its rows are fetched in a thread, one chunk at a time)
+    and `QuerySet.iterator` otherwise. `is_async` defaults to whether we are
+    running in an async context or inside `django_resolver`'s thread.
+    `prefetch_related` lookups are applied to each chunk. Results already
+    fetched (e.g. prefetched by the optimizer) are returned as-is.
+
+    graphql-core 3.2 collects async iterables into a list before completing
+    them (without awaiting nested resolvers), so in that case the results are
+    fetched by `default_qs_hook` instead, which must not run in the event loop.
+    """
+    if isinstance(qs, list) or qs._result_cache is not None:  # type: ignore
+        return qs
+
+    if is_async is None:
+        is_async = resolving_async.get() or in_async_context()
+
+    if is_async:
+        if not IS_GQL_33:
+            return default_qs_hook(qs)
+        return qs.aiterator(chunk_size=chunk_size)
+
+    return qs.iterator(chunk_size=chunk_size)
+
+
+class SyncBatcher:
+    """Run sync functions scheduled in the same event loop tick in a single thread hop.
+
+    Instead of calling `sync_to_async` for each of them, `submit` returns a
+    future and schedules a flush for the next loop iteration. All functions
+    submitted until then (e.g. the resolvers of sibling fields) are run one
+    after the other inside a single `sync_to_async` call, each one in the
+    context it was submitted from.
+    """
+
+    def __init__(self):
+        self._pending: list[
+            tuple[contextvars.Context, Callable[[], Any], asyncio.Future]
+        ] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, func: Callable[[], _R]) -> asyncio.Future[_R]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._pending:
+            loop.call_soon(self._flush)
+
+        self._pending.append((contextvars.copy_context(), func, future))
+        return future
+
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._run(pending))
+        # Keep a reference to the task to avoid it being garbage collected
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending):
+        try:
+            results = await sync_to_async(_run_batch)(pending)
+        except BaseException:
+            for *_, future in pending:
+                future.cancel()
+            raise
+
+        for (*_, future), (ok, value) in zip(pending, results, strict=True):
+            if future.done():
+                continue
+
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+
+def _run_batch(pending) -> list[tuple[bool, Any]]:
+    results = []
+    for context, func, future in pending:
+        if future.done():
+            # The awaiting resolver got cancelled, no need to run it
+            results.append((True, None))
+            continue
+
+        try:
+            results.append((True, context.run(func)))
+        except Exception as e:  # ruff: ignore[blind-except]
+            results.append((False, e))
+
+    return results
+
+
+#: The `SyncBatcher` used by `django_resolver` for the current execution, if any.
+sync_batcher: contextvars.ContextVar[SyncBatcher | None] = contextvars.ContextVar(
+    "sync-batcher",
+    default=None,
+)
+
+
+def use_async_orm() -> bool:
+    """Check if querysets should be evaluated using Django's async queryset API.
+
+    That is the case when the `ASYNC_ORM` setting is enabled and we are running
+    in an async context which is not already inside `sync_to_async`.
+    """
+    return (
+        strawberry_django_settings()["ASYNC_ORM"]
+        and in_async_context()
+        and not resolving_async.get()
+    )
+
+
 @overload
 def django_resolver(
     f: Callable[_P, _R],
     *,
     qs_hook: Callable[[models.QuerySet[_M]], Any] | None = default_qs_hook,
     except_as_none: tuple[type[Exception], ...] | None = None,
+    async_orm_safe: bool = False,
 ) -> Callable[_P, AwaitableOrValue[_R]]: ...
 
 
@@ -59,6 +212,7 @@ def django_resolver(
     *,
     qs_hook: Callable[[models.QuerySet[_M]], Any] | None = default_qs_hook,
     except_as_none: tuple[type[Exception], ...] | None = None,
+    async_orm_safe: bool = False,
 ) -> Callable[[Callable[_P, _R]], Callable[_P, AwaitableOrValue[_R]]]: ...
 
 
@@ -67,6 +221,7 @@ def django_resolver(
     *,
     qs_hook: Callable[[models.QuerySet[_M]], Any] | None = default_qs_hook,
     except_as_none: tuple[type[Exception], ...] | None = None,
+    async_orm_safe: bool = False,
 ):
     """Django resolver for handling both sync and async.
 
@@ -74,6 +229,10 @@ def django_resolver(
     sync context.  sync_to_async helper in used if function is called from
     async context. This is useful especially with Django ORM, which does not
     support async. Coroutines are not wrapped.
+
+    Resolvers marked with `async_orm_safe` are called directly in the event loop
+    when the `ASYNC_ORM` setting is enabled, as they are expected to use
+    Django's async queryset API themselves in that case.
     """
 
     def wrapper(resolver):
@@ -106,22 +265,30 @@ def django_resolver(
 
             return retval
 
-        @sync_to_async
-        def async_resolver(*args, **kwargs):
+        def thread_resolver(*args, **kwargs):
             token = resolving_async.set(True)
             try:
                 return sync_resolver(*args, **kwargs)
             finally:
                 resolving_async.reset(token)
 
+        async_resolver = sync_to_async(thread_resolver)
+
         @functools.wraps(resolver)
         def inner_wrapper(*args, **kwargs):
-            f = (
-                async_resolver
-                if in_async_context() and not resolving_async.get()
-                else sync_resolver
-            )
-            return f(*args, **kwargs)
+            if (
+                not in_async_context()
+                or resolving_async.get()
+                or (async_orm_safe and use_async_orm())
+            ):
+                return sync_resolver(*args, **kwargs)
+
+            if (batcher := sync_batcher.get()) is not None:
+                return batcher.submit(
+                    functools.partial(thread_resolver, *args, **kwargs)
+                )
+
+            return async_resolver(*args, **kwargs)
 
         return inner_wrapper
 
@@ -132,10 +299,17 @@ def django_resolver(
 
 
 @django_resolver(qs_hook=None)
-def django_fetch(qs: models.QuerySet[_M]) -> models.QuerySet[_M]:
+def _django_fetch(qs: models.QuerySet[_M]) -> models.QuerySet[_M]:
     return default_qs_hook(qs)
 
 
+def django_fetch(qs: models.QuerySet[_M]) -> AwaitableOrValue[models.QuerySet[_M]]:
+    if use_async_orm():
+        return adefault_qs_hook(qs)
+
+    return _django_fetch(qs)
+
+
 @overload
 def django_getattr(
     obj: Any,
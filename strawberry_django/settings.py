@@ -55,6 +55,24 @@ class StrawberryDjangoSettings(TypedDict):
     #: If True, filters used in mutations can be omitted
     ALLOW_MUTATIONS_WITHOUT_FILTERS: bool
 
+    #: If True, querysets will be evaluated using Django's async queryset API
+    #: (e.g. `aiterator`, `aget`, `acount`) when resolving in an async context,
+    #: instead of running the whole resolver inside `sync_to_async`.
+    ASYNC_ORM: bool
+
+    #: If True, `totalCount` of paginated fields and connections will be
+    #: estimated from database statistics on PostgreSQL instead of counted.
+    PAGINATION_APPROXIMATE_COUNT: bool
+
+    #: Estimated counts below this value are replaced by exact counts when
+    #: `PAGINATION_APPROXIMATE_COUNT` is enabled.
+    PAGINATION_APPROXIMATE_COUNT_THRESHOLD: int
+
+    #: If True, querysets filtered by django-guardian's object permissions
+    #: combine the user's and its groups' permissions with a `UNION`. If False,
+    #: they are checked with two separate subqueries instead.
+    OBJECT_PERMISSIONS_UNION: bool
+
 
 DEFAULT_DJANGO_SETTINGS = StrawberryDjangoSettings(
     FIELD_DESCRIPTION_FROM_HELP_TEXT=False,
@@ -68,6 +86,10 @@ DEFAULT_DJANGO_SETTINGS = StrawberryDjangoSettings(
     PAGINATION_DEFAULT_LIMIT=100,
     PAGINATION_MAX_LIMIT=100,
     ALLOW_MUTATIONS_WITHOUT_FILTERS=False,
+    ASYNC_ORM=False,
+    PAGINATION_APPROXIMATE_COUNT=False,
+    PAGINATION_APPROXIMATE_COUNT_THRESHOLD=10000,
+    OBJECT_PERMISSIONS_UNION=True,
 )
 
 
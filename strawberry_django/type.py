@@ -225,8 +225,11 @@ def _process_type(
             # the rare deferred-field DB read themselves via django_getattr.
             ("resolve_id", resolve_model_id),
             ("resolve_id_attr", resolve_model_id_attr),
-            ("resolve_node", django_resolver(resolve_model_node)),
-            ("resolve_nodes", django_resolver(resolve_model_nodes)),
+            ("resolve_node", django_resolver(resolve_model_node, async_orm_safe=True)),
+            (
+                "resolve_nodes",
+                django_resolver(resolve_model_nodes, async_orm_safe=True),
+            ),
         ]:
             existing_resolver = getattr(cls, attr, None)
             if (
@@ -1,3 +1,4 @@
+import dataclasses
 import functools
 from typing import TYPE_CHECKING, Optional, TypeVar, cast
 
@@ -6,10 +7,11 @@ from django.db.models import Exists, F, Model, Q, QuerySet
 from django.db.models.functions import Cast
 from strawberry.utils.inspect import in_async_context
 
+from strawberry_django.settings import strawberry_django_settings
+
 from .typing import TypeOrIterable, UserType
 
 if TYPE_CHECKING:
-    from django.contrib.auth.models import AbstractUser
     from django.contrib.contenttypes.models import ContentType
     from guardian.managers import (
         GroupObjectPermissionManager,
@@ -56,6 +58,133 @@ def _filter(
     return qs.filter(q)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_perms(perms: tuple[str, ...]) -> tuple[tuple[str, ...], str | None]:
+    """Split the given perms into their codenames and their (single) app label."""
+    app_labels = set()
+    perms_list = []
+    for p in perms:
+        parts = p.split(".")
+        if len(parts) > 1:
+            app_labels.add(parts[0])
+        perms_list.append(parts[-1])
+
+    if len(app_labels) > 1:  # pragma:nocover
+        raise ValueError(f"Cannot mix app_labels ({app_labels!r})")
+
+    return tuple(perms_list), app_labels.pop() if app_labels else None
+
+
+@dataclasses.dataclass(frozen=True)
+class _PermQuerySets:
+    """User independent querysets used to filter objects by permissions.
+
+    Each one of them still needs to be filtered by the user (or its groups)
+    with the `*_lookup` lookup.
+    """
+
+    user_perms: QuerySet | None
+    user_perms_lookup: str
+    group_perms: QuerySet | None
+    group_perms_lookup: str
+    user_obj_perms: QuerySet | None
+    group_obj_perms: QuerySet | None
+    group_obj_perms_lookup: str
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_perm_querysets(
+    user_model: type[Model],
+    model: type[Model],
+    ctype: Optional["ContentType"],
+    perms_list: tuple[str, ...],
+    *,
+    with_groups: bool,
+) -> _PermQuerySets:
+    from django.contrib.auth.models import Group, Permission
+
+    user_perms = None
+    user_perms_lookup = ""
+    try:
+        user_perms_field = user_model._meta.get_field("user_permissions")
+    except FieldDoesNotExist:
+        pass
+    else:
+        user_perms_lookup = user_perms_field.related_query_name()  # type: ignore
+        user_perms = _filter(
+            Permission.objects.all(),
+            list(perms_list),
+            model=model,
+            ctype=ctype,
+        )
+
+    group_perms = None
+    group_perms_lookup = ""
+    if with_groups:
+        group_perms_lookup = user_model._meta.get_field("groups").related_query_name()  # type: ignore
+        group_perms = _filter(
+            Group.objects.all(),
+            list(perms_list),
+            lookup="permissions",
+            model=model,
+            ctype=ctype,
+        )
+
+    user_obj_perms = None
+    group_obj_perms = None
+    try:
+        from strawberry_django.integrations.guardian import (
+            get_object_permission_models,
+        )
+    except (ImportError, RuntimeError):  # pragma: no cover
+        pass
+    else:
+        perm_models = get_object_permission_models(model)
+        pk_field = cast("str", model._meta.pk)
+
+        user_model_ = perm_models.user
+        user_qs = _filter(
+            user_model_.objects.all(),
+            list(perms_list),
+            lookup="permission",
+            model=model,
+            ctype=ctype,
+        )
+        if cast("UserObjectPermissionManager", user_model_.objects).is_generic():
+            user_qs = user_qs.filter(content_type=F("permission__content_type"))
+        else:
+            user_qs = user_qs.annotate(object_pk=F("content_object"))
+        user_obj_perms = user_qs.values_list(Cast("object_pk", pk_field), flat=True)
+
+        if with_groups:
+            group_model = perm_models.group
+            group_qs = _filter(
+                group_model.objects.all(),
+                list(perms_list),
+                lookup="permission",
+                model=model,
+                ctype=ctype,
+            )
+            if cast("GroupObjectPermissionManager", group_model.objects).is_generic():
+                group_qs = group_qs.filter(content_type=F("permission__content_type"))
+            else:
+                group_qs = group_qs.annotate(object_pk=F("content_object"))
+            group_obj_perms = group_qs.values_list(
+                Cast("object_pk", pk_field),
+                flat=True,
+            )
+
+    return _PermQuerySets(
+        user_perms=user_perms,
+        user_perms_lookup=user_perms_lookup,
+        group_perms=group_perms,
+        group_perms_lookup=group_perms_lookup,
+        user_obj_perms=user_obj_perms,
+        group_obj_perms=group_obj_perms,
+        group_obj_perms_lookup=f"group__{group_perms_lookup}",
+    )
+
+
 def filter_for_user_q(
     qs: QuerySet,
     user: UserType,
@@ -64,16 +193,28 @@ def filter_for_user_q(
     any_perm: bool = True,
     with_groups: bool = True,
     with_superuser: bool = False,
+    union_object_perms: bool | None = None,
 ):
+    """Return a `Q` filtering the objects of `qs` which `user` has `perms` for.
+
+    The user independent parts of the filter are built only once for each
+    model and perms, and then bound to the given user.
+
+    The user's and its groups' object permissions (when using django-guardian)
+    are combined with a `UNION` by default. Pass `union_object_perms=False` (or
+    set the `OBJECT_PERMISSIONS_UNION` setting to `False`) to check them with
+    two separate subqueries instead.
+    """
     if with_superuser and user.is_active and getattr(user, "is_superuser", False):
-        return qs
+        return Q()
 
     if user.is_anonymous:
-        return qs.none()
+        return Q(pk__in=[])
 
-    groups_field = None
+    # The user might be wrapped by a SimpleLazyObject, don't use type(user)
+    user_model = cast("type[Model]", cast("Model", user)._meta.model)
     try:
-        groups_field = cast("AbstractUser", user)._meta.get_field("groups")
+        user_model._meta.get_field("groups")
     except FieldDoesNotExist:
         with_groups = False
 
@@ -106,105 +247,66 @@ def filter_for_user_q(
                 else None
             )
 
-    app_labels = set()
-    perms_list = []
-    for p in perms:
-        parts = p.split(".")
-        if len(parts) > 1:
-            app_labels.add(parts[0])
-        perms_list.append(parts[-1])
-
-    if len(app_labels) == 1 and ctype is not None:
-        app_label = app_labels.pop()
-        if app_label != ctype.app_label:  # pragma:nocover
-            raise ValueError(
-                f"Given perms must have same app label ({app_label!r} !="
-                f" {ctype.app_label!r})",
-            )
-    elif len(app_labels) > 1:  # pragma:nocover
-        raise ValueError(f"Cannot mix app_labels ({app_labels!r})")
+    perms_list, app_label = _parse_perms(tuple(perms))
+    if (
+        app_label is not None and ctype is not None and app_label != ctype.app_label
+    ):  # pragma:nocover
+        raise ValueError(
+            f"Given perms must have same app label ({app_label!r} !="
+            f" {ctype.app_label!r})",
+        )
 
-    # Small optimization if the user's permissions are cached
-    perm_cache: set[str] | None = getattr(user, "_perm_cache", None)
+    # Small optimization if the user's permissions are cached. Django's
+    # `_perm_cache` includes the permissions of the user's groups, so use the
+    # user's own ones when those should not be considered
+    perm_cache: set[str] | None = getattr(
+        user,
+        "_perm_cache" if with_groups else "_user_perm_cache",
+        None,
+    )
     if perm_cache is not None:
+        if app_label is None:
+            app_label = ctype.app_label if ctype is not None else model._meta.app_label
         f = any if any_perm else all
-        if f(p in perm_cache for p in perms_list):
-            return qs
+        if f(f"{app_label}.{p}" in perm_cache for p in perms_list):
+            return Q()
+
+    if union_object_perms is None:
+        union_object_perms = strawberry_django_settings()["OBJECT_PERMISSIONS_UNION"]
+
+    querysets = _get_perm_querysets(
+        user_model,
+        model,
+        ctype,
+        perms_list,
+        with_groups=with_groups,
+    )
 
     q = Q()
-    if hasattr(user, "user_permissions"):
+    if querysets.user_perms is not None:
         q |= Q(
             Exists(
-                _filter(
-                    cast("AbstractUser", user).user_permissions,
-                    perms_list,
-                    model=model,
-                    ctype=ctype,
-                ),
+                querysets.user_perms.filter(**{querysets.user_perms_lookup: user}),
             ),
         )
-    if with_groups:
+    if querysets.group_perms is not None:
         q |= Q(
             Exists(
-                _filter(
-                    cast("AbstractUser", user).groups,
-                    perms_list,
-                    lookup="permissions",
-                    model=model,
-                    ctype=ctype,
-                ),
+                querysets.group_perms.filter(**{querysets.group_perms_lookup: user}),
             ),
         )
 
-    try:
-        from strawberry_django.integrations.guardian import (
-            get_object_permission_models,
-        )
-    except (ImportError, RuntimeError):  # pragma: no cover
-        pass
-    else:
-        perm_models = get_object_permission_models(qs.model)
-
-        user_model = perm_models.user
-        user_qs = _filter(
-            user_model.objects.filter(user=user),
-            perms_list,
-            lookup="permission",
-            model=model,
-            ctype=ctype,
-        )
-        if cast("UserObjectPermissionManager", user_model.objects).is_generic():
-            user_qs = user_qs.filter(content_type=F("permission__content_type"))
-        else:
-            user_qs = user_qs.annotate(object_pk=F("content_object"))
-
-        obj_qs = user_qs.values_list(
-            Cast("object_pk", cast("str", model._meta.pk)),
-            flat=True,
-        ).distinct()
+    if querysets.user_obj_perms is not None:
+        obj_qs = querysets.user_obj_perms.filter(user=user).distinct()
 
-        if with_groups:
-            assert groups_field is not None
-            group_model = perm_models.group
-            user_key = f"group__{groups_field.related_query_name()}"  # type: ignore
-            group_qs = _filter(
-                group_model.objects.filter(**{user_key: user}),
-                perms_list,
-                lookup="permission",
-                model=model,
-                ctype=ctype,
-            )
-            if cast("GroupObjectPermissionManager", group_model.objects).is_generic():
-                group_qs = group_qs.filter(content_type=F("permission__content_type"))
+        if querysets.group_obj_perms is not None:
+            group_obj_qs = querysets.group_obj_perms.filter(
+                **{querysets.group_obj_perms_lookup: user},
+            ).distinct()
+            if union_object_perms:
+                obj_qs = obj_qs.union(group_obj_qs)
             else:
-                group_qs = group_qs.annotate(object_pk=F("content_object"))
-
-            obj_qs = obj_qs.union(
-                group_qs.values_list(
-                    Cast("object_pk", cast("str", model._meta.pk)),
-                    flat=True,
-                ).distinct(),
-            )
+                q |= Q(pk__in=group_obj_qs)
 
         q |= Q(pk__in=obj_qs)
 
@@ -219,6 +321,7 @@ def filter_for_user(
     any_perm: bool = True,
     with_groups: bool = True,
     with_superuser: bool = False,
+    union_object_perms: bool | None = None,
 ):
     return qs & qs.filter(
         filter_for_user_q(
@@ -228,5 +331,6 @@ def filter_for_user(
             any_perm=any_perm,
             with_groups=with_groups,
             with_superuser=with_superuser,
+            union_object_perms=union_object_perms,
         ),
     )
@@ -0,0 +1,90 @@
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+from django.db.models import Model
+from django.db.models.signals import ModelSignal, m2m_changed, post_save
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_BULK_AWARE_ATTR = "_strawberry_django_bulk_aware"
+
+
+def bulk_aware_receiver(func: _F) -> _F:
+    """Mark a signal receiver as being notified of bulk changes.
+
+    `bulk_create`/`bulk_update` don't send `post_save`, which is why the bulk
+    mutations save the instances one by one when the model has receivers for
+    it. Receivers marked with this don't prevent the bulk saves: the bulk
+    mutations call them directly after saving (see `send_bulk_save` and
+    `send_bulk_m2m_add`), with `instance=None` and the saved `instances`.
+    """
+    setattr(func, _BULK_AWARE_ATTR, True)
+    return func
+
+
+def _is_bulk_aware(receiver: Callable[..., Any]) -> bool:
+    return getattr(receiver, _BULK_AWARE_ATTR, False)
+
+
+def _live_receivers(signal: ModelSignal, sender: type[Model]) -> list[Any]:
+    if not signal.has_listeners(sender):
+        return []
+
+    sync_receivers, async_receivers = signal._live_receivers(sender)  # type: ignore
+    return [*sync_receivers, *async_receivers]
+
+
+def has_blocking_receivers(signal: ModelSignal, sender: type[Model]) -> bool:
+    """Return if `signal` has receivers for `sender` that rely on per-row saves."""
+    return any(not _is_bulk_aware(r) for r in _live_receivers(signal, sender))
+
+
+def _send_bulk(signal: ModelSignal, sender: type[Model], **kwargs):
+    if not signal.has_listeners(sender):
+        return
+
+    sync_receivers, _ = signal._live_receivers(sender)  # type: ignore
+    for receiver in sync_receivers:
+        if _is_bulk_aware(receiver):
+            receiver(signal=signal, sender=sender, **kwargs)
+
+
+def send_bulk_save(
+    sender: type[Model],
+    instances: Iterable[Model],
+    *,
+    created: bool,
+    update_fields: Iterable[str] | None = None,
+    using: str | None = None,
+):
+    """Notify the bulk aware `post_save` receivers of a bulk save."""
+    _send_bulk(
+        post_save,
+        sender,
+        instance=None,
+        instances=list(instances),
+        created=created,
+        update_fields=frozenset(update_fields) if update_fields is not None else None,
+        raw=False,
+        using=using,
+    )
+
+
+def send_bulk_m2m_add(
+    through: type[Model],
+    model: type[Model],
+    pk_set: set[Any],
+    *,
+    using: str | None = None,
+):
+    """Notify the bulk aware `m2m_changed` receivers of rows added to `through`."""
+    _send_bulk(
+        m2m_changed,
+        through,
+        action="post_add",
+        instance=None,
+        reverse=False,
+        model=model,
+        pk_set=pk_set,
+        using=using,
+    )
@@ -0,0 +1,179 @@
+"""Benchmark runner for the optimizer, pagination, permission and mutation hot paths.
+
+Benchmarks are skipped by default. Run them with:
+
+    pytest tests/benchmarks --bench --no-cov -p no:xdist
+
+Use `--bench-sizes=10,1000,100000` to choose the amount of rows each benchmark
+is run against, `--bench-rounds` to choose how many timed rounds to run and
+`--bench-json=path.json` to store the results so they can be compared between
+versions.
+"""
+
+import dataclasses
+import gc
+import json
+import pathlib
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+from tests.projects.models import Issue, Milestone, Project, Tag
+
+_BENCHMARKS_DIR = pathlib.Path(__file__).parent
+_results_key = pytest.StashKey[list["BenchmarkResult"]]()
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    name: str
+    rows: int
+    rounds: int
+    min_time: float
+    mean_time: float
+    queries: int
+    peak_memory: int
+
+
+class Benchmark:
+    """Measure wall time, SQL queries and peak memory of a callable.
+
+    The callable is executed `rounds` times to measure its wall time, and then
+    one more time with `tracemalloc` enabled to measure its peak memory usage
+    and the number of SQL queries it executes.
+
+    If `setup` is given, it will be called before each execution and its return
+    value will be passed as the arguments to the callable.
+    """
+
+    def __init__(self, name: str, rows: int, rounds: int):
+        self.name = name
+        self.rows = rows
+        self.rounds = rounds
+        self.result: BenchmarkResult | None = None
+
+    def __call__(
+        self,
+        func: Callable[..., Any],
+        *,
+        setup: Callable[[], tuple] | None = None,
+    ) -> Any:
+        times = []
+        for _ in range(self.rounds):
+            args = setup() if setup is not None else ()
+            gc.collect()
+            start = time.perf_counter()
+            func(*args)
+            times.append(time.perf_counter() - start)
+
+        args = setup() if setup is not None else ()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as ctx:
+                ret = func(*args)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.result = BenchmarkResult(
+            name=self.name,
+            rows=self.rows,
+            rounds=self.rounds,
+            min_time=min(times),
+            mean_time=statistics.mean(times),
+            queries=len(ctx.captured_queries),
+            peak_memory=peak_memory,
+        )
+        return ret
+
+
+def _get_sizes(config: pytest.Config) -> list[int]:
+    return [int(s) for s in config.getoption("--bench-sizes").split(",") if s]
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    if "rows" in metafunc.fixturenames:
+        metafunc.parametrize("rows", _get_sizes(metafunc.config))
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
+    if config.getoption("--bench"):
+        return
+
+    skip = pytest.mark.skip(reason="Benchmarks only run with --bench")
+    for item in items:
+        if _BENCHMARKS_DIR in item.path.parents:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config: pytest.Config):
+    results = config.stash.get(_results_key, [])
+    if not results:
+        return
+
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'name':<55} {'rows':>8} {'min (ms)':>10} {'mean (ms)':>10} "
+        f"{'queries':>8} {'peak (KiB)':>11}"
+    )
+    for r in sorted(results, key=lambda r: (r.name, r.rows)):
+        terminalreporter.write_line(
+            f"{r.name:<55} {r.rows:>8} {r.min_time * 1000:>10.2f} "
+            f"{r.mean_time * 1000:>10.2f} {r.queries:>8} "
+            f"{r.peak_memory / 1024:>11.1f}"
+        )
+
+    if path := config.getoption("--bench-json"):
+        pathlib.Path(path).write_text(
+            json.dumps([dataclasses.asdict(r) for r in results], indent=2),
+            encoding="utf-8",
+        )
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest):
+    callspec = getattr(request.node, "callspec", None)
+    rows = callspec.params.get("rows", 0) if callspec is not None else 0
+    benchmark = Benchmark(
+        request.node.originalname,
+        rows=rows,
+        rounds=request.config.getoption("--bench-rounds"),
+    )
+    yield benchmark
+
+    if benchmark.result is not None:
+        request.config.stash.setdefault(_results_key, []).append(benchmark.result)
+
+
+@pytest.fixture
+def issues(db, rows: int) -> list[Issue]:
+    """Create `rows` issues, spread between milestones and projects, with tags."""
+    projects = Project.objects.bulk_create(
+        Project(name=f"Project {i}") for i in range(max(rows // 100, 1))
+    )
+    milestones = Milestone.objects.bulk_create(
+        Milestone(name=f"Milestone {i}", project=projects[i % len(projects)])
+        for i in range(max(rows // 10, 1))
+    )
+    tags = Tag.objects.bulk_create(Tag(name=f"Tag {i}") for i in range(5))
+    issues = Issue.objects.bulk_create(
+        Issue(
+            name=f"Issue {i}",
+            priority=i % 5,
+            kind=Issue.Kind.BUG if i % 2 else Issue.Kind.FEATURE,
+            milestone=milestones[i % len(milestones)],
+        )
+        for i in range(rows)
+    )
+    Issue.tags.through.objects.bulk_create(
+        Issue.tags.through(issue=issue, tag=tags[i % len(tags)])
+        for i, issue in enumerate(issues)
+    )
+    return issues
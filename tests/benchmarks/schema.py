@@ -0,0 +1,113 @@
+import strawberry
+from django.contrib.auth.models import AnonymousUser
+from django.db.models import QuerySet
+from django.test.client import RequestFactory
+from strawberry import relay
+from strawberry.django.context import StrawberryDjangoContext
+
+import strawberry_django
+from strawberry_django import mutations
+from strawberry_django.optimizer import DjangoOptimizerExtension
+from strawberry_django.pagination import OffsetPaginated
+from strawberry_django.permissions import HasRetvalPerm
+from strawberry_django.relay import DjangoCursorConnection, DjangoListConnection
+from strawberry_django.utils.typing import UserType
+from tests.projects.models import Issue, Milestone, Project, Tag
+
+
+@strawberry_django.filter_type(Issue, lookups=True)
+class IssueFilter:
+    id: strawberry.auto
+    name: strawberry.auto
+    kind: strawberry.auto
+    priority: strawberry.auto
+    milestone: "MilestoneFilter | None"
+
+
+@strawberry_django.filter_type(Milestone, lookups=True)
+class MilestoneFilter:
+    name: strawberry.auto
+
+
+@strawberry_django.type(Tag)
+class TagType(relay.Node):
+    name: strawberry.auto
+
+
+@strawberry_django.type(Project)
+class ProjectType(relay.Node):
+    name: strawberry.auto
+
+
+@strawberry_django.type(Issue)
+class IssueType(relay.Node):
+    name: strawberry.auto
+    kind: strawberry.auto
+    priority: strawberry.auto
+    milestone: "MilestoneType"
+    tags: list[TagType]
+
+
+@strawberry_django.type(Milestone)
+class MilestoneType(relay.Node):
+    name: strawberry.auto
+    project: ProjectType
+    issues: list[IssueType]
+    issues_conn: DjangoListConnection[IssueType] = strawberry_django.connection(
+        field_name="issues",
+    )
+    issues_cursor_conn: DjangoCursorConnection[IssueType] = (
+        strawberry_django.connection(field_name="issues")
+    )
+
+    @classmethod
+    def get_queryset(cls, queryset: QuerySet, info, **kwargs) -> QuerySet:
+        return queryset.order_by("pk")
+
+
+@strawberry_django.input(Issue)
+class IssueInput:
+    name: strawberry.auto
+    priority: strawberry.auto
+    milestone: strawberry.auto
+
+
+@strawberry_django.partial(Issue)
+class IssueInputPartial:
+    priority: strawberry.auto
+
+
+@strawberry.type
+class Query:
+    issues: list[IssueType] = strawberry_django.field(filters=IssueFilter)
+    issues_paginated: OffsetPaginated[IssueType] = strawberry_django.offset_paginated()
+    issues_perm: list[IssueType] = strawberry_django.field(
+        extensions=[HasRetvalPerm(perms=["projects.view_issue"])],
+    )
+    milestones: list[MilestoneType] = strawberry_django.field()
+    milestones_conn: DjangoListConnection[MilestoneType] = (
+        strawberry_django.connection()
+    )
+
+
+@strawberry.type
+class Mutation:
+    create_issues: list[IssueType] = mutations.create(list[IssueInput])
+    update_issues: list[IssueType] = mutations.update(
+        IssueInputPartial,
+        filters=IssueFilter,
+    )
+    delete_issues: list[IssueType] = mutations.delete(filters=IssueFilter)
+
+
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[DjangoOptimizerExtension],
+)
+
+
+def get_context(user: UserType | None = None) -> StrawberryDjangoContext:
+    request = RequestFactory().post("/graphql/")
+    request.user = user or AnonymousUser()
+    return StrawberryDjangoContext(request=request, response=None)  # type: ignore
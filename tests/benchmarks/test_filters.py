@@ -0,0 +1,40 @@
+from strawberry_django import ComparisonFilterLookup, FilterLookup
+from strawberry_django.filters import process_filters
+from tests.projects.models import Issue
+
+from .schema import IssueFilter, MilestoneFilter
+
+
+def _build_filter(depth: int) -> IssueFilter:
+    """Build a binary tree of AND/OR filters with the given depth."""
+    if depth == 0:
+        return IssueFilter(  # type: ignore
+            priority=ComparisonFilterLookup(gte=1),  # type: ignore
+            milestone=MilestoneFilter(name=FilterLookup(contains="1")),  # type: ignore
+        )
+
+    left = _build_filter(depth - 1)
+    right = _build_filter(depth - 1)
+    if depth % 2:
+        return IssueFilter(  # type: ignore
+            name=FilterLookup(contains="Issue"),  # type: ignore
+            AND=left,
+            OR=right,
+        )
+
+    return IssueFilter(  # type: ignore
+        kind=FilterLookup(exact=Issue.Kind.BUG),  # type: ignore
+        OR=left,
+        NOT=right,
+    )
+
+
+def test_process_filters_deep_tree(bench, issues):
+    filters = _build_filter(8)
+
+    def run():
+        qs, q = process_filters(filters, Issue.objects.all(), info=None)
+        return qs.filter(q).count()
+
+    count = bench(run)
+    assert count <= len(issues)
@@ -0,0 +1,83 @@
+from tests.projects.models import Issue, Milestone, Project
+
+from .schema import get_context, schema
+
+
+def test_create(bench, db, rows):
+    milestone = Milestone.objects.create(
+        name="Milestone",
+        project=Project.objects.create(name="Project"),
+    )
+    mutation = """
+      mutation CreateIssues ($data: [IssueInput!]!) {
+        createIssues (data: $data) {
+          id
+          name
+        }
+      }
+    """
+    data = [
+        {"name": f"Issue {i}", "priority": i % 5, "milestone": {"set": milestone.pk}}
+        for i in range(rows)
+    ]
+    res = bench(
+        lambda: schema.execute_sync(
+            mutation,
+            variable_values={"data": data},
+            context_value=get_context(),
+        )
+    )
+    assert res.errors is None
+    assert len(res.data["createIssues"]) == rows
+
+
+def test_update(bench, issues):
+    mutation = """
+      mutation UpdateIssues {
+        updateIssues (data: { priority: 3 }, filters: { priority: { exact: 1 } }) {
+          id
+          priority
+        }
+      }
+    """
+
+    def setup():
+        Issue.objects.filter(priority=3).update(priority=1)
+        return ()
+
+    res = bench(
+        lambda: schema.execute_sync(mutation, context_value=get_context()),
+        setup=setup,
+    )
+    assert res.errors is None
+
+
+def test_delete(bench, issues):
+    mutation = """
+      mutation DeleteIssues {
+        deleteIssues (filters: { kind: { exact: "b" } }) {
+          id
+        }
+      }
+    """
+
+    def setup():
+        Issue.objects.filter(kind=Issue.Kind.BUG).delete()
+        Issue.objects.bulk_create(
+            Issue(
+                name=issue.name,
+                priority=issue.priority,
+                kind=issue.kind,
+                milestone_id=issue.milestone_id,
+            )
+            for issue in issues
+            if issue.kind == Issue.Kind.BUG
+        )
+        return ()
+
+    res = bench(
+        lambda: schema.execute_sync(mutation, context_value=get_context()),
+        setup=setup,
+    )
+    assert res.errors is None
+    assert len(res.data["deleteIssues"]) == len(issues) // 2
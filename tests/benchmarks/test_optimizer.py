@@ -0,0 +1,79 @@
+import functools
+
+import strawberry
+from strawberry.types import Info
+
+import strawberry_django
+from strawberry_django.optimizer import (
+    DjangoOptimizerExtension,
+    OptimizerPlanCache,
+    optimize,
+)
+from tests.projects.models import Issue
+
+from .schema import IssueType, Query, get_context, schema
+
+DEEP_QUERY = """
+  query DeepIssues {
+    issues {
+      id
+      name
+      kind
+      priority
+      milestone {
+        id
+        name
+        project {
+          id
+          name
+        }
+      }
+      tags {
+        id
+        name
+      }
+    }
+  }
+"""
+
+
+def test_deep_list_query(bench, issues):
+    res = bench(lambda: schema.execute_sync(DEEP_QUERY, context_value=get_context()))
+    assert res.errors is None
+    assert len(res.data["issues"]) == len(issues)
+
+
+def test_deep_list_query_with_plan_cache(bench, issues):
+    cached_schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            functools.partial(
+                DjangoOptimizerExtension,
+                plan_cache=OptimizerPlanCache(),
+            ),
+        ],
+    )
+    res = bench(
+        lambda: cached_schema.execute_sync(DEEP_QUERY, context_value=get_context())
+    )
+    assert res.errors is None
+    assert len(res.data["issues"]) == len(issues)
+
+
+def test_optimize(bench, db):
+    captured: list[Info] = []
+
+    @strawberry.type
+    class InfoQuery:
+        @strawberry_django.field
+        def issues(self, info: Info) -> list[IssueType]:
+            captured.append(info)
+            return Issue.objects.none()  # type: ignore
+
+    info_schema = strawberry.Schema(query=InfoQuery)
+    res = info_schema.execute_sync(DEEP_QUERY)
+    assert res.errors is None
+    (info,) = captured
+
+    qs = bench(lambda: optimize(Issue.objects.all(), info))
+    assert qs._prefetch_related_lookups  # type: ignore
@@ -0,0 +1,67 @@
+from .schema import get_context, schema
+
+
+def test_nested_list_connection(bench, issues):
+    query = """
+      query NestedConnection {
+        milestones {
+          id
+          issuesConn (first: 5) {
+            totalCount
+            edges {
+              node {
+                id
+                name
+              }
+            }
+          }
+        }
+      }
+    """
+    res = bench(lambda: schema.execute_sync(query, context_value=get_context()))
+    assert res.errors is None
+
+
+def test_nested_cursor_connection(bench, issues):
+    query = """
+      query NestedCursorConnection {
+        milestones {
+          id
+          issuesCursorConn (first: 5) {
+            edges {
+              cursor
+              node {
+                id
+                name
+              }
+            }
+          }
+        }
+      }
+    """
+    res = bench(lambda: schema.execute_sync(query, context_value=get_context()))
+    assert res.errors is None
+
+
+def test_offset_paginated_tail(bench, issues):
+    query = """
+      query OffsetPaginated ($offset: Int!) {
+        issuesPaginated (pagination: { offset: $offset, limit: 100 }) {
+          totalCount
+          results {
+            id
+            name
+          }
+        }
+      }
+    """
+    offset = max(len(issues) - 100, 0)
+    res = bench(
+        lambda: schema.execute_sync(
+            query,
+            variable_values={"offset": offset},
+            context_value=get_context(),
+        )
+    )
+    assert res.errors is None
+    assert res.data["issuesPaginated"]["totalCount"] == len(issues)
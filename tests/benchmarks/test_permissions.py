@@ -0,0 +1,36 @@
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from guardian.models import UserObjectPermission
+
+from tests.projects.faker import UserFactory
+from tests.projects.models import Issue
+
+from .schema import get_context, schema
+
+
+def test_has_retval_perm_list(bench, issues):
+    user = UserFactory.create()
+    content_type = ContentType.objects.get_for_model(Issue)
+    perm = Permission.objects.get(content_type=content_type, codename="view_issue")
+    # Give the user access to half of the issues
+    UserObjectPermission.objects.bulk_create(
+        UserObjectPermission(
+            user=user,
+            permission=perm,
+            content_type=content_type,
+            object_pk=str(issue.pk),
+        )
+        for issue in issues[::2]
+    )
+
+    query = """
+      query IssuesPerm {
+        issuesPerm {
+          id
+          name
+        }
+      }
+    """
+    res = bench(lambda: schema.execute_sync(query, context_value=get_context(user)))
+    assert res.errors is None
+    assert len(res.data["issuesPerm"]) == len(issues[::2])
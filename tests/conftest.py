@@ -42,6 +42,32 @@ def skip_if_gql_33(
     return pytest.mark.skipif(IS_GQL_33, reason=reason)
 
 
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--bench",
+        action="store_true",
+        default=False,
+        help="Run the benchmarks in tests/benchmarks.",
+    )
+    group.addoption(
+        "--bench-sizes",
+        default="10,1000",
+        help="Comma separated amount of rows to run the benchmarks against.",
+    )
+    group.addoption(
+        "--bench-rounds",
+        type=int,
+        default=5,
+        help="Amount of timed rounds to run for each benchmark.",
+    )
+    group.addoption(
+        "--bench-json",
+        default=None,
+        help="Path of a file to write the benchmark results to, as JSON.",
+    )
+
+
 _TESTS_DIR = pathlib.Path(__file__).parent
 _ROOT_DIR = _TESTS_DIR.parent
 
@@ -0,0 +1,230 @@
+import functools
+
+import pytest
+import strawberry
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+import strawberry_django
+from strawberry_django.extensions.count_cache import DjangoCountCacheExtension
+from strawberry_django.optimizer import DjangoOptimizerExtension
+from strawberry_django.pagination import (
+    CountCache,
+    DjangoCountCache,
+    LocMemCountCache,
+    OffsetPaginated,
+)
+from strawberry_django.relay import DjangoListConnection
+from tests import models
+
+
+@strawberry_django.filter_type(models.Fruit, lookups=True)
+class FruitFilter:
+    name: strawberry.auto
+
+
+@strawberry_django.type(models.Fruit)
+class Fruit(strawberry.relay.Node):
+    name: str
+
+
+@strawberry.type
+class Query:
+    fruits: OffsetPaginated[Fruit] = strawberry_django.offset_paginated(
+        filters=FruitFilter
+    )
+    fruits_conn: DjangoListConnection[Fruit] = strawberry_django.connection()
+
+
+def _get_schema(count_cache: CountCache) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        extensions=[functools.partial(DjangoCountCacheExtension, cache=count_cache)],
+    )
+
+
+def _count_queries(ctx: CaptureQueriesContext) -> int:
+    return sum("COUNT(" in q["sql"] for q in ctx.captured_queries)
+
+
+@pytest.fixture(params=["locmem", "django"])
+def count_cache(request):
+    if request.param == "locmem":
+        return LocMemCountCache()
+
+    cache = DjangoCountCache()
+    cache.cache.clear()
+    return cache
+
+
+@pytest.mark.django_db(transaction=True)
+def test_count_cache_offset_paginated(count_cache):
+    models.Fruit.objects.create(name="Apple")
+    models.Fruit.objects.create(name="Banana")
+    schema = _get_schema(count_cache)
+    query = "query TestQuery { fruits { totalCount } }"
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = schema.execute_sync(query)
+    assert result.errors is None
+    assert result.data == {"fruits": {"totalCount": 2}}
+    assert _count_queries(ctx) == 1
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = schema.execute_sync(query)
+    assert result.errors is None
+    assert result.data == {"fruits": {"totalCount": 2}}
+    assert _count_queries(ctx) == 0
+
+    # Filters are part of the key
+    with CaptureQueriesContext(connection) as ctx:
+        result = schema.execute_sync(
+            'query TestQuery { fruits(filters: { name: { exact: "Apple" } }) '
+            "{ totalCount } }"
+        )
+    assert result.errors is None
+    assert result.data == {"fruits": {"totalCount": 1}}
+    assert _count_queries(ctx) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_count_cache_invalidation(count_cache):
+    models.Fruit.objects.create(name="Apple")
+    schema = _get_schema(count_cache)
+    query = "query TestQuery { fruits { totalCount } fruitsConn { totalCount } }"
+
+    result = schema.execute_sync(query)
+    assert result.data == {"fruits": {"totalCount": 1}, "fruitsConn": {"totalCount": 1}}
+
+    banana = models.Fruit.objects.create(name="Banana")
+    result = schema.execute_sync(query)
+    assert result.data == {"fruits": {"totalCount": 2}, "fruitsConn": {"totalCount": 2}}
+
+    banana.delete()
+    with CaptureQueriesContext(connection) as ctx:
+        result = schema.execute_sync(query)
+    assert result.data == {"fruits": {"totalCount": 1}, "fruitsConn": {"totalCount": 1}}
+    # Both fields count the same query
+    assert _count_queries(ctx) == 1
+
+    # Changes to unrelated tables do not invalidate the counts
+    models.Color.objects.create(name="Red")
+    with CaptureQueriesContext(connection) as ctx:
+        result = schema.execute_sync(query)
+    assert result.data == {"fruits": {"totalCount": 1}, "fruitsConn": {"totalCount": 1}}
+    assert _count_queries(ctx) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_count_cache_invalidated_on_commit(count_cache):
+    (before,) = count_cache.get_generations(["tests_fruit"])
+
+    with transaction.atomic():
+        models.Fruit.objects.create(name="Apple")
+        (during,) = count_cache.get_generations(["tests_fruit"])
+        assert during > before
+
+    # Counts cached by other connections before the commit are discarded too
+    (after,) = count_cache.get_generations(["tests_fruit"])
+    assert after > during
+
+
+@pytest.mark.django_db(transaction=True)
+def test_count_cache_without_invalidation():
+    models.Fruit.objects.create(name="Apple")
+    schema = _get_schema(LocMemCountCache(invalidate_on_change=False))
+    query = "query TestQuery { fruits { totalCount } }"
+
+    result = schema.execute_sync(query)
+    assert result.data == {"fruits": {"totalCount": 1}}
+
+    models.Fruit.objects.create(name="Banana")
+    result = schema.execute_sync(query)
+    assert result.data == {"fruits": {"totalCount": 1}}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_count_cache_timeout(mocker):
+    models.Fruit.objects.create(name="Apple")
+    count_cache = LocMemCountCache(timeout=10, invalidate_on_change=False)
+    schema = _get_schema(count_cache)
+    query = "query TestQuery { fruits { totalCount } }"
+
+    monotonic = mocker.patch(
+        "strawberry_django.pagination.time.monotonic",
+        return_value=100,
+    )
+    result = schema.execute_sync(query)
+    assert result.data == {"fruits": {"totalCount": 1}}
+
+    models.Fruit.objects.create(name="Banana")
+    monotonic.return_value = 111
+    result = schema.execute_sync(query)
+    assert result.data == {"fruits": {"totalCount": 2}}
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_count_cache_async(count_cache):
+    await models.Fruit.objects.acreate(name="Apple")
+    schema = _get_schema(count_cache)
+    query = "query TestQuery { fruits { totalCount } }"
+
+    result = await schema.execute(query)
+    assert result.errors is None
+    assert result.data == {"fruits": {"totalCount": 1}}
+
+    # bulk_create doesn't send signals, so the cached count is returned
+    await models.Fruit.objects.abulk_create([models.Fruit(name="Banana")])
+    result = await schema.execute(query)
+    assert result.errors is None
+    assert result.data == {"fruits": {"totalCount": 1}}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_count_cache_optimized_connection():
+    models.Fruit.objects.create(name="Apple")
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            DjangoOptimizerExtension,
+            functools.partial(DjangoCountCacheExtension, cache=LocMemCountCache()),
+        ],
+    )
+    query = "query TestQuery { fruitsConn { totalCount edges { node { name } } } }"
+
+    result = schema.execute_sync(query)
+    assert result.errors is None
+    assert result.data == {
+        "fruitsConn": {"totalCount": 1, "edges": [{"node": {"name": "Apple"}}]}
+    }
+
+    # The count is not computed by a window function in the results query
+    with CaptureQueriesContext(connection) as ctx:
+        result = schema.execute_sync(query)
+    assert result.errors is None
+    assert result.data == {
+        "fruitsConn": {"totalCount": 1, "edges": [{"node": {"name": "Apple"}}]}
+    }
+    assert len(ctx.captured_queries) == 1
+    assert _count_queries(ctx) == 0
+
+
+def test_loc_mem_count_cache_maxsize():
+    count_cache = LocMemCountCache(maxsize=2, invalidate_on_change=False)
+    count_cache.set("a", 1)
+    count_cache.set("b", 2)
+    assert count_cache.get("a") == 1
+    count_cache.set("c", 3)
+
+    assert len(count_cache) == 2
+    assert count_cache.get("a") == 1
+    assert count_cache.get("b") is None
+    assert count_cache.get("c") == 3
+
+    with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+        LocMemCountCache(maxsize=0)
+
+
+def test_count_cache_is_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+        CountCache()  # type: ignore
@@ -0,0 +1,339 @@
+import functools
+
+import pytest
+import strawberry
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from guardian.shortcuts import assign_perm
+from strawberry.django.context import StrawberryDjangoContext
+
+import strawberry_django
+from strawberry_django import permissions
+from strawberry_django.extensions.permission_cache import (
+    DjangoPermissionCacheExtension,
+)
+from strawberry_django.integrations.guardian import UserObjectPermissions
+from strawberry_django.permissions import (
+    DjangoPermissionCache,
+    HasRetvalPerm,
+    HasSourcePerm,
+    LocMemPermissionCache,
+    PermissionCache,
+)
+from tests.projects.faker import GroupFactory, IssueFactory, UserFactory
+from tests.projects.models import Favorite, Issue
+
+
+@strawberry_django.type(Issue)
+class IssueType:
+    pk: strawberry.ID
+    name: str | None = strawberry_django.field(
+        extensions=[HasSourcePerm("projects.view_issue")],
+    )
+
+
+@strawberry.type
+class Query:
+    issues: list[IssueType] = strawberry_django.field()
+    issues_with_perm: list[IssueType] = strawberry_django.field(
+        extensions=[HasRetvalPerm("projects.view_issue")],
+    )
+
+    @strawberry_django.field(extensions=[HasRetvalPerm("projects.view_issue")])
+    async def issues_async(self) -> list[IssueType]:
+        return await sync_to_async(list)(Issue.objects.all())
+
+
+query = "query { issues { pk name } }"
+
+
+def _get_schema(cache: PermissionCache | None = None, **kwargs) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        extensions=[
+            functools.partial(DjangoPermissionCacheExtension, cache=cache, **kwargs),
+        ],
+    )
+
+
+def _execute(schema: strawberry.Schema, user_pk: int, query: str = query):
+    result, user, ctx = _execute_with_queries(schema, user_pk, query)
+    return result, user, len(ctx)
+
+
+def _execute_with_queries(schema: strawberry.Schema, user_pk: int, query: str):
+    request = RequestFactory().get("/")
+    # Use a new user instance for each execution, like each request would
+    request.user = get_user_model().objects.get(pk=user_pk)
+    with CaptureQueriesContext(connection) as ctx:
+        result = schema.execute_sync(
+            query,
+            context_value=StrawberryDjangoContext(request=request, response=None),
+        )
+
+    assert result.errors is None
+    return result, request.user, ctx
+
+
+@pytest.fixture(params=["locmem", "django"])
+def permission_cache(request):
+    if request.param == "locmem":
+        return LocMemPermissionCache()
+
+    cache = DjangoPermissionCache()
+    cache.cache.clear()
+    return cache
+
+
+@pytest.fixture
+def issues(db):
+    return IssueFactory.create_batch(3)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_permission_cache_per_execution(issues):
+    user = UserFactory.create()
+    assign_perm("view_issue", user, issues[0])
+    schema = _get_schema()
+
+    result, user_obj, _ = _execute(schema, user.pk)
+    assert result.data == {
+        "issues": [
+            {"pk": str(issue.pk), "name": issue.name if i == 0 else None}
+            for i, issue in enumerate(issues)
+        ]
+    }
+    # Results are not stored in the user object anymore
+    assert not hasattr(user_obj, "_strawberry_django_permissions_cache")
+
+    # Nothing is shared between executions
+    assign_perm("view_issue", user, issues[1])
+    result, _, _ = _execute(schema, user.pk)
+    assert [r["name"] for r in result.data["issues"]] == [
+        issues[0].name,
+        issues[1].name,
+        None,
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_permission_cache_resolves_user_once_per_execution(mocker):
+    user = await sync_to_async(UserFactory.create)()
+    await sync_to_async(assign_perm)("projects.view_issue", user)
+    request = RequestFactory().get("/")
+    request.user = user
+    context = StrawberryDjangoContext(request=request, response=None)
+    get_user = mocker.spy(permissions, "_get_permission_user")
+    schema = _get_schema()
+
+    for expected_calls in [1, 2]:
+        result = await schema.execute(
+            "query { first: issuesAsync { pk } second: issuesAsync { pk } }",
+            context_value=context,
+        )
+        assert result.errors is None
+        assert result.data == {"first": [], "second": []}
+        # The request is shared between executions (e.g. over a websocket),
+        # but the user is resolved again for each one of them
+        assert get_user.call_count == expected_calls
+
+
+@pytest.mark.django_db(transaction=True)
+def test_permission_cache_shared(issues, permission_cache):
+    user = UserFactory.create()
+    assign_perm("view_issue", user, issues[0])
+    schema = _get_schema(permission_cache)
+
+    result, _, num_queries = _execute(schema, user.pk)
+    assert [r["name"] for r in result.data["issues"]] == [issues[0].name, None, None]
+    assert num_queries > 1
+
+    # Only the issues are fetched the second time
+    result_cached, _, num_queries = _execute(schema, user.pk)
+    assert result_cached.data == result.data
+    assert num_queries == 1
+
+    # Other users don't share the results
+    other_user = UserFactory.create()
+    result, _, _ = _execute(schema, other_user.pk)
+    assert [r["name"] for r in result.data["issues"]] == [None, None, None]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_permission_cache_invalidated_on_perm_change(issues, permission_cache):
+    user = UserFactory.create()
+    schema = _get_schema(permission_cache)
+
+    result, _, _ = _execute(schema, user.pk)
+    assert [r["name"] for r in result.data["issues"]] == [None, None, None]
+
+    assign_perm("view_issue", user, issues[1])
+    result, _, _ = _execute(schema, user.pk)
+    assert [r["name"] for r in result.data["issues"]] == [None, issues[1].name, None]
+
+    group = GroupFactory.create()
+    assign_perm("view_issue", group, issues[2])
+    user.groups.add(group)
+    result, _, _ = _execute(schema, user.pk)
+    assert [r["name"] for r in result.data["issues"]] == [
+        None,
+        issues[1].name,
+        issues[2].name,
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_permission_cache_invalidated_on_user_perm_fields_change(issues):
+    permission_cache = LocMemPermissionCache()
+    user = UserFactory.create()
+    key = (user.pk, "projects.view_issue", None, None)
+
+    def is_invalidated():
+        invalidated = permission_cache.get(key) is None
+        permission_cache.set(key, False)
+        return invalidated
+
+    permission_cache.set(key, False)
+    update_last_login(None, user)
+    assert not is_invalidated()
+
+    user.first_name = "John"
+    user.save()
+    assert not is_invalidated()
+
+    # Models which just reference users are not permission models
+    Favorite.objects.create(user=user, issue=issues[0], name="Favorite")
+    assert not is_invalidated()
+
+    user.is_superuser = True
+    user.save()
+    assert is_invalidated()
+
+    user.is_active = False
+    user.save(update_fields=["is_active"])
+    assert is_invalidated()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_permission_cache_not_invalidated(issues):
+    permission_cache = LocMemPermissionCache(invalidate_on_change=False)
+    user = UserFactory.create()
+    schema = _get_schema(permission_cache)
+
+    _execute(schema, user.pk)
+    assign_perm("view_issue", user, issues[1])
+    result, _, _ = _execute(schema, user.pk)
+    assert [r["name"] for r in result.data["issues"]] == [None, None, None]
+
+    permission_cache.clear()
+    result, _, _ = _execute(schema, user.pk)
+    assert [r["name"] for r in result.data["issues"]] == [None, issues[1].name, None]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_permission_cache_preload_object_perms(issues):
+    user = UserFactory.create()
+    group = GroupFactory.create()
+    user.groups.add(group)
+    assign_perm("view_issue", user, issues[0])
+    assign_perm("view_issue", group, issues[2])
+    schema = _get_schema(preload_object_perms=True)
+
+    result, _, num_queries = _execute(schema, user.pk)
+    assert [r["name"] for r in result.data["issues"]] == [
+        issues[0].name,
+        None,
+        issues[2].name,
+    ]
+    # The issues, the user's and its groups' perms and object perms
+    assert num_queries == 5
+
+    # The number of queries doesn't depend on the number of objects
+    IssueFactory.create_batch(3)
+    result, _, num_queries = _execute(schema, user.pk)
+    assert len(result.data["issues"]) == 6
+    assert num_queries == 5
+
+
+@pytest.mark.django_db(transaction=True)
+def test_user_object_permissions_fetched_per_content_type(issues):
+    user = UserFactory.create()
+    milestone = issues[0].milestone
+    assign_perm("view_issue", user, issues[0])
+    assign_perm("view_milestone", user, milestone)
+    obj_perms = UserObjectPermissions(user)
+
+    def guardian_queries(ctx):
+        return [q["sql"] for q in ctx.captured_queries if "guardian_" in q["sql"]]
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert obj_perms.has_perm("projects.view_issue", issues[0]) is True
+        assert obj_perms.has_perm("projects.view_issue", issues[1]) is False
+    # Only the issues' permissions of the user and of its groups got fetched
+    assert len(guardian_queries(ctx)) == 2
+    assert all("content_type_id" in sql for sql in guardian_queries(ctx))
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert obj_perms.has_perm("projects.view_milestone", milestone) is True
+        assert obj_perms.has_perm("projects.view_issue", issues[2]) is False
+    assert len(guardian_queries(ctx)) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_permission_cache_preload_global_perms(issues):
+    user = UserFactory.create()
+    assign_perm("projects.view_issue", user)
+    query = "query { issuesWithPerm { pk name } }"
+
+    def get_issues_sql(ctx):
+        (sql,) = [
+            q["sql"] for q in ctx.captured_queries if "projects_issue" in q["sql"]
+        ]
+        return sql
+
+    result, _, ctx = _execute_with_queries(_get_schema(), user.pk, query)
+    assert len(result.data["issuesWithPerm"]) == 3
+    assert "guardian_" in get_issues_sql(ctx)
+
+    # The issues don't need to be filtered with the user's permissions anymore,
+    # since they were loaded before it and the user can see all of them
+    result, _, ctx = _execute_with_queries(_get_schema(preload=True), user.pk, query)
+    assert len(result.data["issuesWithPerm"]) == 3
+    assert "guardian_" not in get_issues_sql(ctx)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_permission_cache_preload_superuser(issues):
+    user = UserFactory.create(is_superuser=True)
+    schema = _get_schema(preload_object_perms=True)
+
+    result, _, num_queries = _execute(schema, user.pk)
+    assert [r["name"] for r in result.data["issues"]] == [i.name for i in issues]
+    assert num_queries == 1
+
+
+def test_locmem_permission_cache_maxsize():
+    cache = LocMemPermissionCache(maxsize=2, invalidate_on_change=False)
+    cache.set((1, "projects.view_issue", None, None), True)
+    cache.set((2, "projects.view_issue", None, None), False)
+    assert cache.get((1, "projects.view_issue", None, None)) is True
+
+    cache.set((3, "projects.view_issue", None, None), True)
+    assert len(cache) == 2
+    # The least recently used result got evicted
+    assert cache.get((2, "projects.view_issue", None, None)) is None
+    assert cache.get((1, "projects.view_issue", None, None)) is True
+
+
+def test_locmem_permission_cache_invalid_maxsize():
+    with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+        LocMemPermissionCache(maxsize=0)
+
+
+def test_permission_cache_is_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+        PermissionCache()  # type: ignore
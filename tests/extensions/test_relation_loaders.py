@@ -0,0 +1,194 @@
+import pytest
+import strawberry
+from asgiref.sync import sync_to_async
+from django.db.backends.utils import CursorWrapper
+
+import strawberry_django
+from strawberry_django.extensions.relation_loaders import (
+    DjangoRelationLoaderExtension,
+)
+from tests.projects.models import Issue, Milestone, Project, Tag
+
+
+@strawberry_django.type(Tag)
+class TagType:
+    name: str
+
+
+@strawberry_django.type(Issue)
+class IssueType:
+    name: str
+    tags: list[TagType]
+
+
+@strawberry_django.type(Project)
+class ProjectType:
+    name: str
+
+
+@strawberry_django.type(Milestone)
+class MilestoneType:
+    name: str
+    project: ProjectType
+    issues: list[IssueType]
+
+
+@strawberry_django.type(Project)
+class ProjectWithMilestonesType:
+    name: str
+    milestones: list[MilestoneType]
+
+
+@strawberry.type
+class Query:
+    projects: list[ProjectWithMilestonesType] = strawberry_django.field()
+    milestones: list[MilestoneType] = strawberry_django.field()
+
+
+schema = strawberry.Schema(query=Query, extensions=[DjangoRelationLoaderExtension])
+schema_without_loaders = strawberry.Schema(query=Query)
+
+query = """
+  query TestQuery {
+    projects {
+      name
+      milestones {
+        name
+        project { name }
+        issues {
+          name
+          tags { name }
+        }
+      }
+    }
+  }
+"""
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    # Patch the cursor class, as queries are executed in a worker thread
+    executed: list[str] = []
+    orig_execute = CursorWrapper.execute
+
+    def execute(self, sql, params=None):
+        executed.append(sql)
+        return orig_execute(self, sql, params)
+
+    monkeypatch.setattr(CursorWrapper, "execute", execute)
+    return executed
+
+
+@pytest.fixture
+async def projects(transactional_db):
+    def create():
+        tags = [Tag.objects.create(name=f"Tag {i}") for i in range(3)]
+        projects = [Project.objects.create(name=f"Project {i}") for i in range(3)]
+        for p in projects:
+            for i in range(2):
+                milestone = Milestone.objects.create(
+                    name=f"Milestone {p.pk}-{i}", project=p
+                )
+                issue = Issue.objects.create(
+                    name=f"Issue {milestone.pk}",
+                    milestone=milestone,
+                )
+                issue.tags.set(tags[: i + 1])
+
+        return projects
+
+    return await sync_to_async(create)()
+
+
+async def test_relation_loaders_batch_relations(projects, queries):
+    result = await schema.execute(query)
+
+    assert result.errors is None
+    assert result.data == {
+        "projects": [
+            {
+                "name": p.name,
+                "milestones": [
+                    {
+                        "name": f"Milestone {p.pk}-{i}",
+                        "project": {"name": p.name},
+                        "issues": [
+                            {
+                                "name": f"Issue {m.pk}",
+                                "tags": [{"name": f"Tag {j}"} for j in range(i + 1)],
+                            },
+                        ],
+                    }
+                    for i, m in enumerate(
+                        await sync_to_async(list)(p.milestones.order_by("pk"))
+                    )
+                ],
+            }
+            for p in projects
+        ]
+    }
+    result_without_loaders = await schema_without_loaders.execute(query)
+    assert result_without_loaders.errors is None
+    assert result_without_loaders.data == result.data
+
+
+async def test_relation_loaders_query_count(projects, queries):
+    result = await schema.execute(query)
+    assert result.errors is None
+    # projects, milestones, issues and tags. The milestones' projects are
+    # cached when prefetching the milestones
+    assert len(queries) == 4
+
+    queries.clear()
+    result = await schema_without_loaders.execute(query)
+    assert result.errors is None
+    # projects, then the milestones of each project and the issues and tags
+    # of each milestone
+    assert len(queries) == 1 + 3 + 6 * 2
+
+
+async def test_relation_loaders_optional_relation(projects, queries):
+    @strawberry_django.type(Issue)
+    class OptionalMilestoneIssueType:
+        name: str
+        milestone: MilestoneType | None
+
+    @strawberry.type
+    class IssueQuery:
+        issues: list[OptionalMilestoneIssueType] = strawberry_django.field()
+
+    await sync_to_async(Issue.objects.create)(name="Orphan")
+    queries.clear()
+    issue_schema = strawberry.Schema(
+        query=IssueQuery,
+        extensions=[DjangoRelationLoaderExtension],
+    )
+    result = await issue_schema.execute(
+        "query TestQuery { issues { name milestone { name } } }"
+    )
+
+    assert result.errors is None
+    assert result.data is not None
+    assert result.data["issues"][-1] == {"name": "Orphan", "milestone": None}
+    assert all(i["milestone"] is not None for i in result.data["issues"][:-1])
+    # issues and milestones
+    assert len(queries) == 2
+
+
+def test_relation_loaders_sync(db):
+    project = Project.objects.create(name="Project")
+    Milestone.objects.create(name="Milestone", project=project)
+
+    result = schema.execute_sync(query)
+
+    assert result.errors is None
+    assert result.data == {
+        "projects": [
+            {
+                "name": "Project",
+                "milestones": [
+                    {"name": "Milestone", "project": {"name": "Project"}, "issues": []}
+                ],
+            }
+        ]
+    }
@@ -0,0 +1,113 @@
+import pytest
+import strawberry
+from asgiref.sync import SyncToAsync, sync_to_async
+
+import strawberry_django
+from strawberry_django.extensions.sync_batch import DjangoSyncBatchExtension
+from strawberry_django.optimizer import DjangoOptimizerExtension
+from strawberry_django.resolvers import resolving_async
+from tests.projects.models import Milestone, Project
+
+
+@strawberry_django.type(Milestone)
+class MilestoneType:
+    name: str
+
+
+@strawberry_django.type(Project)
+class ProjectType:
+    name: str
+    milestones: list[MilestoneType]
+
+
+@strawberry.type
+class Query:
+    projects: list[ProjectType] = strawberry_django.field()
+
+    @strawberry_django.field
+    def project_count(self) -> int:
+        return Project.objects.count()
+
+    @strawberry_django.field
+    def resolving_async(self) -> bool:
+        return resolving_async.get()
+
+
+schema = strawberry.Schema(
+    query=Query,
+    extensions=[DjangoOptimizerExtension, DjangoSyncBatchExtension],
+)
+
+
+@pytest.fixture
+def thread_hops(monkeypatch):
+    hops: list[str] = []
+    orig_call = SyncToAsync.__call__
+
+    async def counting_call(self, *args, **kwargs):
+        hops.append(getattr(self.func, "__qualname__", "?"))
+        return await orig_call(self, *args, **kwargs)
+
+    monkeypatch.setattr(SyncToAsync, "__call__", counting_call)
+    return hops
+
+
+@pytest.fixture
+async def projects(transactional_db):
+    def create():
+        projects = [Project.objects.create(name=f"Project {i}") for i in range(3)]
+        for p in projects:
+            Milestone.objects.create(name=f"Milestone {p.pk}", project=p)
+        return projects
+
+    return await sync_to_async(create)()
+
+
+async def test_sync_batch_sibling_fields(projects, thread_hops):
+    fields = "\n".join(
+        f"p{i}: projects {{ name milestones {{ name }} }} c{i}: projectCount"
+        for i in range(10)
+    )
+    result = await schema.execute(f"query TestQuery {{ {fields} }}")
+
+    assert result.errors is None
+    assert result.data is not None
+    for i in range(10):
+        assert result.data[f"c{i}"] == 3
+        assert result.data[f"p{i}"] == [
+            {"name": p.name, "milestones": [{"name": f"Milestone {p.pk}"}]}
+            for p in projects
+        ]
+
+    # All 20 root fields are resolved in a single thread hop
+    assert thread_hops == ["_run_batch"]
+
+
+async def test_sync_batch_runs_resolvers_in_thread(thread_hops):
+    result = await schema.execute("query TestQuery { resolvingAsync }")
+
+    assert result.errors is None
+    assert result.data == {"resolvingAsync": True}
+    assert thread_hops == ["_run_batch"]
+
+
+async def test_sync_batch_errors_are_isolated(projects):
+    @strawberry.type
+    class NullableQuery:
+        @strawberry_django.field
+        def fail(self) -> int | None:
+            raise ValueError("failed")
+
+        @strawberry_django.field
+        def project_count(self) -> int:
+            return Project.objects.count()
+
+    nullable_schema = strawberry.Schema(
+        query=NullableQuery,
+        extensions=[DjangoSyncBatchExtension],
+    )
+    result = await nullable_schema.execute("query TestQuery { fail projectCount }")
+
+    assert result.errors is not None
+    assert [e.message for e in result.errors] == ["failed"]
+    assert result.data == {"fail": None, "projectCount": 3}
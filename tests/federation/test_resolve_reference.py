@@ -173,9 +173,9 @@ def test_resolve_reference_uses_optimizer_extension():
     optimize_calls: list[bool] = []
 
     class RecordingOptimizerExtension(DjangoOptimizerExtension):
-        def optimize(self, qs, info, *, store=None):
+        def optimize(self, qs, info, *, store=None, type_name=None):
             optimize_calls.append(True)
-            return super().optimize(qs, info, store=store)
+            return super().optimize(qs, info, store=store, type_name=type_name)
 
     @strawberry_django.federation.type(models.Fruit, keys=["id"])
     class FruitType:
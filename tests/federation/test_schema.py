@@ -2,6 +2,8 @@
 
 import pytest
 import strawberry
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from strawberry.federation import Schema as FederationSchema
 from strawberry.federation.schema_directives import (
     Authenticated,
@@ -18,6 +20,7 @@ from strawberry.federation.schema_directives import (
 from strawberry.types import get_object_definition
 
 import strawberry_django
+from strawberry_django.federation import resolve
 from strawberry_django.optimizer import DjangoOptimizerExtension
 from tests import models
 from tests.utils import assert_num_queries
@@ -761,6 +764,241 @@ def test_entities_resolver_with_optimizer_and_fk():
     assert result.data["_entities"][0]["color"]["name"] == "yellow"
 
 
+@pytest.mark.django_db
+def test_entities_resolver_batches_representations():
+    """Test _entities fetches the representations of each type and key at once."""
+
+    @strawberry_django.federation.type(models.Color, keys=["id"])
+    class ColorType:
+        id: strawberry.auto
+        name: strawberry.auto
+
+    @strawberry_django.federation.type(models.Fruit, keys=["id", "name"])
+    class FruitType:
+        id: strawberry.auto
+        name: strawberry.auto
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def hello(self) -> str:
+            return "world"
+
+    schema = FederationSchema(
+        query=Query,
+        types=[FruitType, ColorType],
+        extensions=[DjangoOptimizerExtension()],
+    )
+
+    fruits = [models.Fruit.objects.create(name=f"fruit{i}") for i in range(5)]
+    colors = [models.Color.objects.create(name=f"color{i}") for i in range(2)]
+    representations = [
+        {"__typename": "FruitType", "id": str(fruits[3].pk)},
+        {"__typename": "ColorType", "id": str(colors[1].pk)},
+        {"__typename": "FruitType", "name": "fruit1"},
+        {"__typename": "FruitType", "id": str(fruits[0].pk)},
+        {"__typename": "ColorType", "id": str(colors[0].pk)},
+        {"__typename": "FruitType", "name": "fruit4"},
+    ]
+
+    # One query for the fruits by id, another for them by name, and one for colors
+    with assert_num_queries(3):
+        result = schema.execute_sync(
+            """
+            query ($representations: [_Any!]!) {
+                _entities(representations: $representations) {
+                    ... on FruitType {
+                        name
+                    }
+                    ... on ColorType {
+                        name
+                    }
+                }
+            }
+            """,
+            variable_values={"representations": representations},
+        )
+
+    assert result.errors is None
+    assert result.data == {
+        "_entities": [
+            {"name": "fruit3"},
+            {"name": "color1"},
+            {"name": "fruit1"},
+            {"name": "fruit0"},
+            {"name": "color0"},
+            {"name": "fruit4"},
+        ],
+    }
+
+
+@pytest.mark.django_db
+def test_entities_resolver_optimizes_each_type_once(mocker):
+    """Test _entities optimizes the references of a type once, for its own selections."""
+    optimize = mocker.spy(DjangoOptimizerExtension, "optimize")
+
+    @strawberry_django.federation.type(models.Color, keys=["id"])
+    class ColorType:
+        id: strawberry.auto
+        name: strawberry.auto
+
+    @strawberry_django.federation.type(models.Fruit, keys=["id", "name"])
+    class FruitType:
+        id: strawberry.auto
+        name: strawberry.auto
+        sweetness: strawberry.auto
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def hello(self) -> str:
+            return "world"
+
+    schema = FederationSchema(
+        query=Query,
+        types=[FruitType, ColorType],
+        extensions=[DjangoOptimizerExtension()],
+    )
+
+    fruits = [
+        models.Fruit.objects.create(name=f"fruit{i}", sweetness=i) for i in range(3)
+    ]
+    color = models.Color.objects.create(name="red")
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = schema.execute_sync(
+            """
+            query ($representations: [_Any!]!) {
+                _entities(representations: $representations) {
+                    ... on FruitType {
+                        sweetness
+                    }
+                    ... on ColorType {
+                        name
+                    }
+                }
+            }
+            """,
+            variable_values={
+                "representations": [
+                    {"__typename": "FruitType", "id": str(fruits[0].pk)},
+                    {"__typename": "ColorType", "id": str(color.pk)},
+                    {"__typename": "FruitType", "name": "fruit2"},
+                    {"__typename": "FruitType", "id": "invalid"},
+                ],
+            },
+        )
+
+    assert result.data == {
+        "_entities": [{"sweetness": 0}, {"name": "red"}, {"sweetness": 2}, None],
+    }
+    assert result.errors is not None
+    assert len(result.errors) == 1
+    assert result.errors[0].path == ["_entities", 3]
+    # All the fruit references share the optimization done for FruitType, even
+    # the invalid one that can't be batched with the others
+    assert optimize.call_count == 2
+    fruit_queries = [
+        q["sql"] for q in ctx.captured_queries if 'FROM "tests_fruit"' in q["sql"]
+    ]
+    assert len(fruit_queries) == 2
+    # Only the columns selected on FruitType are fetched, not the ColorType ones
+    # (the name is only fetched as the key of the fruits referenced by name)
+    by_id, by_name = fruit_queries
+    assert by_id.startswith(
+        'SELECT "tests_fruit"."id", "tests_fruit"."sweetness" FROM',
+    )
+    assert by_name.startswith(
+        'SELECT "tests_fruit"."id", "tests_fruit"."name", "tests_fruit"."sweetness" FROM',
+    )
+
+
+@pytest.mark.django_db
+def test_entities_resolver_batch_with_missing_entities():
+    """Test missing entities only fail their own representations in a batch."""
+
+    @strawberry_django.federation.type(models.Fruit, keys=["id"])
+    class FruitType:
+        id: strawberry.auto
+        name: strawberry.auto
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def hello(self) -> str:
+            return "world"
+
+    schema = FederationSchema(query=Query, types=[FruitType])
+
+    fruit = models.Fruit.objects.create(name="strawberry")
+
+    with assert_num_queries(1):
+        result = schema.execute_sync(
+            f"""
+            query {{
+                _entities(representations: [
+                    {{__typename: "FruitType", id: {fruit.pk + 1}}}
+                    {{__typename: "FruitType", id: {fruit.pk}}}
+                ]) {{
+                    ... on FruitType {{
+                        name
+                    }}
+                }}
+            }}
+            """
+        )
+
+    assert result.data == {"_entities": [None, {"name": "strawberry"}]}
+    assert result.errors is not None
+    assert len(result.errors) == 1
+    assert result.errors[0].message == "Fruit matching query does not exist."
+    assert result.errors[0].path == ["_entities", 0]
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_entities_resolver_batches_representations_async(mocker):
+    """Test _entities batches the representations in async executions too."""
+    fetch_references = mocker.spy(resolve, "_fetch_references")
+
+    @strawberry_django.federation.type(models.Fruit, keys=["id"])
+    class FruitType:
+        id: strawberry.auto
+        name: strawberry.auto
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def hello(self) -> str:
+            return "world"
+
+    schema = FederationSchema(query=Query, types=[FruitType])
+
+    fruits = [await models.Fruit.objects.acreate(name=f"fruit{i}") for i in range(3)]
+
+    result = await schema.execute(
+        """
+        query ($representations: [_Any!]!) {
+            _entities(representations: $representations) {
+                ... on FruitType {
+                    name
+                }
+            }
+        }
+        """,
+        variable_values={
+            "representations": [
+                {"__typename": "FruitType", "id": str(f.pk)} for f in reversed(fruits)
+            ],
+        },
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "_entities": [{"name": "fruit2"}, {"name": "fruit1"}, {"name": "fruit0"}],
+    }
+    assert fetch_references.call_count == 1
+
+
 # =============================================================================
 # SDL output
 # =============================================================================
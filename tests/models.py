@@ -150,3 +150,23 @@ class NonIdPkModel(models.Model):
     # exercise the ``pk.name``/``pk.attname`` branch of ``_pk_lookup``.
     code = models.CharField(primary_key=True, max_length=50)
     text = models.CharField(max_length=50)
+
+
+class Product(models.Model):
+    sku = models.CharField(max_length=50, unique=True)
+    name = models.CharField(max_length=50)
+    color = models.ForeignKey(
+        Color,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+    )
+    price = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [  # ruff: ignore[mutable-class-default]
+            models.UniqueConstraint(
+                fields=["name", "color"],
+                name="unique_product_name_color",
+            ),
+        ]
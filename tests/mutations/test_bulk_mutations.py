@@ -0,0 +1,460 @@
+"""Tests for bulk mutations.
+
+Bulk mutations are batched mutations that use `bulk_create`, `bulk_update` and
+queryset `delete()` instead of saving/deleting objects one by one.
+"""
+
+import pytest
+import strawberry
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.db import connection
+from django.db.models import signals
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from strawberry import auto
+from strawberry.django.context import StrawberryDjangoContext
+
+import strawberry_django
+from strawberry_django import mutations
+from strawberry_django.pagination import LocMemCountCache
+from strawberry_django.permissions import HasRetvalPerm, LocMemPermissionCache
+from tests import models, utils
+from tests.types import Fruit, FruitType, FruitTypeInput
+
+
+@strawberry_django.filters.filter_type(models.Fruit, lookups=True)
+class FruitFilter:
+    id: auto
+
+
+@strawberry_django.input(models.Fruit)
+class FruitBulkInput:
+    name: auto
+    sweetness: auto
+    types: auto
+
+
+@strawberry_django.partial(models.Fruit)
+class FruitBulkPartialInput:
+    id: auto
+    name: auto
+    sweetness: auto
+
+
+@strawberry_django.type(models.Product)
+class Product:
+    sku: auto
+    name: auto
+
+
+@strawberry_django.input(models.Product)
+class ProductBulkInput:
+    sku: auto
+    name: auto
+
+
+@strawberry_django.partial(models.Product)
+class ProductBulkPartialInput:
+    id: auto
+    sku: auto
+
+
+@strawberry.type
+class Mutation:
+    create_fruits: list[Fruit] = mutations.create(list[FruitBulkInput], bulk=True)
+    create_fruit_types: list[FruitType] = mutations.create(
+        list[FruitTypeInput],
+        bulk=True,
+    )
+    patch_fruits: list[Fruit] = mutations.update(
+        list[FruitBulkPartialInput],
+        key_attr="id",
+        bulk=True,
+    )
+    update_fruits: list[Fruit] = mutations.update(
+        FruitBulkPartialInput,
+        filters=FruitFilter,
+        key_attr="id",
+        bulk=True,
+    )
+    delete_fruits: list[Fruit] = mutations.delete(filters=FruitFilter, bulk=True)
+    patch_fruits_with_perm: list[Fruit] = mutations.update(
+        list[FruitBulkPartialInput],
+        key_attr="id",
+        bulk=True,
+        extensions=[HasRetvalPerm(perms=["tests.change_fruit"])],
+    )
+    create_products: list[Product] = mutations.create(
+        list[ProductBulkInput],
+        bulk=True,
+    )
+    patch_products: list[Product] = mutations.update(
+        list[ProductBulkPartialInput],
+        key_attr="id",
+        bulk=True,
+    )
+
+
+@pytest.fixture
+def mutation(db):
+    return utils.generate_query(mutation=Mutation)
+
+
+def test_bulk_create(mutation):
+    fruit_types = [
+        models.FruitType.objects.create(name=name) for name in ["sweet", "sour"]
+    ]
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            """
+            mutation($data: [FruitBulkInput!]!) {
+              fruits: createFruits(data: $data) {
+                name
+                sweetness
+                types { name }
+              }
+            }
+            """,
+            {
+                "data": [
+                    {
+                        "name": f"fruit{i}",
+                        "sweetness": i,
+                        "types": {"set": [str(t.pk) for t in fruit_types[: i % 3]]},
+                    }
+                    for i in range(6)
+                ],
+            },
+        )
+
+    assert not result.errors
+    assert result.data["fruits"] == [
+        {
+            "name": f"fruit{i}",
+            "sweetness": i,
+            "types": [{"name": t.name} for t in fruit_types[: i % 3]],
+        }
+        for i in range(6)
+    ]
+    # One insert for the fruits and another one for their types
+    assert utils.count_queries(ctx, 'INSERT INTO "tests_fruit"') == 1
+    assert utils.count_queries(ctx, 'INSERT INTO "tests_fruit_types"') == 1
+
+
+def test_bulk_create_validates_all_inputs_first(mutation):
+    result = mutation(
+        """
+        {
+          fruitTypes: createFruitTypes(
+            data: [{ name: "sweet" }, { name: "rotten" }]
+          ) {
+            name
+          }
+        }
+        """
+    )
+
+    assert result.errors
+    assert result.errors[0].message == "{'name': ['We do not allow rotten fruits.']}"
+    assert not models.FruitType.objects.exists()
+
+
+def test_bulk_create_validates_unique_values_in_the_batch(mutation):
+    result = mutation(
+        """
+        {
+          products: createProducts(
+            data: [
+              { sku: "a", name: "apple" },
+              { sku: "b", name: "banana" },
+              { sku: "a", name: "avocado" },
+            ]
+          ) {
+            sku
+          }
+        }
+        """
+    )
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "{'sku': ['Product with this Sku already exists.']}"
+    )
+    assert not models.Product.objects.exists()
+
+
+def test_bulk_create_missing_m2m(mutation):
+    result = mutation(
+        """
+        {
+          fruits: createFruits(
+            data: [{ name: "banana", types: { set: ["999"] } }]
+          ) {
+            name
+          }
+        }
+        """
+    )
+
+    assert result.errors
+    assert result.errors[0].message == "FruitType matching query does not exist."
+    assert not models.Fruit.objects.exists()
+
+
+def test_bulk_create_falls_back_with_save_signals(mutation):
+    saved = []
+
+    def receiver(sender, instance, created, **kwargs):
+        saved.append(instance.name)
+
+    signals.post_save.connect(receiver, sender=models.FruitType)
+    try:
+        result = mutation(
+            """
+            {
+              fruitTypes: createFruitTypes(
+                data: [{ name: "sweet" }, { name: "sour" }]
+              ) {
+                name
+              }
+            }
+            """
+        )
+    finally:
+        signals.post_save.disconnect(receiver, sender=models.FruitType)
+
+    assert not result.errors
+    assert result.data["fruitTypes"] == [{"name": "sweet"}, {"name": "sour"}]
+    assert saved == ["sweet", "sour"]
+
+
+def test_bulk_create_invalidates_library_caches(mutation):
+    fruit_type = models.FruitType.objects.create(name="sweet")
+    count_cache = LocMemCountCache()
+    # The caches' receivers don't prevent the bulk saves
+    _permission_cache = LocMemPermissionCache()
+    tables = ["tests_fruit", "tests_fruit_types"]
+    generations = count_cache.get_generations(tables)
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            """
+            mutation($data: [FruitBulkInput!]!) {
+              fruits: createFruits(data: $data) {
+                name
+              }
+            }
+            """,
+            {
+                "data": [
+                    {"name": f"fruit{i}", "types": {"set": [str(fruit_type.pk)]}}
+                    for i in range(3)
+                ],
+            },
+        )
+
+    assert not result.errors
+    assert utils.count_queries(ctx, 'INSERT INTO "tests_fruit"') == 1
+    assert utils.count_queries(ctx, 'INSERT INTO "tests_fruit_types"') == 1
+    assert all(
+        new > old
+        for old, new in zip(
+            generations,
+            count_cache.get_generations(tables),
+            strict=True,
+        )
+    )
+
+
+def test_bulk_update_invalidates_count_cache(mutation, fruits):
+    count_cache = LocMemCountCache()
+    (generation,) = count_cache.get_generations(["tests_fruit"])
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            """
+            mutation($data: [FruitBulkPartialInput!]!) {
+              patchFruits(data: $data) {
+                sweetness
+              }
+            }
+            """,
+            {"data": [{"id": fruit.pk, "sweetness": 1} for fruit in fruits]},
+        )
+
+    assert not result.errors
+    assert utils.count_queries(ctx, 'UPDATE "tests_fruit"') == 1
+    assert count_cache.get_generations(["tests_fruit"]) == [generation + 1]
+
+
+def test_bulk_update(mutation, fruits):
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            """
+            mutation($data: [FruitBulkPartialInput!]!) {
+              fruits: patchFruits(data: $data) {
+                id
+                name
+                sweetness
+              }
+            }
+            """,
+            {
+                "data": [
+                    {"id": fruits[0].pk, "name": "orange"},
+                    {"id": fruits[2].pk, "sweetness": 10},
+                ],
+            },
+        )
+
+    assert not result.errors
+    assert result.data["fruits"] == [
+        {"id": str(fruits[0].pk), "name": "orange", "sweetness": 5},
+        {"id": str(fruits[2].pk), "name": "banana", "sweetness": 10},
+    ]
+    # The instances to update are all fetched together
+    assert utils.count_queries(ctx, 'SELECT "tests_fruit"') == 1
+    assert utils.count_queries(ctx, 'UPDATE "tests_fruit"') == 1
+    assert list(
+        models.Fruit.objects.order_by("pk").values_list("name", "sweetness"),
+    ) == [("orange", 5), ("raspberry", 5), ("banana", 10)]
+
+
+def test_bulk_update_missing_instance(mutation, fruits):
+    result = mutation(
+        """
+        mutation($data: [FruitBulkPartialInput!]!) {
+          patchFruits(data: $data) {
+            name
+          }
+        }
+        """,
+        {
+            "data": [
+                {"id": fruits[0].pk, "name": "orange"},
+                {"id": 999, "name": "lemon"},
+            ],
+        },
+    )
+
+    assert result.errors
+    assert result.errors[0].message == "Fruit matching query does not exist."
+    assert models.Fruit.objects.get(pk=fruits[0].pk).name == "strawberry"
+
+
+def test_bulk_update_validates_unique_values_in_the_batch(mutation):
+    rows = [
+        models.Product.objects.create(sku=value, name=value)
+        for value in ["a", "b", "c"]
+    ]
+
+    result = mutation(
+        """
+        mutation($data: [ProductBulkPartialInput!]!) {
+          products: patchProducts(data: $data) {
+            sku
+          }
+        }
+        """,
+        {
+            "data": [
+                {"id": rows[0].pk, "sku": "d"},
+                {"id": rows[1].pk, "sku": "d"},
+            ],
+        },
+    )
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "{'sku': ['Product with this Sku already exists.']}"
+    )
+    assert list(
+        models.Product.objects.order_by("pk").values_list("sku", flat=True),
+    ) == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("has_perm", [True, False])
+def test_bulk_update_checks_perms(mutation, fruits, has_perm):
+    user = get_user_model().objects.create(username="user")
+    if has_perm:
+        user.user_permissions.add(Permission.objects.get(codename="change_fruit"))
+
+    request = RequestFactory().post("/")
+    request.user = user
+    result = mutation(
+        """
+        mutation($data: [FruitBulkPartialInput!]!) {
+          patchFruitsWithPerm(data: $data) {
+            name
+          }
+        }
+        """,
+        {
+            "data": [
+                {"id": fruits[0].pk, "name": "orange"},
+                {"id": fruits[1].pk, "name": "lemon"},
+            ],
+        },
+        StrawberryDjangoContext(request=request, response=None),
+    )
+
+    names = list(models.Fruit.objects.order_by("pk").values_list("name", flat=True))
+    if has_perm:
+        assert not result.errors
+        assert names == ["orange", "lemon", "banana"]
+    else:
+        assert result.errors
+        assert result.errors[0].message == (
+            "You don't have permission to access this app."
+        )
+        assert names == ["strawberry", "raspberry", "banana"]
+
+
+def test_bulk_update_with_filter(mutation, fruits):
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            """
+            mutation($ids: [ID!]) {
+              fruits: updateFruits(
+                data: { sweetness: 1 }
+                filters: { id: { inList: $ids } }
+              ) {
+                name
+                sweetness
+              }
+            }
+            """,
+            {"ids": [str(fruits[0].pk), str(fruits[1].pk)]},
+        )
+
+    assert not result.errors
+    assert result.data["fruits"] == [
+        {"name": "strawberry", "sweetness": 1},
+        {"name": "raspberry", "sweetness": 1},
+    ]
+    assert utils.count_queries(ctx, 'UPDATE "tests_fruit"') == 1
+
+
+def test_bulk_delete_with_filter(mutation, fruits):
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            """
+            mutation($ids: [ID!]) {
+              fruits: deleteFruits(filters: { id: { inList: $ids } }) {
+                id
+                name
+              }
+            }
+            """,
+            {"ids": [str(fruits[0].pk), str(fruits[1].pk)]},
+        )
+
+    assert not result.errors
+    assert result.data["fruits"] == [
+        {"id": str(fruits[0].pk), "name": "strawberry"},
+        {"id": str(fruits[1].pk), "name": "raspberry"},
+    ]
+    assert utils.count_queries(ctx, 'DELETE FROM "tests_fruit"') == 1
+    assert list(models.Fruit.objects.values_list("name", flat=True)) == ["banana"]
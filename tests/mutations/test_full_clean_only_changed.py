@@ -0,0 +1,199 @@
+"""Tests for the `only_changed` option of `FullCleanOptions`.
+
+It makes update mutations validate only the changed fields, checking the
+unique constraints involving them with a single query per constraint.
+"""
+
+import pytest
+import strawberry
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from strawberry import auto
+
+import strawberry_django
+from strawberry_django import mutations
+from strawberry_django.mutations.types import FullCleanOptions
+from tests import models, utils
+
+
+@strawberry_django.type(models.Product)
+class Product:
+    id: auto
+    sku: auto
+    name: auto
+    price: auto
+
+
+@strawberry_django.partial(models.Product)
+class ProductPartialInput:
+    id: auto
+    sku: auto
+    name: auto
+    price: auto
+
+
+@strawberry.type
+class Mutation:
+    update_product: Product = mutations.update(
+        ProductPartialInput,
+        key_attr="id",
+        full_clean=FullCleanOptions(only_changed=True),
+    )
+    update_products: list[Product] = mutations.update(
+        list[ProductPartialInput],
+        key_attr="id",
+        full_clean=FullCleanOptions(only_changed=True),
+        bulk=True,
+    )
+    update_product_full: Product = mutations.update(
+        ProductPartialInput,
+        key_attr="id",
+    )
+
+
+@pytest.fixture
+def mutation(db):
+    return utils.generate_query(mutation=Mutation)
+
+
+@pytest.fixture
+def products(db):
+    color = models.Color.objects.create(name="red")
+    return [
+        models.Product.objects.create(sku=f"sku{i}", name=f"product{i}", color=color)
+        for i in range(3)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("field", "num_checks"),
+    [("updateProduct", 0), ("updateProductFull", 3)],
+)
+def test_update_skips_unchanged_fields_checks(mutation, products, field, num_checks):
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            f"""
+            mutation($data: ProductPartialInput!) {{
+              product: {field}(data: $data) {{
+                price
+              }}
+            }}
+            """,
+            {"data": {"id": products[0].pk, "price": 10}},
+        )
+
+    assert not result.errors
+    assert result.data["product"] == {"price": 10}
+    # The lookup of the product to update plus the checks for the unique sku,
+    # the unique (name, color) constraint and the existence of the color
+    assert utils.count_queries(ctx, "SELECT") == 1 + num_checks
+
+
+def test_update_validates_changed_fields(mutation, products):
+    result = mutation(
+        """
+        mutation($data: ProductPartialInput!) {
+          product: updateProduct(data: $data) {
+            price
+          }
+        }
+        """,
+        {"data": {"id": products[0].pk, "sku": "sku1"}},
+    )
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "{'sku': ['Product with this Sku already exists.']}"
+    )
+    products[0].refresh_from_db()
+    assert products[0].sku == "sku0"
+
+
+def test_update_validates_constraints_of_changed_fields(mutation, products):
+    result = mutation(
+        """
+        mutation($data: ProductPartialInput!) {
+          product: updateProduct(data: $data) {
+            price
+          }
+        }
+        """,
+        {"data": {"id": products[0].pk, "name": "product1"}},
+    )
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "{'__all__': ['Product with this Name and Color already exists.']}"
+    )
+
+
+def test_update_still_runs_clean_fields_of_changed_fields(mutation, products):
+    result = mutation(
+        """
+        mutation($data: ProductPartialInput!) {
+          product: updateProduct(data: $data) {
+            price
+          }
+        }
+        """,
+        {"data": {"id": products[0].pk, "sku": "x" * 51}},
+    )
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "{'sku': ['Ensure this value has at most 50 characters (it has 51).']}"
+    )
+
+
+def test_bulk_update_checks_unique_fields_once(mutation, products):
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            """
+            mutation($data: [ProductPartialInput!]!) {
+              products: updateProducts(data: $data) {
+                sku
+                price
+              }
+            }
+            """,
+            {
+                "data": [
+                    {"id": p.pk, "sku": f"new-sku{i}", "price": i}
+                    for i, p in enumerate(products)
+                ],
+            },
+        )
+
+    assert not result.errors
+    assert result.data["products"] == [
+        {"sku": f"new-sku{i}", "price": i} for i in range(len(products))
+    ]
+    # The lookup of the products to update plus a single check for the skus
+    assert utils.count_queries(ctx, "SELECT") == 2
+
+
+def test_bulk_update_reports_the_conflicting_instance(mutation, products):
+    result = mutation(
+        """
+        mutation($data: [ProductPartialInput!]!) {
+          products: updateProducts(data: $data) {
+            id
+            sku
+          }
+        }
+        """,
+        {
+            "data": [
+                {"id": products[0].pk, "sku": "new-sku"},
+                {"id": products[1].pk, "sku": "sku2"},
+            ],
+        },
+    )
+
+    assert result.errors
+    assert result.errors[0].message == (
+        "{'sku': ['Product with this Sku already exists.']}"
+    )
+    assert list(
+        models.Product.objects.order_by("pk").values_list("sku", flat=True),
+    ) == ["sku0", "sku1", "sku2"]
@@ -0,0 +1,127 @@
+"""Tests for the refetch of mutated objects when the optimizer is enabled.
+
+Instead of refetching them with an optimized queryset, mutations reuse the
+objects they already have in memory when those hold what the selections need,
+only prefetching the relations that are missing.
+"""
+
+import pytest
+import strawberry
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from strawberry import auto
+
+import strawberry_django
+from strawberry_django import mutations
+from tests import models, utils
+from tests.types import Fruit
+
+
+@strawberry_django.partial(models.Fruit)
+class FruitRefetchPartialInput:
+    id: auto
+    name: auto
+    sweetness: auto
+
+
+@strawberry.type
+class Mutation:
+    update_fruit: Fruit = mutations.update(FruitRefetchPartialInput, key_attr="id")
+    update_fruits: list[Fruit] = mutations.update(
+        list[FruitRefetchPartialInput],
+        key_attr="id",
+        bulk=True,
+    )
+
+
+@pytest.fixture
+def mutation(db):
+    return utils.generate_query(mutation=Mutation, enable_optimizer=True)
+
+
+def test_update_does_not_refetch_loaded_fields(mutation, fruit):
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            """
+            mutation($data: FruitRefetchPartialInput!) {
+              fruit: updateFruit(data: $data) {
+                id
+                name
+                sweetness
+              }
+            }
+            """,
+            {"data": {"id": fruit.pk, "name": "orange"}},
+        )
+
+    assert not result.errors
+    assert result.data["fruit"] == {
+        "id": str(fruit.pk),
+        "name": "orange",
+        "sweetness": fruit.sweetness,
+    }
+    # Only the query fetching the fruit to update, not another one to refetch it
+    assert utils.count_queries(ctx, 'SELECT "tests_fruit"') == 1
+
+
+def test_update_prefetches_missing_relations(mutation, fruit):
+    fruit.color = models.Color.objects.create(name="red")
+    fruit.save()
+    fruit.types.set([models.FruitType.objects.create(name="sweet")])
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            """
+            mutation($data: FruitRefetchPartialInput!) {
+              fruit: updateFruit(data: $data) {
+                name
+                color { name }
+                types { name }
+              }
+            }
+            """,
+            {"data": {"id": fruit.pk, "name": "orange"}},
+        )
+
+    assert not result.errors
+    assert result.data["fruit"] == {
+        "name": "orange",
+        "color": {"name": "red"},
+        "types": [{"name": "sweet"}],
+    }
+    assert utils.count_queries(ctx, 'SELECT "tests_fruit"') == 1
+    assert utils.count_queries(ctx, 'SELECT "tests_color"') == 1
+    assert utils.count_queries(ctx, 'SELECT ("tests_fruit_types"') == 1
+
+
+def test_bulk_update_prefetches_missing_relations(mutation, fruits):
+    fruit_type = models.FruitType.objects.create(name="sweet")
+    for fruit in fruits:
+        fruit.types.set([fruit_type])
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = mutation(
+            """
+            mutation($data: [FruitRefetchPartialInput!]!) {
+              fruits: updateFruits(data: $data) {
+                name
+                types { name }
+              }
+            }
+            """,
+            {"data": [{"id": f.pk, "sweetness": 1} for f in fruits]},
+        )
+
+    assert not result.errors
+    assert result.data["fruits"] == [
+        {"name": f.name, "types": [{"name": "sweet"}]} for f in fruits
+    ]
+    # The fruits are fetched one by one to be updated, but not refetched after it
+    queries = [q["sql"] for q in ctx.captured_queries]
+    update_index = next(
+        i for i, sql in enumerate(queries) if sql.startswith('UPDATE "tests_fruit"')
+    )
+    assert not any(
+        sql.startswith('SELECT "tests_fruit"') for sql in queries[update_index:]
+    )
+    assert utils.count_queries(ctx, 'SELECT ("tests_fruit_types"') == 1
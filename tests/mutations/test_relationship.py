@@ -5,6 +5,8 @@ It includes tests for one-to-many, many-to-one, and many-to-many relationships.
 """
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from tests import models
 
@@ -118,3 +120,25 @@ def test_update_many_to_many(mutation, fruit, fruit_type):
     )
     assert not result.errors
     assert result.data["types"] == [{"fruits": []}]
+
+
+def test_update_many_to_many_set_queries_do_not_scale(mutation, fruit_type):
+    fruits = [models.Fruit.objects.create(name=f"fruit{i}") for i in range(20)]
+    fruit_type.fruits.set(fruits[:10])
+
+    def set_fruits(pks):
+        with CaptureQueriesContext(connection) as ctx:
+            result = mutation(
+                "mutation($pks: [ID!]) { types: updateFruitTypes("
+                "data: { fruits: { set: $pks } }) { name } }",
+                {"pks": [str(pk) for pk in pks]},
+            )
+        assert not result.errors
+        return len(ctx.captured_queries)
+
+    # Both remove and add some fruits, the second time with a lot more of them
+    num_queries = set_fruits([fruits[0].pk, fruits[10].pk])
+    assert set_fruits([f.pk for f in fruits[1:]]) == num_queries
+    assert set(fruit_type.fruits.values_list("pk", flat=True)) == {
+        f.pk for f in fruits[1:]
+    }
@@ -0,0 +1,109 @@
+"""Tests for `resolve_references`.
+
+It fetches all the objects referenced in a parsed mutation input with a single
+query per model, instead of one query per reference.
+"""
+
+import pytest
+from strawberry import UNSET
+
+from strawberry_django.mutations import resolvers
+from strawberry_django.mutations.types import ParsedObject, ParsedObjectList
+from tests import models
+
+
+@pytest.fixture
+def colors(db):
+    return [models.Color.objects.create(name=name) for name in ["red", "blue"]]
+
+
+@pytest.fixture
+def fruit_types(db):
+    return [models.FruitType.objects.create(name=name) for name in ["sweet", "sour"]]
+
+
+def test_resolve_references(colors, fruit_types, django_assert_num_queries):
+    red, blue = colors
+    sweet, sour = fruit_types
+    data = [
+        {
+            "name": "strawberry",
+            "color": str(red.pk),
+            "types": ParsedObjectList(set=[str(sweet.pk), ParsedObject(pk=sour.pk)]),
+        },
+        {
+            "name": "blueberry",
+            "color": ParsedObject(pk=str(blue.pk)),
+            "types": ParsedObjectList(add=[{"pk": str(sour.pk)}]),
+        },
+    ]
+
+    with django_assert_num_queries(2):
+        resolved = resolvers.resolve_references(models.Fruit, data)
+
+    assert resolved == [
+        {
+            "name": "strawberry",
+            "color": red,
+            "types": ParsedObjectList(
+                set=[sweet, ParsedObject(pk=sour)],
+            ),
+        },
+        {
+            "name": "blueberry",
+            "color": ParsedObject(pk=blue),
+            "types": ParsedObjectList(add=[ParsedObject(pk=sour, data={})]),
+        },
+    ]
+
+
+def test_resolve_references_of_new_objects(db, django_assert_num_queries):
+    fruit = models.Fruit.objects.create(name="banana")
+    data = {
+        "name": "strawberry",
+        "color": ParsedObject(
+            pk=UNSET,
+            data={"name": "green", "fruits": [str(fruit.pk)]},
+        ),
+    }
+
+    with django_assert_num_queries(1):
+        resolved = resolvers.resolve_references(models.Fruit, data)
+
+    assert resolved == {
+        "name": "strawberry",
+        "color": ParsedObject(
+            pk=UNSET,
+            data={"name": "green", "fruits": [fruit]},
+        ),
+    }
+
+
+def test_resolve_references_keeps_missing_references(
+    colors,
+    django_assert_num_queries,
+):
+    red, _blue = colors
+    data = {"name": "strawberry", "color": str(red.pk + 100)}
+
+    with django_assert_num_queries(1):
+        resolved = resolvers.resolve_references(models.Fruit, data)
+
+    assert resolved == data
+
+
+def test_bulk_parse_pks_parsed_objects_by_pk(db, django_assert_num_queries):
+    products = [
+        models.Product.objects.create(sku=str(i + 100), name=f"product{i}")
+        for i in range(2)
+    ]
+    values = [ParsedObject(pk=str(products[0].pk)), {"sku": products[1].sku}]
+
+    # ParsedObject.parse() fetches by pk, regardless of the key_attr
+    with django_assert_num_queries(2):
+        parsed = resolvers._bulk_parse_pks(models.Product, values, key_attr="sku")
+
+    assert parsed == [
+        ParsedObject(pk=products[0]),
+        ParsedObject(pk=products[1], data={}),
+    ]
@@ -3,8 +3,10 @@ from typing import cast
 
 import pytest
 import strawberry
+from django.db import connection
 from django.db.models import F, OrderBy, QuerySet, Value
 from django.db.models.aggregates import Count
+from django.test.utils import CaptureQueriesContext
 from pytest_mock import MockFixture
 from strawberry.relay import GlobalID, Node, to_base64
 
@@ -13,6 +15,7 @@ from strawberry_django.optimizer import DjangoOptimizerExtension
 from strawberry_django.relay import (
     DjangoCursorConnection,
     DjangoCursorEdge,
+    explain_cursor_pagination,
 )
 from tests.projects.models import Milestone, Project
 from tests.utils import assert_num_queries
@@ -1709,3 +1712,74 @@ def test_cursor_connection_rejects_non_querysets(mocker: MockFixture):
         DjangoCursorConnection.resolve_connection(
             list(Project.objects.all()), info=mocker.Mock()
         )
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize(
+    ("order", "row_value"),
+    [
+        ("{ name: ASC }", True),
+        ("{ name: DESC id: DESC }", True),
+        ("{ name: DESC }", False),
+        ("{ dueDate: ASC }", False),
+        ("{ milestoneCount: ASC }", False),
+    ],
+)
+def test_cursor_pagination_row_value_comparison(
+    test_objects, mocker: MockFixture, order, row_value
+):
+    # SQLite supports row values, but Django only uses them on some backends
+    mocker.patch.object(connection.features, "supports_tuple_lookups", True)
+    query = f"""
+    query TestQuery ($after: String) {{
+        projects(first: 1, after: $after, order: {order}) {{
+            edges {{
+                cursor
+            }}
+        }}
+    }}
+    """
+
+    result = schema.execute_sync(query)
+    assert result.errors is None
+    after = result.data["projects"]["edges"][0]["cursor"]  # type: ignore
+
+    with CaptureQueriesContext(connection) as ctx:
+        result = schema.execute_sync(query, {"after": after})
+
+    assert result.errors is None
+    assert len(result.data["projects"]["edges"]) == 1  # type: ignore
+    (sql,) = [q["sql"] for q in ctx.captured_queries]
+    assert ('("projects_project"."name", "projects_project"."id") ' in sql) is row_value
+
+
+@pytest.mark.django_db(transaction=True)
+def test_explain_cursor_pagination(test_objects):
+    after = to_base64(DjangoCursorEdge.CURSOR_PREFIX, '["3"]')
+    explanation = explain_cursor_pagination(
+        Project.objects.order_by("pk"),
+        first=2,
+        after=after,
+    )
+    assert explanation.sql.endswith(
+        'WHERE "projects_project"."id" > 3 ORDER BY "projects_project"."id" ASC LIMIT 3'
+    )
+    assert explanation.plan
+    assert explanation.uses_index
+    assert not explanation.needs_sort
+
+    explanation = explain_cursor_pagination(
+        Project.objects.order_by("name"),
+        first=2,
+        after=to_base64(DjangoCursorEdge.CURSOR_PREFIX, '["Project B","3"]'),
+    )
+    assert not explanation.uses_index
+    assert explanation.needs_sort
+
+    # The index is only used for filtering, the rows still need to be sorted
+    explanation = explain_cursor_pagination(
+        Project.objects.filter(pk__gt=1).order_by("name"),
+        first=2,
+    )
+    assert explanation.uses_index
+    assert explanation.needs_sort
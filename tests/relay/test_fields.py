@@ -1,8 +1,11 @@
 import pytest
 from pytest_django import DjangoAssertNumQueries
+from strawberry import relay
 from strawberry.relay.utils import to_base64
 
-from .schema import FruitModel, schema
+from strawberry_django.relay import resolve_model_nodes
+
+from .schema import Fruit, FruitModel, schema
 
 pytestmark = pytest.mark.usefixtures("_fixtures")
 
@@ -315,6 +318,75 @@ async def test_query_nodes_optional_async():
     }
 
 
+def test_query_nodes_optional_invalid_and_repeated_ids(
+    django_assert_num_queries: DjangoAssertNumQueries,
+):
+    with django_assert_num_queries(1):
+        result = schema.execute_sync(
+            """
+            query TestQuery ($ids: [ID!]!) {
+                nodesOptional (ids: $ids) {
+                    ... on Fruit {
+                        name
+                    }
+                }
+            }
+            """,
+            variable_values={
+                "ids": [
+                    to_base64("Fruit", 2),
+                    to_base64("Fruit", "invalid"),
+                    to_base64("Fruit", 2),
+                    to_base64("Fruit", "04"),
+                ],
+            },
+        )
+    assert result.errors is None
+    assert result.data == {
+        "nodesOptional": [
+            {"name": "Apple"},
+            None,
+            {"name": "Apple"},
+            {"name": "Grape"},
+        ],
+    }
+
+
+def test_query_nodes_missing():
+    result = schema.execute_sync(
+        """
+        query TestQuery ($ids: [ID!]!) {
+            nodes (ids: $ids) {
+                ... on Node {
+                    id
+                }
+            }
+        }
+        """,
+        variable_values={
+            "ids": [to_base64("Fruit", 2), to_base64("Fruit", 999)],
+        },
+    )
+    assert result.data is None
+    assert result.errors is not None
+    assert [e.message for e in result.errors] == [
+        "FruitModel matching query does not exist.",
+    ]
+
+
+async def test_resolve_model_nodes_connection_async(mocker):
+    # A Connection return type makes the queryset be returned unfetched
+    info = mocker.Mock(return_type=relay.ListConnection)
+    nodes = await resolve_model_nodes(
+        Fruit,
+        info=info,
+        node_ids=["4", "2"],
+        filter_perms=False,
+    )
+
+    assert [node.name for node in nodes] == ["Grape", "Apple"]
+
+
 fruits_query = """
 query TestQuery (
     $first: Int = null
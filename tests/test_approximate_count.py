@@ -0,0 +1,171 @@
+import json
+
+import pytest
+import strawberry
+from django.db import connections
+from django.test import override_settings
+
+import strawberry_django
+from strawberry_django import pagination
+from strawberry_django.optimizer import DjangoOptimizerExtension
+from strawberry_django.pagination import OffsetPaginated, get_approximate_total_count
+from strawberry_django.relay import DjangoListConnection
+from tests import models
+
+
+@strawberry_django.type(models.Fruit)
+class Fruit(strawberry.relay.Node):
+    name: str
+
+
+@strawberry.type
+class Query:
+    fruits: OffsetPaginated[Fruit] = strawberry_django.offset_paginated()
+    fruits_approximate: OffsetPaginated[Fruit] = strawberry_django.offset_paginated(
+        approximate_count=True
+    )
+    fruits_exact: OffsetPaginated[Fruit] = strawberry_django.offset_paginated(
+        approximate_count=False
+    )
+    fruits_conn: DjangoListConnection[Fruit] = strawberry_django.connection(
+        approximate_count=True
+    )
+
+
+schema = strawberry.Schema(query=Query)
+
+
+@pytest.fixture
+def estimate(mocker):
+    return mocker.patch(
+        "strawberry_django.pagination.get_approximate_total_count",
+        return_value=123_456,
+    )
+
+
+@pytest.fixture
+def postgres(mocker):
+    cursor = mocker.MagicMock()
+    connection = mocker.MagicMock(vendor="postgresql")
+    connection.ops.quote_name = connections["default"].ops.quote_name
+    connection.cursor.return_value.__enter__.return_value = cursor
+    mocker.patch.object(
+        pagination,
+        "connections",
+        {"default": connection},
+    )
+    return cursor
+
+
+@pytest.mark.django_db(transaction=True)
+def test_approximate_count_field_option(estimate):
+    models.Fruit.objects.create(name="Apple")
+
+    result = schema.execute_sync(
+        "query TestQuery { fruits { totalCount } fruitsApproximate { totalCount } "
+        "fruitsExact { totalCount } fruitsConn { totalCount } }"
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "fruits": {"totalCount": 1},
+        "fruitsApproximate": {"totalCount": 123_456},
+        "fruitsExact": {"totalCount": 1},
+        "fruitsConn": {"totalCount": 123_456},
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_approximate_count_connection_with_optimizer(estimate):
+    models.Fruit.objects.create(name="Apple")
+    optimized_schema = strawberry.Schema(
+        query=Query, extensions=[DjangoOptimizerExtension()]
+    )
+
+    result = optimized_schema.execute_sync(
+        "query TestQuery { fruitsConn { totalCount edges { node { name } } } }"
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "fruitsConn": {
+            "totalCount": 123_456,
+            "edges": [{"node": {"name": "Apple"}}],
+        },
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(STRAWBERRY_DJANGO={"PAGINATION_APPROXIMATE_COUNT": True})
+def test_approximate_count_setting(estimate):
+    models.Fruit.objects.create(name="Apple")
+
+    result = schema.execute_sync(
+        "query TestQuery { fruits { totalCount } fruitsExact { totalCount } }"
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "fruits": {"totalCount": 123_456},
+        "fruitsExact": {"totalCount": 1},
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_approximate_count_async(estimate):
+    await models.Fruit.objects.acreate(name="Apple")
+
+    result = await schema.execute(
+        "query TestQuery { fruits { totalCount } fruitsApproximate { totalCount } }"
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "fruits": {"totalCount": 1},
+        "fruitsApproximate": {"totalCount": 123_456},
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(STRAWBERRY_DJANGO={"PAGINATION_APPROXIMATE_COUNT": True})
+def test_approximate_count_falls_back_to_exact_count():
+    # SQLite has no statistics to estimate from
+    models.Fruit.objects.create(name="Apple")
+
+    assert get_approximate_total_count(models.Fruit.objects.all()) is None
+
+    result = schema.execute_sync("query TestQuery { fruits { totalCount } }")
+    assert result.errors is None
+    assert result.data == {"fruits": {"totalCount": 1}}
+
+
+def test_approximate_count_unfiltered(postgres):
+    postgres.fetchone.return_value = (50_000.0,)
+
+    assert get_approximate_total_count(models.Fruit.objects.all()) == 50_000
+    sql, params = postgres.execute.call_args.args
+    assert "pg_class" in sql
+    assert params == ['"tests_fruit"']
+
+
+def test_approximate_count_filtered(postgres):
+    postgres.fetchone.return_value = (json.dumps([{"Plan": {"Plan Rows": 20_000}}]),)
+
+    qs = models.Fruit.objects.filter(name="Apple")
+    assert get_approximate_total_count(qs) == 20_000
+    sql, _ = postgres.execute.call_args.args
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+
+
+@pytest.mark.parametrize("estimate", [-1.0, 500.0])
+def test_approximate_count_below_threshold(postgres, estimate):
+    postgres.fetchone.return_value = (estimate,)
+
+    assert get_approximate_total_count(models.Fruit.objects.all()) is None
+
+
+@override_settings(STRAWBERRY_DJANGO={"PAGINATION_APPROXIMATE_COUNT_THRESHOLD": 100})
+def test_approximate_count_custom_threshold(postgres):
+    postgres.fetchone.return_value = (500.0,)
+
+    assert get_approximate_total_count(models.Fruit.objects.all()) == 500
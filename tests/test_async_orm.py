@@ -0,0 +1,196 @@
+"""Tests for the `ASYNC_ORM` setting.
+
+When enabled, querysets resolved in an async context are built on the event
+loop and evaluated using Django's async queryset API, so the only thread hops
+left are the ones done by Django itself to talk to the database.
+"""
+
+import pytest
+import strawberry
+from asgiref.sync import SyncToAsync, sync_to_async
+from django.test import override_settings
+from strawberry import relay
+
+import strawberry_django
+from strawberry_django.optimizer import DjangoOptimizerExtension
+from strawberry_django.pagination import OffsetPaginated
+from strawberry_django.relay import DjangoCursorConnection, DjangoListConnection
+from tests.projects.models import Milestone, Project
+
+
+@strawberry_django.type(Milestone)
+class MilestoneType(relay.Node):
+    name: str
+
+
+@strawberry_django.type(Project)
+class ProjectType(relay.Node):
+    name: str
+    milestones: list[MilestoneType]
+
+    @classmethod
+    def get_queryset(cls, qs, info):
+        return qs.order_by("pk")
+
+
+@strawberry.type
+class Query:
+    node: relay.Node = strawberry_django.node()
+    nodes: list[relay.Node] = strawberry_django.node()
+    project: ProjectType = strawberry_django.field()
+    project_optional: ProjectType | None = strawberry_django.field()
+    projects: list[ProjectType] = strawberry_django.field()
+    projects_paginated: OffsetPaginated[ProjectType] = (
+        strawberry_django.offset_paginated()
+    )
+    projects_conn: DjangoListConnection[ProjectType] = strawberry_django.connection()
+    projects_cursor_conn: DjangoCursorConnection[ProjectType] = (
+        strawberry_django.connection()
+    )
+
+
+schema = strawberry.Schema(query=Query, extensions=[DjangoOptimizerExtension])
+
+
+@pytest.fixture
+def thread_hops(monkeypatch):
+    hops: list[str] = []
+    orig_call = SyncToAsync.__call__
+
+    async def counting_call(self, *args, **kwargs):
+        func = self.func
+        hops.append(
+            f"{getattr(func, '__module__', '?')}.{getattr(func, '__qualname__', '?')}"
+        )
+        return await orig_call(self, *args, **kwargs)
+
+    monkeypatch.setattr(SyncToAsync, "__call__", counting_call)
+    return hops
+
+
+@pytest.fixture
+async def projects(transactional_db):
+    def create():
+        projects = [Project.objects.create(name=f"Project {i}") for i in range(3)]
+        for p in projects:
+            Milestone.objects.create(name=f"Milestone {p.pk}", project=p)
+        return projects
+
+    return await sync_to_async(create)()
+
+
+def _assert_no_library_hops(hops: list[str]):
+    assert hops
+    assert not [h for h in hops if h.startswith("strawberry_django")]
+
+
+@pytest.mark.parametrize("optimize", [True, False])
+@override_settings(STRAWBERRY_DJANGO={"ASYNC_ORM": True})
+async def test_async_orm_list(optimize, projects, thread_hops):
+    query = """
+      query TestQuery {
+        projects {
+          name
+          milestones { name }
+        }
+      }
+    """
+    if optimize:
+        result = await schema.execute(query)
+    else:
+        with DjangoOptimizerExtension.disabled():
+            result = await schema.execute(query)
+
+    assert result.errors is None
+    assert result.data == {
+        "projects": [
+            {"name": p.name, "milestones": [{"name": f"Milestone {p.pk}"}]}
+            for p in projects
+        ]
+    }
+    _assert_no_library_hops(thread_hops)
+
+
+@override_settings(STRAWBERRY_DJANGO={"ASYNC_ORM": True})
+async def test_async_orm_single(projects, thread_hops):
+    result = await schema.execute(
+        """
+        query TestQuery ($pk: ID!) {
+          project (pk: $pk) { name }
+          projectOptional (pk: $pk) { name }
+          missing: projectOptional (pk: 0) { name }
+        }
+        """,
+        variable_values={"pk": projects[0].pk},
+    )
+    assert result.errors is None
+    assert result.data == {
+        "project": {"name": projects[0].name},
+        "projectOptional": {"name": projects[0].name},
+        "missing": None,
+    }
+    _assert_no_library_hops(thread_hops)
+
+
+@override_settings(STRAWBERRY_DJANGO={"ASYNC_ORM": True})
+async def test_async_orm_single_does_not_exist(projects):
+    result = await schema.execute(
+        """
+        query TestQuery {
+          project (pk: 0) { name }
+        }
+        """
+    )
+    assert result.errors is not None
+    assert result.errors[0].message == "Project matching query does not exist."
+
+
+@override_settings(STRAWBERRY_DJANGO={"ASYNC_ORM": True})
+async def test_async_orm_paginated_and_connections(projects, thread_hops):
+    result = await schema.execute(
+        """
+        query TestQuery {
+          projectsPaginated (pagination: {limit: 2}) {
+            totalCount
+            results { name }
+          }
+          projectsConn (first: 2) {
+            totalCount
+            edges { node { name } }
+          }
+          projectsCursorConn (first: 2) {
+            totalCount
+            edges { node { name } }
+          }
+        }
+        """
+    )
+    assert result.errors is None
+    names = [{"name": p.name} for p in projects[:2]]
+    edges = [{"node": n} for n in names]
+    assert result.data == {
+        "projectsPaginated": {"totalCount": 3, "results": names},
+        "projectsConn": {"totalCount": 3, "edges": edges},
+        "projectsCursorConn": {"totalCount": 3, "edges": edges},
+    }
+    _assert_no_library_hops(thread_hops)
+
+
+@override_settings(STRAWBERRY_DJANGO={"ASYNC_ORM": True})
+async def test_async_orm_relay_nodes(projects, thread_hops):
+    ids = [str(relay.GlobalID("ProjectType", str(p.pk))) for p in projects[:2]]
+    result = await schema.execute(
+        """
+        query TestQuery ($id: ID!, $ids: [ID!]!) {
+          node (id: $id) { ... on ProjectType { name } }
+          nodes (ids: $ids) { ... on ProjectType { name } }
+        }
+        """,
+        variable_values={"id": ids[0], "ids": ids},
+    )
+    assert result.errors is None
+    assert result.data == {
+        "node": {"name": projects[0].name},
+        "nodes": [{"name": p.name} for p in projects[:2]],
+    }
+    _assert_no_library_hops(thread_hops)
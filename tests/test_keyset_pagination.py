@@ -0,0 +1,213 @@
+import textwrap
+
+import pytest
+import strawberry
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+import strawberry_django
+from strawberry_django.pagination import KeysetPaginated
+from tests import models
+
+
+@strawberry_django.type(models.Fruit)
+class Fruit:
+    id: int
+    name: str
+    sweetness: int
+
+
+@strawberry_django.order_type(models.Fruit)
+class FruitOrder:
+    name: strawberry.auto
+    sweetness: strawberry.auto
+
+
+@strawberry.type
+class Query:
+    fruits: KeysetPaginated[Fruit] = strawberry_django.offset_paginated(
+        order=FruitOrder
+    )
+
+
+schema = strawberry.Schema(query=Query)
+
+query = """\
+query GetFruits ($pagination: KeysetPaginationInput, $order: FruitOrder) {
+  fruits (pagination: $pagination, order: $order) {
+    totalCount
+    nextPageToken
+    results {
+      name
+    }
+  }
+}
+"""
+
+
+@pytest.fixture
+def fruits(db):
+    return [
+        models.Fruit.objects.create(name=name, sweetness=sweetness)
+        for name, sweetness in [
+            ("Apple", 5),
+            ("Banana", 7),
+            ("Cherry", 5),
+            ("Grape", 7),
+            ("Strawberry", 5),
+        ]
+    ]
+
+
+def _fetch_all_pages(variables: dict) -> list[list[str]]:
+    pages = []
+    page_token = None
+    while True:
+        res = schema.execute_sync(
+            query,
+            variable_values={
+                **variables,
+                "pagination": {"limit": 2, "pageToken": page_token},
+            },
+        )
+        assert res.errors is None
+        assert res.data is not None
+        assert res.data["fruits"]["totalCount"] == 5
+        pages.append([r["name"] for r in res.data["fruits"]["results"]])
+
+        page_token = res.data["fruits"]["nextPageToken"]
+        if page_token is None:
+            return pages
+
+
+def test_keyset_pagination_schema():
+    schema_str = str(schema)
+
+    assert (
+        textwrap.dedent(
+            """\
+            input KeysetPaginationInput {
+              offset: Int! = 0
+              limit: Int
+              pageToken: String = null
+            }"""
+        )
+        in schema_str
+    )
+    assert "nextPageToken: String\n" in schema_str
+    assert "fruits(pagination: KeysetPaginationInput, order: FruitOrder)" in schema_str
+
+
+def test_keyset_pagination_query(fruits):
+    assert _fetch_all_pages({}) == [
+        ["Apple", "Banana"],
+        ["Cherry", "Grape"],
+        ["Strawberry"],
+    ]
+
+
+def test_keyset_pagination_query_with_ties(fruits):
+    # The primary key is used as a tie-breaker for fruits with the same sweetness
+    assert _fetch_all_pages({"order": {"sweetness": "DESC"}}) == [
+        ["Banana", "Grape"],
+        ["Apple", "Cherry"],
+        ["Strawberry"],
+    ]
+
+
+def test_keyset_pagination_query_seeks(fruits):
+    res = schema.execute_sync(query, variable_values={"pagination": {"limit": 2}})
+    assert res.data is not None
+    page_token = res.data["fruits"]["nextPageToken"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        res = schema.execute_sync(
+            query,
+            variable_values={"pagination": {"limit": 2, "pageToken": page_token}},
+        )
+    assert res.errors is None
+    assert res.data is not None
+    assert res.data["fruits"]["results"] == [{"name": "Cherry"}, {"name": "Grape"}]
+
+    # The results and the next page token are retrieved from the same query,
+    # which seeks past the previous page instead of using an offset
+    results_queries = [
+        q["sql"] for q in ctx.captured_queries if "COUNT" not in q["sql"]
+    ]
+    assert len(results_queries) == 1
+    assert "OFFSET" not in results_queries[0]
+    assert '"tests_fruit"."id" >' in results_queries[0]
+
+
+def test_keyset_pagination_query_with_offset(fruits):
+    res = schema.execute_sync(query, variable_values={"pagination": {"limit": 1}})
+    assert res.data is not None
+    page_token = res.data["fruits"]["nextPageToken"]
+
+    res = schema.execute_sync(
+        query,
+        variable_values={
+            "pagination": {"limit": 2, "offset": 1, "pageToken": page_token}
+        },
+    )
+    assert res.errors is None
+    assert res.data is not None
+    assert res.data["fruits"]["results"] == [{"name": "Cherry"}, {"name": "Grape"}]
+
+
+@pytest.mark.parametrize("limit", [None, -1])
+def test_keyset_pagination_without_limit(fruits, limit):
+    with override_settings(
+        STRAWBERRY_DJANGO={
+            "PAGINATION_DEFAULT_LIMIT": None,
+            "PAGINATION_MAX_LIMIT": None,
+        },
+    ):
+        res = schema.execute_sync(
+            query,
+            variable_values={"pagination": {"limit": limit}},
+        )
+    assert res.errors is None
+    assert res.data is not None
+    assert len(res.data["fruits"]["results"]) == 5
+    # All the results are in this page, there is no next one
+    assert res.data["fruits"]["nextPageToken"] is None
+
+
+def test_keyset_pagination_invalid_token(fruits):
+    res = schema.execute_sync(
+        query,
+        variable_values={"pagination": {"limit": 2, "pageToken": "invalid"}},
+    )
+    assert res.errors is not None
+    assert res.errors[0].message == "Invalid page token"
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_keyset_pagination_query_async():
+    for name in ["Apple", "Banana", "Cherry"]:
+        await models.Fruit.objects.acreate(name=name, sweetness=5)
+
+    res = await schema.execute(query, variable_values={"pagination": {"limit": 2}})
+    assert res.errors is None
+    assert res.data is not None
+    assert [r["name"] for r in res.data["fruits"]["results"]] == ["Apple", "Banana"]
+
+    res = await schema.execute(
+        query,
+        variable_values={
+            "pagination": {
+                "limit": 2,
+                "pageToken": res.data["fruits"]["nextPageToken"],
+            }
+        },
+    )
+    assert res.errors is None
+    assert res.data == {
+        "fruits": {
+            "totalCount": 3,
+            "nextPageToken": None,
+            "results": [{"name": "Cherry"}],
+        }
+    }
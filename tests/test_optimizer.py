@@ -16,14 +16,22 @@ from django.db.models import (
 from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from pytest_mock import MockerFixture
-from strawberry.relay import GlobalID, to_base64
+from strawberry.relay import GlobalID, Node, to_base64
 from strawberry.types import ExecutionResult, Info, get_object_definition
 
 import strawberry_django
 from strawberry_django.optimizer import (
     DjangoOptimizerExtension,
+    OptimizerConfig,
+    OptimizerStore,
+)
+from tests.projects.schema import (
+    IssueType,
+    MilestoneType,
+    ProjectType,
+    StaffType,
+    UserType,
 )
-from tests.projects.schema import IssueType, MilestoneType, ProjectType, StaffType
 
 from . import utils
 from .projects.faker import (
@@ -3332,3 +3340,140 @@ def test_method_resolver_without_relation_hint_does_not_descend(db):
     sqls = [q["sql"] for q in ctx.captured_queries]
     assert sqls, sqls
     assert "projects_milestone" not in sqls[0], sqls[0]
+
+
+def test_compiled_store_applies_with_a_single_clone(mocker: MockerFixture):
+    store = OptimizerStore.with_hints(
+        only=["name", "milestone__name", "name"],
+        select_related=["milestone", "milestone"],
+        prefetch_related=["tags"],
+    )
+    compiled = store.compile(info=cast("Any", None))
+    assert compiled.only == ("name", "milestone__name")
+    assert compiled.select_related == ("milestone",)
+
+    qs = Issue.objects.all()
+    clone_spy = mocker.spy(QuerySet, "_clone")
+    optimized_qs = compiled.apply(qs)
+    assert clone_spy.call_count == 1
+
+    assert optimized_qs is not qs
+    assert optimized_qs.query.select_related == {"milestone": {}}
+    assert optimized_qs.query.deferred_loading == (
+        frozenset({"name", "milestone__name"}),
+        False,
+    )
+    assert optimized_qs._prefetch_related_lookups == ("tags",)  # type: ignore
+    # The original queryset should not be modified
+    assert qs.query.select_related is False
+    assert qs._prefetch_related_lookups == ()  # type: ignore
+
+
+def test_compiled_store_respects_config():
+    store = OptimizerStore.with_hints(
+        only=["name"],
+        select_related=["milestone"],
+        prefetch_related=["tags"],
+    )
+    compiled = store.compile(
+        info=cast("Any", None),
+        config=OptimizerConfig(
+            enable_only=False,
+            enable_prefetch_related=False,
+        ),
+    )
+
+    optimized_qs = compiled.apply(Issue.objects.all())
+    assert optimized_qs.query.select_related == {"milestone": {}}
+    assert optimized_qs.query.deferred_loading == (frozenset(), True)
+    assert optimized_qs._prefetch_related_lookups == ()  # type: ignore
+
+
+@pytest.mark.django_db(transaction=True)
+def test_query_nodes_of_multiple_types():
+    @strawberry.type
+    class Query:
+        nodes: list[Node | None] = strawberry_django.node()
+
+    schema = strawberry.Schema(
+        query=Query,
+        types=[IssueType, MilestoneType, UserType, StaffType],
+        extensions=[DjangoOptimizerExtension],
+    )
+
+    issue = IssueFactory.create()
+    user = UserFactory.create()
+    staff = StaffUserFactory.create()
+    ids = [
+        GlobalID("IssueType", str(issue.pk)),
+        GlobalID("MilestoneType", str(issue.milestone.pk)),
+        GlobalID("UserType", user.username),
+        GlobalID("StaffType", staff.username),
+        GlobalID("IssueType", "999"),
+        GlobalID("IssueType", str(issue.pk)),
+    ]
+
+    query = """\
+      query TestQuery ($ids: [ID!]!) {
+        nodes (ids: $ids) {
+          id
+          ... on IssueType {
+            name
+            milestone { name }
+          }
+          ... on MilestoneType {
+            project { name }
+          }
+          ... on UserType {
+            fullName
+          }
+          ... on StaffType {
+            email
+          }
+        }
+      }
+    """
+
+    with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as ctx:
+        result = schema.execute_sync(
+            query,
+            variable_values={"ids": [str(gid) for gid in ids]},
+        )
+
+    assert result.errors is None, result.errors
+    issue_data = {
+        "id": str(ids[0]),
+        "name": issue.name,
+        "milestone": {"name": issue.milestone.name},
+    }
+    assert result.data == {
+        "nodes": [
+            issue_data,
+            {
+                "id": str(ids[1]),
+                "project": {"name": issue.milestone.project.name},
+            },
+            {
+                "id": str(ids[2]),
+                "fullName": f"{user.first_name} {user.last_name}".strip(),
+            },
+            {"id": str(ids[3]), "email": staff.email},
+            None,
+            issue_data,
+        ],
+    }
+
+    # One query per type, each one only fetching the fields selected for it,
+    # including the `username` used as the node id
+    assert len(ctx.captured_queries) == 4
+    users_sql = [
+        q["sql"] for q in ctx.captured_queries if 'FROM "auth_user"' in q["sql"]
+    ]
+    assert len(users_sql) == 2
+    assert users_sql[0].startswith(
+        'SELECT "auth_user"."id", "auth_user"."username", "auth_user"."first_name",'
+        ' "auth_user"."last_name" FROM'
+    )
+    assert users_sql[1].startswith(
+        'SELECT "auth_user"."id", "auth_user"."username", "auth_user"."email" FROM'
+    )
@@ -0,0 +1,308 @@
+import functools
+
+import pytest
+import strawberry
+from django.db.models import CharField, Value
+from pytest_mock import MockerFixture
+
+import strawberry_django
+from strawberry_django import optimizer
+from strawberry_django.optimizer import (
+    DjangoOptimizerExtension,
+    OptimizerPlanCache,
+    OptimizerStore,
+)
+
+from .projects.faker import IssueFactory, MilestoneFactory, ProjectFactory
+from .projects.models import Issue, Milestone, Project
+from .utils import assert_num_queries
+
+
+@strawberry_django.filter_type(Milestone, lookups=True)
+class MilestoneFilter:
+    name: strawberry.auto
+
+
+@strawberry_django.filter_type(Project, lookups=True)
+class ProjectFilter:
+    name: strawberry.auto
+
+
+@strawberry_django.type(Issue)
+class IssueType:
+    id: strawberry.auto
+    name: strawberry.auto
+
+
+@strawberry_django.type(Milestone)
+class MilestoneType:
+    id: strawberry.auto
+    name: strawberry.auto
+    issues: list[IssueType]
+
+
+@strawberry_django.type(Project)
+class ProjectType:
+    id: strawberry.auto
+    name: strawberry.auto
+    milestones: list[MilestoneType] = strawberry_django.field(
+        filters=MilestoneFilter,
+    )
+
+
+@strawberry.type
+class Query:
+    project_list: list[ProjectType] = strawberry_django.field()
+    project_search: list[ProjectType] = strawberry_django.field(filters=ProjectFilter)
+
+
+QUERY = """
+  query TestQuery ($name: String) {
+    projectList {
+      id
+      name
+      milestones (filters: {name: {exact: $name}}) {
+        id
+        name
+        issues {
+          id
+          name
+        }
+      }
+    }
+  }
+"""
+
+
+def _create_schema(plan_cache: OptimizerPlanCache, query: type = Query):
+    return strawberry.Schema(
+        query=query,
+        extensions=[
+            functools.partial(DjangoOptimizerExtension, plan_cache=plan_cache),
+        ],
+    )
+
+
+@pytest.fixture
+def projects(db):
+    projects = ProjectFactory.create_batch(2)
+    for p in projects:
+        for m in MilestoneFactory.create_batch(2, project=p):
+            IssueFactory.create_batch(2, milestone=m)
+    return projects
+
+
+@pytest.mark.django_db(transaction=True)
+def test_plan_cache_replays_plan(projects, mocker: MockerFixture):
+    plan_cache = OptimizerPlanCache()
+    schema = _create_schema(plan_cache)
+    get_model_hints = mocker.spy(optimizer, "_get_model_hints")
+
+    with assert_num_queries(3):
+        first = schema.execute_sync(QUERY)
+    assert first.errors is None
+    assert plan_cache.misses == 1
+    assert plan_cache.hits == 0
+    assert len(plan_cache) == 1
+    walk_calls = get_model_hints.call_count
+    assert walk_calls > 0
+
+    for _ in range(2):
+        with assert_num_queries(3):
+            res = schema.execute_sync(QUERY)
+        assert res.errors is None
+        assert res.data == first.data
+
+    assert plan_cache.hits == 2
+    assert get_model_hints.call_count == walk_calls
+
+
+@pytest.mark.django_db(transaction=True)
+def test_plan_cache_varies_on_variables(projects):
+    plan_cache = OptimizerPlanCache()
+    schema = _create_schema(plan_cache)
+    milestone = projects[0].milestones.first()
+
+    res = schema.execute_sync(QUERY)
+    assert res.errors is None
+    res = schema.execute_sync(QUERY, variable_values={"name": milestone.name})
+    assert res.errors is None
+    assert plan_cache.misses == 2
+    assert len(plan_cache) == 2
+
+    assert res.data
+    milestones = [m for p in res.data["projectList"] for m in p["milestones"]]
+    assert [m["name"] for m in milestones] == [milestone.name]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_plan_cache_vary_on(projects):
+    plan_cache = OptimizerPlanCache(vary_on=lambda info: info.context["tenant"])
+    schema = _create_schema(plan_cache)
+
+    for tenant in ["a", "b", "a"]:
+        res = schema.execute_sync(QUERY, context_value={"tenant": tenant})
+        assert res.errors is None
+
+    assert plan_cache.misses == 2
+    assert plan_cache.hits == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_plan_cache_evicts_least_recently_used(projects):
+    plan_cache = OptimizerPlanCache(maxsize=1)
+    schema = _create_schema(plan_cache)
+
+    schema.execute_sync(QUERY)
+    schema.execute_sync("query { projectList { id } }")
+    assert len(plan_cache) == 1
+
+    schema.execute_sync(QUERY)
+    assert plan_cache.hits == 0
+    assert plan_cache.misses == 3
+
+    plan_cache.clear()
+    assert len(plan_cache) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("vary_on", [None, lambda info: info.context["user"]])
+def test_plan_cache_callable_hints(projects, vary_on):
+    field_hint_calls = []
+    store_hint_calls = []
+
+    def get_field_hint(info):
+        field_hint_calls.append(info)
+        return Value(info.context["user"], output_field=CharField())
+
+    def get_store_hint(info):
+        store_hint_calls.append(info)
+        return Value("store", output_field=CharField())
+
+    @strawberry_django.type(Project, name="ProjectWithHints")
+    class ProjectWithHintsType:
+        id: strawberry.auto
+        field_hint: str = strawberry_django.field(annotate=get_field_hint)
+
+    @strawberry.type
+    class HintsQuery:
+        @strawberry_django.field
+        def project_list(self, info: strawberry.Info) -> list[ProjectWithHintsType]:
+            ext = optimizer.optimizer.get()
+            assert ext is not None
+            return ext.optimize(
+                Project.objects.all(),
+                info,
+                store=OptimizerStore.with_hints(
+                    annotate={"store_hint": get_store_hint}
+                ),
+            )
+
+    plan_cache = OptimizerPlanCache(vary_on=vary_on)
+    schema = strawberry.Schema(
+        query=HintsQuery,
+        extensions=[
+            functools.partial(DjangoOptimizerExtension, plan_cache=plan_cache),
+        ],
+    )
+    for user in ["a", "b", "a"]:
+        res = schema.execute_sync(
+            "query { projectList { fieldHint } }",
+            context_value={"user": user},
+        )
+        assert res.errors is None
+        assert res.data
+        assert {p["fieldHint"] for p in res.data["projectList"]} == {user}
+
+    if vary_on is None:
+        # The hint could depend on the request, so the plan is not cached
+        assert len(plan_cache) == 0
+        assert len(field_hint_calls) == 3
+    else:
+        # Hints collected from the selection are resolved once for each key
+        assert len(plan_cache) == 2
+        assert len(field_hint_calls) == 2
+    # Hints given to optimize() are not part of the plan
+    assert len(store_hint_calls) == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_plan_cache_skips_type_get_queryset(projects):
+    @strawberry_django.type(Milestone, name="FilteredMilestone")
+    class FilteredMilestoneType:
+        id: strawberry.auto
+
+        @classmethod
+        def get_queryset(cls, queryset, info, **kwargs):
+            return queryset.filter(name__startswith=info.context["prefix"])
+
+    @strawberry_django.type(Project, name="ProjectWithFilteredMilestones")
+    class ProjectWithFilteredMilestonesType:
+        id: strawberry.auto
+        milestones: list[FilteredMilestoneType]
+
+    @strawberry.type
+    class FilteredQuery:
+        project_list: list[ProjectWithFilteredMilestonesType] = (
+            strawberry_django.field()
+        )
+
+    plan_cache = OptimizerPlanCache()
+    schema = _create_schema(plan_cache, query=FilteredQuery)
+    milestone = projects[0].milestones.first()
+    assert milestone is not None
+
+    for prefix, expected in [(milestone.name, [milestone.pk]), ("-", [])]:
+        res = schema.execute_sync(
+            "query { projectList { milestones { id } } }",
+            context_value={"prefix": prefix},
+        )
+        assert res.errors is None
+        assert res.data
+        assert [
+            int(m["id"]) for p in res.data["projectList"] for m in p["milestones"]
+        ] == expected
+
+    assert len(plan_cache) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_plan_cache_ignores_field_arguments(projects):
+    plan_cache = OptimizerPlanCache()
+    schema = _create_schema(plan_cache)
+    query = """
+      query TestQuery ($name: String, $search: String) {
+        projectSearch (filters: {name: {exact: $search}}) {
+          id
+          milestones (filters: {name: {exact: $name}}) {
+            id
+          }
+        }
+      }
+    """
+
+    # The field's own arguments don't change the plan for its selections
+    for project in projects:
+        res = schema.execute_sync(query, variable_values={"search": project.name})
+        assert res.errors is None
+        assert res.data == {
+            "projectSearch": [
+                {
+                    "id": str(project.pk),
+                    "milestones": [{"id": str(m.pk)} for m in project.milestones.all()],
+                },
+            ],
+        }
+
+    assert plan_cache.misses == 1
+    assert plan_cache.hits == 1
+
+    # But the variables used in its selections do
+    res = schema.execute_sync(query, variable_values={"name": "-"})
+    assert res.errors is None
+    assert plan_cache.misses == 2
+
+
+def test_plan_cache_invalid_maxsize():
+    with pytest.raises(ValueError, match="maxsize must be a positive integer"):
+        OptimizerPlanCache(maxsize=0)
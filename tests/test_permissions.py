@@ -1,11 +1,21 @@
+import asyncio
+import contextlib
 from typing import Literal, TypeAlias
 
 import pytest
-from django.contrib.auth.models import Permission
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser, Permission
+from django.test import RequestFactory, override_settings
+from guardian.backends import ObjectPermissionBackend
 from guardian.shortcuts import assign_perm
+from strawberry.django.context import StrawberryDjangoContext
 from strawberry.relay import to_base64
 
+from strawberry_django import permissions
 from strawberry_django.optimizer import DjangoOptimizerExtension
+from strawberry_django.permissions import HasRetvalPerm
+from strawberry_django.utils import query as query_utils
+from strawberry_django.utils.query import filter_for_user
 
 from .projects.faker import (
     GroupFactory,
@@ -15,6 +25,7 @@ from .projects.faker import (
     SuperuserUserFactory,
     UserFactory,
 )
+from .projects.models import Issue
 from .utils import GraphQLTestClient, assert_num_queries
 
 PermKind: TypeAlias = Literal["user", "group", "superuser"]
@@ -1100,3 +1111,243 @@ def test_query_paginated_with_obj_permissions(db, gql_client: GraphQLTestClient)
                 ],
             }
         }
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("kind", ["user", "group"])
+def test_obj_perm_required_list_checked_in_bulk(db, mocker, kind: PermKind):
+    issues = IssueFactory.create_batch(10)
+    user = UserFactory.create()
+    if kind == "user":
+        target = user
+    else:
+        target = GroupFactory.create()
+        user.groups.add(target)
+
+    for issue in issues[::3]:
+        assign_perm("view_issue", target, issue)
+
+    ext = HasRetvalPerm(perms=["projects.view_issue"])
+    # The user's global permissions and the object permissions of all
+    # issues, both for the user itself and for its groups
+    with assert_num_queries(4):
+        retval = ext._resolve_obj(None, user, issues, info=mocker.Mock())
+
+    assert retval == issues[::3]
+
+
+class AllowAllObjectPermissionBackend(ObjectPermissionBackend):
+    def has_perm(self, user_obj, perm, obj=None):
+        return obj is not None
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    AUTHENTICATION_BACKENDS=[
+        "django.contrib.auth.backends.ModelBackend",
+        "tests.test_permissions.AllowAllObjectPermissionBackend",
+    ],
+)
+def test_obj_perm_required_list_custom_backend_subclass(db, mocker):
+    issues = IssueFactory.create_batch(3)
+    user = UserFactory.create()
+
+    # The subclass could grant permissions which are not in guardian's tables,
+    # so the objects must not be checked in bulk
+    ext = HasRetvalPerm(perms=["projects.view_issue"])
+    retval = ext._resolve_obj(None, user, issues, info=mocker.Mock())
+
+    assert retval == issues
+
+
+@pytest.mark.django_db(transaction=True)
+def test_obj_perm_required_list_custom_checker(db, mocker):
+    issues = IssueFactory.create_batch(3)
+    user = UserFactory.create()
+
+    checked = []
+
+    def obj_perm_checker(info, user):
+        def perm_checker(perm, obj):
+            checked.append(obj)
+            return obj != issues[1]
+
+        return perm_checker
+
+    ext = HasRetvalPerm(
+        perms=["projects.view_issue"],
+        obj_perm_checker=obj_perm_checker,
+    )
+    retval = ext._resolve_obj(None, user, issues, info=mocker.Mock())
+
+    assert retval == [issues[0], issues[2]]
+    assert checked == issues
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("union", [True, False])
+def test_filter_for_user_object_perms(db, union: bool):
+    issue_user_perm, issue_group_perm, _issue_no_perm = IssueFactory.create_batch(3)
+    user = UserFactory.create()
+    group = GroupFactory.create()
+    user.groups.add(group)
+    assign_perm("view_issue", user, issue_user_perm)
+    assign_perm("view_issue", group, issue_group_perm)
+
+    qs = filter_for_user(
+        Issue.objects.all(),
+        user,
+        ["projects.view_issue"],
+        union_object_perms=union,
+    )
+
+    assert set(qs) == {issue_user_perm, issue_group_perm}
+    assert ("UNION" in str(qs.query)) is union
+    # Both the user's and its groups' object permissions subqueries are distinct
+    assert str(qs.query).count("SELECT DISTINCT") == 2
+
+    qs = filter_for_user(
+        Issue.objects.all(),
+        user,
+        ["projects.view_issue"],
+        with_groups=False,
+        union_object_perms=union,
+    )
+    assert set(qs) == {issue_user_perm}
+    assert str(qs.query).count("SELECT DISTINCT") == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_filter_for_user_reuses_perm_querysets(db):
+    issue = IssueFactory.create()
+    user, other_user = UserFactory.create_batch(2)
+    assign_perm("view_issue", other_user, issue)
+
+    query_utils._get_perm_querysets.cache_clear()
+    assert list(filter_for_user(Issue.objects.all(), user, "projects.view_issue")) == []
+    assert list(
+        filter_for_user(Issue.objects.all(), other_user, "projects.view_issue")
+    ) == [issue]
+
+    cache_info = query_utils._get_perm_querysets.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_filter_for_user_shortcuts(db):
+    issues = IssueFactory.create_batch(2)
+    superuser = UserFactory.create(is_superuser=True)
+    user = UserFactory.create()
+    assign_perm("projects.view_issue", user)
+
+    qs = filter_for_user(
+        Issue.objects.all(),
+        superuser,
+        "projects.view_issue",
+        with_superuser=True,
+    )
+    assert set(qs) == set(issues)
+
+    # Once the user's permissions are cached, they are not checked in SQL anymore
+    user.get_all_permissions()
+    qs = filter_for_user(Issue.objects.all(), user, "view_issue")
+    assert set(qs) == set(issues)
+    assert "guardian_" not in str(qs.query)
+
+    qs = filter_for_user(Issue.objects.all(), AnonymousUser(), "projects.view_issue")
+    assert list(qs) == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_filter_for_user_cached_group_perms_without_groups(db):
+    issue = IssueFactory.create()
+    user = UserFactory.create()
+    group = GroupFactory.create()
+    user.groups.add(group)
+    assign_perm("projects.view_issue", group)
+
+    user.get_all_permissions()
+    qs = filter_for_user(Issue.objects.all(), user, "projects.view_issue")
+    assert list(qs) == [issue]
+
+    qs = filter_for_user(
+        Issue.objects.all(),
+        user,
+        "projects.view_issue",
+        with_groups=False,
+    )
+    assert list(qs) == []
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_async_permission_user_resolved_once(mocker):
+    user = await sync_to_async(UserFactory.create)()
+    request = RequestFactory().get("/")
+    request.user = user
+    info = mocker.Mock()
+    info.context = StrawberryDjangoContext(request=request, response=None)
+    get_user = mocker.spy(permissions, "_get_permission_user")
+
+    token = permissions.permission_user_scope.set(permissions.PermissionUserScope())
+    try:
+        resolved = await asyncio.gather(
+            *(permissions._aget_permission_user(info) for _ in range(10)),
+        )
+        assert resolved == [user] * 10
+        assert get_user.call_count == 1
+
+        # Resolved again when the user of the request changes
+        request.user = AnonymousUser()
+        resolved_user = await permissions._aget_permission_user(info)
+        assert resolved_user.is_anonymous
+        assert get_user.call_count == 2
+    finally:
+        permissions.permission_user_scope.reset(token)
+
+    # Without the cache extension's scope, it is memoized in the context
+    resolved = await asyncio.gather(
+        *(permissions._aget_permission_user(info) for _ in range(10)),
+    )
+    assert all(u.is_anonymous for u in resolved)
+    assert get_user.call_count == 3
+
+    dict_info = mocker.Mock()
+    dict_info.context = {"request": request}
+    await permissions._aget_permission_user(dict_info)
+    await permissions._aget_permission_user(dict_info)
+    assert get_user.call_count == 4
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_async_permission_user_failure_not_shared(mocker):
+    request = RequestFactory().get("/")
+    request.user = AnonymousUser()
+    info = mocker.Mock()
+    info.context = StrawberryDjangoContext(request=request, response=None)
+    get_user = mocker.patch.object(
+        permissions,
+        "_get_permission_user",
+        side_effect=[RuntimeError("db down"), AnonymousUser()],
+    )
+
+    # E.g. two operations running over the same websocket connection
+    for expected in [pytest.raises(RuntimeError), contextlib.nullcontext()]:
+        token = permissions.permission_user_scope.set(
+            permissions.PermissionUserScope(),
+        )
+        try:
+            with expected:
+                await permissions._aget_permission_user(info)
+        finally:
+            permissions.permission_user_scope.reset(token)
+
+    assert get_user.call_count == 2
+
+    # Failures are not memoized in the context either
+    get_user.side_effect = [RuntimeError("db down"), AnonymousUser()]
+    with pytest.raises(RuntimeError):
+        await permissions._aget_permission_user(info)
+    assert (await permissions._aget_permission_user(info)).is_anonymous
+    assert (await permissions._aget_permission_user(info)).is_anonymous
+    assert get_user.call_count == 4
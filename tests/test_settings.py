@@ -33,6 +33,10 @@ def test_non_defaults():
             PAGINATION_DEFAULT_LIMIT=250,
             PAGINATION_MAX_LIMIT=1_000,
             ALLOW_MUTATIONS_WITHOUT_FILTERS=True,
+            ASYNC_ORM=True,
+            PAGINATION_APPROXIMATE_COUNT=True,
+            PAGINATION_APPROXIMATE_COUNT_THRESHOLD=500,
+            OBJECT_PERMISSIONS_UNION=False,
         ),
     ):
         assert (
@@ -49,5 +53,9 @@ def test_non_defaults():
                 PAGINATION_DEFAULT_LIMIT=250,
                 PAGINATION_MAX_LIMIT=1_000,
                 ALLOW_MUTATIONS_WITHOUT_FILTERS=True,
+                ASYNC_ORM=True,
+                PAGINATION_APPROXIMATE_COUNT=True,
+                PAGINATION_APPROXIMATE_COUNT_THRESHOLD=500,
+                OBJECT_PERMISSIONS_UNION=False,
             )
         )
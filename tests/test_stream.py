@@ -0,0 +1,168 @@
+import pytest
+import strawberry
+from asgiref.sync import sync_to_async
+from django.db.backends.utils import CursorWrapper
+from django.db.models import QuerySet
+from django.test import override_settings
+
+import strawberry_django
+from strawberry_django.optimizer import DjangoOptimizerExtension
+from strawberry_django.utils.gql_compat import IS_GQL_33
+from tests.projects.models import Milestone, Project
+
+
+@strawberry_django.type(Milestone)
+class MilestoneType:
+    name: str
+
+
+@strawberry_django.type(Project)
+class ProjectType:
+    name: str
+    milestones: list[MilestoneType] = strawberry_django.field(stream=True)
+
+    @classmethod
+    def get_queryset(cls, qs, info):
+        return qs.order_by("pk")
+
+
+@strawberry.type
+class Query:
+    projects: list[ProjectType] = strawberry_django.field(stream=2)
+    projects_not_streamed: list[ProjectType] = strawberry_django.field()
+
+
+schema = strawberry.Schema(query=Query, extensions=[DjangoOptimizerExtension])
+schema_without_optimizer = strawberry.Schema(query=Query)
+
+query = """
+  query TestQuery {
+    projects {
+      name
+      milestones { name }
+    }
+  }
+"""
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    # Patch the cursor class, as queries may be executed in a worker thread
+    executed: list[str] = []
+    orig_execute = CursorWrapper.execute
+
+    def execute(self, sql, params=None):
+        executed.append(sql)
+        return orig_execute(self, sql, params)
+
+    monkeypatch.setattr(CursorWrapper, "execute", execute)
+    return executed
+
+
+def _create_projects():
+    projects = [Project.objects.create(name=f"Project {i}") for i in range(5)]
+    for p in projects:
+        for i in range(2):
+            Milestone.objects.create(name=f"Milestone {p.pk}-{i}", project=p)
+
+    return projects
+
+
+def _expected(projects):
+    return {
+        "projects": [
+            {
+                "name": p.name,
+                "milestones": [{"name": f"Milestone {p.pk}-{i}"} for i in range(2)],
+            }
+            for p in projects
+        ]
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_prefetches_each_chunk(queries):
+    projects = _create_projects()
+    queries.clear()
+
+    result = schema.execute_sync(query)
+
+    assert result.errors is None
+    assert result.data == _expected(projects)
+    # The projects, and their milestones for each of the 3 chunks of 2 projects
+    assert len(queries) == 4
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_without_optimizer():
+    projects = _create_projects()
+
+    result = schema_without_optimizer.execute_sync(query)
+
+    assert result.errors is None
+    assert result.data == _expected(projects)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_does_not_fetch_results(mocker):
+    _create_projects()
+    fetch_all = mocker.spy(QuerySet, "_fetch_all")
+
+    result = schema.execute_sync("query { projects { name } }")
+
+    assert result.errors is None
+    assert len(result.data["projects"]) == 5
+    fetch_all.assert_not_called()
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_stream_async(queries):
+    projects = await sync_to_async(_create_projects)()
+    queries.clear()
+
+    result = await schema.execute(query)
+
+    assert result.errors is None
+    assert result.data == _expected(projects)
+    # graphql-core 3.2 doesn't support async iterables properly, so the
+    # projects get fetched all at once in that case
+    assert len(queries) == (4 if IS_GQL_33 else 2)
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_stream_async_without_optimizer():
+    projects = await sync_to_async(_create_projects)()
+
+    result = await schema_without_optimizer.execute(query)
+
+    assert result.errors is None
+    assert result.data == _expected(projects)
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(STRAWBERRY_DJANGO={"ASYNC_ORM": True})
+async def test_stream_async_orm(queries):
+    projects = await sync_to_async(_create_projects)()
+    queries.clear()
+
+    result = await schema.execute(query)
+
+    assert result.errors is None
+    assert result.data == _expected(projects)
+    # graphql-core 3.2 doesn't support async iterables properly, so the
+    # projects get fetched all at once in that case
+    assert len(queries) == (4 if IS_GQL_33 else 2)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_matches_non_streamed_results():
+    _create_projects()
+
+    result = schema.execute_sync(query)
+    result_not_streamed = schema.execute_sync(
+        query.replace("projects {", "projectsNotStreamed {")
+    )
+
+    assert result.errors is None
+    assert result_not_streamed.errors is None
+    assert result.data["projects"] == result_not_streamed.data["projectsNotStreamed"]
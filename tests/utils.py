@@ -135,6 +135,11 @@ def assert_num_queries(n: int, *, using=DEFAULT_DB_ALIAS):
     )
 
 
+def count_queries(ctx: CaptureQueriesContext, prefix: str) -> int:
+    """Return how many of the captured queries start with `prefix`."""
+    return sum(q["sql"].startswith(prefix) for q in ctx.captured_queries)
+
+
 class GraphQLTestClient(TestClient):
     def __init__(
         self,